@@ -0,0 +1,151 @@
+"""Selección adaptativa de operadores y control adaptativo de parámetros.
+
+Con la mutación 'hibrida_adaptativa' o el cruce 'adaptativo', el operador
+concreto de cada hijo se sortea en el maestro con probabilidades que se
+ajustan durante la corrida: cada operador acumula como recompensa la mejora
+relativa de fitness de sus hijos respecto de su padre, su calidad se
+actualiza con un promedio exponencial y la probabilidad se reparte en
+proporción a la calidad, con un mínimo para que ningún operador deje de
+explorarse.
+
+Con `control_parametros='adaptativo'`, pc y pm se ajustan por generación
+según la diversidad de la población y la tasa de mejora (`ControlParametros`).
+"""
+
+import numpy as np
+
+from .utils import diversity, diversidad_genotipica
+
+
+class SeleccionAdaptativa:
+    """Probability matching sobre una familia de operadores.
+
+    Args:
+        nombres (list): Nombres de los operadores (para el reporte).
+        funciones (list): Funciones de los operadores, en el mismo orden.
+        alpha (float): Tasa de aprendizaje del promedio exponencial de calidad.
+        p_min (float, optional): Probabilidad mínima de cada operador
+            (por defecto 0.2 / cantidad de operadores).
+    """
+
+    def __init__(self, nombres, funciones, alpha=0.3, p_min=None):
+        self.nombres = list(nombres)
+        self.funciones = list(funciones)
+        k = len(self.funciones)
+        self.alpha = alpha
+        self.p_min = 0.2 / k if p_min is None else p_min
+        self.calidad = np.full(k, 1.0 / k)
+        self.probabilidades = np.full(k, 1.0 / k)
+        self.usos = np.zeros(k, dtype=np.int64)
+        self.mejoras = np.zeros(k, dtype=np.int64)
+
+    def sortear(self, n, rng):
+        """Índices de operador para `n` hijos, según las probabilidades vigentes."""
+        return rng.choice(len(self.funciones), size=n, p=self.probabilidades)
+
+    def registrar(self, elegidos, recompensas):
+        """Acredita `recompensas` (mejora relativa >= 0 por hijo) a los operadores `elegidos`.
+
+        Los operadores sin usos en el lote conservan su calidad.
+        """
+        elegidos = np.asarray(elegidos, dtype=np.intp)
+        recompensas = np.asarray(recompensas, dtype=float)
+        if len(elegidos) == 0:
+            return
+        k = len(self.funciones)
+        usos = np.bincount(elegidos, minlength=k)
+        suma = np.bincount(elegidos, weights=recompensas, minlength=k)
+        self.usos += usos
+        self.mejoras += np.bincount(elegidos, weights=recompensas > 0, minlength=k).astype(np.int64)
+
+        usados = usos > 0
+        promedio = suma[usados] / usos[usados]
+        self.calidad[usados] += self.alpha * (promedio - self.calidad[usados])
+        total = self.calidad.sum()
+        if total > 0:
+            self.probabilidades = self.p_min + (1 - k * self.p_min) * self.calidad / total
+        else:
+            self.probabilidades = np.full(k, 1.0 / k)
+
+    def estadisticas(self):
+        """Usos, mejoras y probabilidad final de cada operador."""
+        return {
+            nombre: {"usos": int(self.usos[a]), "mejoras": int(self.mejoras[a]),
+                     "probabilidad": float(self.probabilidades[a])}
+            for a, nombre in enumerate(self.nombres)
+        }
+
+
+def recompensas_relativas(f_padres, f_hijos):
+    """Mejora relativa de cada hijo sobre su padre (0 si no mejora)."""
+    f_padres = np.asarray(f_padres, dtype=float)
+    mejora = f_padres - np.asarray(f_hijos, dtype=float)
+    return np.maximum(0.0, mejora) / np.maximum(np.abs(f_padres), 1e-12)
+
+
+class ControlParametros:
+    """Control adaptativo de pc y pm por generación.
+
+    Tras cada generación mide la diversidad de la población, relativa a la
+    inicial (fracción de individuos distintos según `utils.diversity` por la
+    diversidad genotípica), y la tasa de mejora del mejor fitness (promedio
+    exponencial de la mejora relativa). pm mantiene la diversidad dentro de
+    una banda: sube si la población converge y baja si está dispersa. pc sube
+    mientras el mejor mejora y baja cuando la búsqueda se estanca. Los cambios
+    son multiplicativos y acotados.
+
+    Args:
+        pc (float): Probabilidad de cruce inicial.
+        pm (float): Probabilidad de mutación inicial.
+        rango_pc (tuple): Límites (mín, máx) de pc.
+        rango_pm (tuple): Límites (mín, máx) de pm.
+        banda_diversidad (tuple): Diversidad relativa (mín, máx) que se busca mantener.
+        umbral_mejora (float): Tasa de mejora bajo la cual hay estancamiento.
+        paso (float): Variación relativa por generación.
+    """
+
+    def __init__(self, pc, pm, rango_pc=(0.5, 0.95), rango_pm=(0.05, 0.6), banda_diversidad=(0.3, 0.5),
+                 umbral_mejora=1e-3, paso=0.1):
+        self.rango_pc = rango_pc
+        self.rango_pm = rango_pm
+        self.pc = float(np.clip(pc, *rango_pc))
+        self.pm = float(np.clip(pm, *rango_pm))
+        self.banda_diversidad = banda_diversidad
+        self.umbral_mejora = umbral_mejora
+        self.paso = paso
+        self.diversidad_inicial = None
+        self.mejor_previo = None
+        self.tasa_mejora = None
+        # Cronograma: una entrada por generación con los valores para la siguiente
+        self.historial = []
+
+    def actualizar(self, gen, pop, mejor_f):
+        """Ajusta pc y pm con el estado de la población tras la generación `gen`.
+
+        La primera llamada (población inicial) solo fija las referencias.
+
+        Returns:
+            tuple: (pc, pm) para la generación siguiente.
+        """
+        diversidad = diversity(pop) / len(pop) * diversidad_genotipica(pop)
+        if self.diversidad_inicial is None:
+            self.diversidad_inicial = max(diversidad, 1e-12)
+            self.mejor_previo = mejor_f
+            return self.pc, self.pm
+
+        mejora = max(0.0, self.mejor_previo - mejor_f) / max(abs(self.mejor_previo), 1e-12)
+        self.mejor_previo = mejor_f
+        self.tasa_mejora = mejora if self.tasa_mejora is None else 0.5 * (self.tasa_mejora + mejora)
+        relativa = diversidad / self.diversidad_inicial
+
+        minima, maxima = self.banda_diversidad
+        if relativa < minima:
+            self.pm *= 1 + self.paso
+        elif relativa > maxima:
+            self.pm *= 1 - self.paso
+        self.pc *= 1 - self.paso if self.tasa_mejora < self.umbral_mejora else 1 + self.paso
+        self.pc = float(np.clip(self.pc, *self.rango_pc))
+        self.pm = float(np.clip(self.pm, *self.rango_pm))
+        self.historial.append({"generacion": int(gen), "pc": self.pc, "pm": self.pm,
+                               "diversidad": float(relativa), "tasa_mejora": float(self.tasa_mejora)})
+        return self.pc, self.pm
@@ -42,6 +42,30 @@ class ConfigGA(BaseModel):
     pm: float = Field(0.15, ge=0, le=1)
     elitismo: bool = True
     seed: Optional[int] = None
+    tamano_cache_fitness: int = Field(10_000, ge=0, description="Entradas máximas de la caché LRU de fitness (0 la deshabilita).")
+    num_workers: int = Field(1, ge=1, description="Procesos que generan y reparan hijos en paralelo dentro del trabajo (1 = serial).")
+    num_islas: int = Field(1, ge=1, description="Subpoblaciones en procesos separados (1 = GA clásico). pop_size es por isla.")
+    intervalo_migracion: int = Field(10, gt=0, description="Generaciones entre migraciones en el anillo de islas.")
+    num_migrantes: int = Field(2, ge=0, description="Mejores individuos que cada isla envía a la siguiente.")
+    max_generaciones_sin_mejora: Optional[int] = Field(None, gt=0, description="Detiene la corrida tras N generaciones sin mejora (None = sin límite).")
+    fitness_objetivo: Optional[float] = Field(None, description="Detiene la corrida al alcanzar este fitness o uno menor.")
+    tolerancia_mejora: float = Field(0.0, ge=0, description="Mejora relativa mínima del mejor fitness para considerarla mejora.")
+    tiempo_maximo_seg: Optional[float] = Field(None, gt=0, description="Presupuesto de tiempo de reloj; al agotarse se devuelve la mejor solución hasta el momento.")
+    inicializacion: Literal["aleatoria", "constructiva"] = Field(
+        "aleatoria", description="Población inicial: aleatoria uniforme o constructiva (voraz sobre la demanda)."
+    )
+    intervalo_busqueda_local: Optional[int] = Field(None, gt=0, description="Cada cuántas generaciones se aplica la búsqueda local a los mejores (None = sin paso memético).")
+    elites_busqueda_local: int = Field(2, ge=1, description="Mejores individuos a los que se aplica la búsqueda local.")
+    evaluaciones_busqueda_local: int = Field(200, gt=0, description="Movimientos evaluados por individuo en cada búsqueda local.")
+    rechazar_duplicados: bool = Field(True, description="Vuelve a mutar (o reemplaza por inmigrantes) los hijos repetidos de cada generación.")
+    generaciones_reinicio: Optional[int] = Field(None, gt=0, description="Reinicia la población tras N generaciones sin mejora (None = sin reinicios).")
+    diversos_reinicio: int = Field(2, ge=0, description="Individuos más diversos que sobreviven a un reinicio, además del mejor.")
+    modo_reinicio: Literal["mutacion", "inicializacion"] = Field(
+        "mutacion", description="Cómo se regenera el resto: mutación cataclísmica del mejor o el inicializador configurado."
+    )
+    control_parametros: Literal["fijo", "adaptativo"] = Field(
+        "fijo", description="pc/pm fijos o ajustados por generación según diversidad y tasa de mejora."
+    )
 
 class DatosProfesional(BaseModel):
     id_db: int = Field(..., description="ID del profesional en la base de datos.")
@@ -86,15 +110,29 @@ class DatosProblema(BaseModel):
     tolerancia_equidad_dificil: int = 4
 
 class EstrategiasConfig(BaseModel):
-    sel: Literal["torneo_deterministico", "ranking_lineal"] = Field(
+    sel: Literal["torneo_deterministico", "ranking_lineal", "torneo_vectorizado", "ranking_vectorizado"] = Field(
         default="torneo_deterministico"
     )
-    cross: Literal["bloques_verticales", "bloques_horizontales", "dos_puntos"] = Field(
+    cross: Literal["bloques_verticales", "bloques_horizontales", "dos_puntos", "horizontal_cobertura", "adaptativo",
+                   "bloques_verticales_vectorizado", "bloques_horizontales_vectorizado"] = Field(
         default="bloques_verticales"
     )
     mut: Literal["hibrida_adaptativa", "reasignar_turno", "intercambio_dia", "flip_simple"] = Field(
         default="hibrida_adaptativa"
     )
+    reemplazo: Literal["generacional", "estacionario_peor", "estacionario_torneo"] = Field(
+        default="generacional"
+    )
+    islas: Optional[List["EstrategiasConfig"]] = Field(
+        default=None, description="Operadores de cada isla (modelo de islas). Si se omite, se rotan cruce y mutación."
+    )
+
+class SolucionSemilla(BaseModel):
+    matriz: List[List[int]] = Field(..., description="Filas x días con IDs de turno de la BD (0 = libre), como 'matriz_solucion'.")
+    ids_profesionales: Optional[List[int]] = Field(
+        None, description="id_db de cada fila; si se omite, las filas se alinean por posición con lista_profesionales."
+    )
+    desfase_dias: int = Field(0, ge=0, description="Día de la semilla que corresponde al día 0 (alineación por día de la semana).")
 
 # --- MODELOS DE ENTRADA ---
 
@@ -104,6 +142,9 @@ class SolicitudPlanificacion(BaseModel):
     config: ConfigGA
     datos_problema: DatosProblema
     estrategias: EstrategiasConfig = Field(default_factory=EstrategiasConfig)
+    soluciones_semilla: Optional[List[SolucionSemilla]] = Field(
+        None, description="Soluciones previas (mes anterior o trabajo previo) para arrancar en caliente."
+    )
 
     # --- AGREGAR ESTO AL FINAL DE LA CLASE ---
     model_config = {
@@ -173,7 +214,8 @@ async def obtener_opciones_disponibles():
     return {
         "seleccion": list(SELECTION_OPS.keys()),
         "cruce": list(CROSSOVER_OPS.keys()),
-        "mutacion": list(MUTATION_OPS.keys())
+        "mutacion": list(MUTATION_OPS.keys()),
+        "reemplazo": ["generacional", "estacionario_peor", "estacionario_torneo"]
     }
 
 @app.post("/planificar", response_model=RespuestaCreacion, tags=["Planificación"])
@@ -190,7 +232,8 @@ async def iniciar_planificacion(solicitud: SolicitudPlanificacion, background_ta
         job_id, 
         solicitud.config.model_dump(), 
         solicitud.datos_problema.model_dump(), 
-        solicitud.estrategias.model_dump() 
+        solicitud.estrategias.model_dump(),
+        [s.model_dump() for s in solicitud.soluciones_semilla or []]
     )
     
     return {
@@ -215,7 +258,8 @@ async def consultar_estado(job_id: str):
             respuesta["progreso"] = {
                 "porcentaje": f"{info_vivo.get('porcentaje')}%",
                 "generacion": f"{info_vivo.get('gen_actual')}/{info_vivo.get('gen_total', '?')}",
-                "mejor_fitness": info_vivo.get('mejor_fitness_actual')
+                "mejor_fitness": info_vivo.get('mejor_fitness_actual'),
+                "diversidad": info_vivo.get('diversidad')
             }
         else:
             respuesta["progreso"] = "Iniciando..."
@@ -0,0 +1,177 @@
+"""Búsqueda local (paso memético) sobre los mejores individuos.
+
+Cada cierta cantidad de generaciones el motor aplica a los k mejores
+individuos un hill-climbing de primera mejora acotado. Los movimientos son
+los de los operadores de mutación (reasignar un turno a otro profesional del
+mismo skill, intercambiar turnos en el mismo día y cambiar el valor de una
+celda), restringidos a los que conservan las restricciones duras, y cada uno
+se puntúa con la evaluación incremental sobre los agregados del individuo:
+solo se aceptan los que mejoran el fitness.
+"""
+
+import random
+
+import numpy as np
+
+from .evaluacion_incremental import AgregadosPoblacion
+
+# Mejora mínima del fitness para aceptar un movimiento (evita ciclos por redondeo).
+EPSILON_MEJORA = 1e-9
+
+
+class BusquedaLocal:
+    """Hill-climbing de primera mejora con evaluación delta.
+
+    Args:
+        problema (ProblemaGAPropio): Instancia del problema.
+        max_evaluaciones (int): Movimientos propuestos por individuo.
+    """
+
+    def __init__(self, problema, max_evaluaciones=200):
+        inst = problema.instancia
+        self.problema = problema
+        self.max_evaluaciones = max_evaluaciones
+        # Posición 0: individuo vigente; posición 1: movimiento a prueba.
+        self.agregados = AgregadosPoblacion(problema, 2)
+
+        # Las tablas se consultan celda a celda: en listas de Python es más rápido
+        self.skill = inst.skill_prof.tolist()
+        self.disponible = inst.disponible.tolist()
+        self.dominio = inst.dominio.tolist()
+        self.prohibida = inst.prohibida.tolist()
+        self.requerimientos = inst.requerimientos.tolist()
+        self.t_min = inst.t_min.tolist()
+        self.t_max = inst.t_max.tolist()
+        self.turnos = [int(t) for t in inst.turnos]
+        self.grupos = [np.flatnonzero(inst.skill_prof == k).tolist() for k in range(inst.num_skills)]
+
+    def mejorar(self, pop, i, agregados, fitness):
+        """Aplica la búsqueda local en sitio sobre el individuo `pop[i]`.
+
+        Args:
+            pop (np.ndarray): Población (pop, P, D); se modifica solo `pop[i]`.
+            i (int): Posición del individuo.
+            agregados (AgregadosPoblacion): Agregados de la población; los del
+                individuo `i` se actualizan si hay mejoras.
+            fitness (float): Fitness actual del individuo.
+
+        Returns:
+            tuple: (fitness final, cantidad de movimientos aceptados).
+        """
+        if not agregados.validos[i]:
+            agregados.calcular(pop, np.array([i]))
+        matriz = pop[i]
+        trabajo = self.agregados
+        trabajo.copiar(agregados, i, 0)
+
+        filas = matriz.tolist()
+        trabajos = [sum(1 for v in fila if v) for fila in filas]
+        conteos = trabajo.conteos[0]
+        aceptados = 0
+
+        for _ in range(self.max_evaluaciones):
+            movimientos = [self._reasignar, self._intercambiar]
+            if trabajo.deficit[0] > 0:
+                movimientos.append(self._cambiar_celda)
+            movimiento = random.choice(movimientos)(filas, trabajos, conteos)
+            if movimiento is None:
+                continue
+            ps, ds, nuevos = movimiento
+            viejos = [filas[p][d] for p, d in zip(ps, ds)]
+
+            trabajo.copiar(trabajo, 0, 1)
+            trabajo.aplicar_delta(1, np.array(ps), np.array(ds), np.array(viejos), np.array(nuevos))
+            f_nuevo = float(trabajo.fitness()[1])
+            if f_nuevo >= fitness - EPSILON_MEJORA:
+                continue
+
+            trabajo.copiar(trabajo, 1, 0)
+            fitness = f_nuevo
+            aceptados += 1
+            for p, d, viejo, nuevo in zip(ps, ds, viejos, nuevos):
+                filas[p][d] = nuevo
+                matriz[p, d] = nuevo
+                trabajos[p] += (nuevo != 0) - (viejo != 0)
+
+        if aceptados:
+            agregados.copiar(trabajo, 0, i)
+        return fitness, aceptados
+
+    # ----------------------------------------
+    #   Movimientos (conservan factibilidad)
+    # ----------------------------------------
+    # Cada uno devuelve (ps, ds, nuevos) o None si no encontró un movimiento válido.
+
+    def _secuencia_valida(self, fila, d, turno):
+        prev = fila[d - 1] if d > 0 else 0
+        nxt = fila[d + 1] if d + 1 < len(fila) else 0
+        return not (self.prohibida[prev][turno] or self.prohibida[turno][nxt])
+
+    def _dia_trabajado(self, filas, trabajos):
+        """Elige al azar un profesional con turnos y uno de sus días trabajados."""
+        p = random.randrange(len(filas))
+        if not trabajos[p] or self.skill[p] < 0:
+            return None
+        fila = filas[p]
+        return p, random.choice([d for d, v in enumerate(fila) if v])
+
+    def _reasignar(self, filas, trabajos, conteos):
+        """Mueve el turno de un profesional a otro del mismo skill, libre ese día."""
+        elegido = self._dia_trabajado(filas, trabajos)
+        if elegido is None:
+            return None
+        p1, d = elegido
+        turno = filas[p1][d]
+        if trabajos[p1] <= self.t_min[p1]:
+            return None
+        candidatos = [p2 for p2 in self.grupos[self.skill[p1]]
+                      if not filas[p2][d] and self.dominio[p2][d][turno] and trabajos[p2] < self.t_max[p2]
+                      and self._secuencia_valida(filas[p2], d, turno)]
+        if not candidatos:
+            return None
+        return (p1, random.choice(candidatos)), (d, d), (0, turno)
+
+    def _intercambiar(self, filas, trabajos, conteos):
+        """Intercambia turnos distintos entre dos profesionales del mismo skill en el mismo día."""
+        elegido = self._dia_trabajado(filas, trabajos)
+        if elegido is None:
+            return None
+        p1, d = elegido
+        t1 = filas[p1][d]
+        candidatos = [p2 for p2 in self.grupos[self.skill[p1]]
+                      if filas[p2][d] and filas[p2][d] != t1
+                      and self.dominio[p2][d][t1] and self.dominio[p1][d][filas[p2][d]]
+                      and self._secuencia_valida(filas[p2], d, t1)
+                      and self._secuencia_valida(filas[p1], d, filas[p2][d])]
+        if not candidatos:
+            return None
+        p2 = random.choice(candidatos)
+        return (p1, p2), (d, d), (filas[p2][d], t1)
+
+    def _cambiar_celda(self, filas, trabajos, conteos):
+        """Cambia el valor de una celda sin dejar excesos ni quitar cobertura requerida.
+
+        Solo tiene efecto en individuos con déficit (p. ej. cubre un hueco con
+        un profesional libre), por lo que solo se propone en ese caso.
+        """
+        p = random.randrange(len(filas))
+        d = random.randrange(len(filas[p]))
+        k = self.skill[p]
+        if k < 0 or not self.disponible[p][d]:
+            return None
+        fila = filas[p]
+        viejo = fila[d]
+        requerido = self.requerimientos[d]
+        if viejo and conteos[d, viejo, k] <= requerido[viejo][k]:
+            return None
+        opciones = [t for t in self.turnos
+                    if t != viejo and self.dominio[p][d][t] and conteos[d, t, k] < requerido[t][k]
+                    and self._secuencia_valida(fila, d, t)]
+        if not viejo:
+            if trabajos[p] >= self.t_max[p]:
+                return None
+        elif trabajos[p] > self.t_min[p]:
+            opciones.append(0)
+        if not opciones:
+            return None
+        return (p,), (d,), (random.choice(opciones),)
@@ -0,0 +1,70 @@
+"""Caché de fitness por trabajo con desalojo LRU.
+
+Los individuos se identifican por un hash rápido de los bytes del cromosoma
+reparado (el mismo criterio de identidad que usa `utils.diversity`), de modo
+que los clones producidos por elitismo, copias sin cruce o mutaciones nulas
+no vuelven a evaluarse. Todo individuo evaluado consulta la caché, también
+los que se puntúan por delta sobre su padre, por lo que aciertos y fallos
+cuentan la reutilización de cromosomas con o sin evaluación incremental.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+
+class CacheFitness:
+    """Diccionario acotado clave -> fitness con política LRU y contadores.
+
+    Args:
+        tamano_maximo (int): Cantidad máxima de entradas. Con 0 la caché queda
+            deshabilitada (todas las consultas son fallos y nada se guarda).
+    """
+
+    def __init__(self, tamano_maximo=10_000):
+        self.tamano_maximo = max(0, int(tamano_maximo or 0))
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    @staticmethod
+    def clave(matriz):
+        """Hash de 128 bits de los bytes del cromosoma (incluye forma y tipo implícitos)."""
+        return hashlib.blake2b(matriz.tobytes(), digest_size=16).digest()
+
+    def obtener(self, clave):
+        """Devuelve el fitness guardado o None, actualizando recencia y contadores."""
+        valor = self._entradas.get(clave)
+        if valor is None:
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return valor
+
+    def registrar_acierto(self):
+        """Cuenta como acierto un clon resuelto fuera de la caché (misma generación)."""
+        self.aciertos += 1
+
+    def guardar(self, clave, valor):
+        if self.tamano_maximo == 0:
+            return
+        self._entradas[clave] = valor
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.tamano_maximo:
+            self._entradas.popitem(last=False)
+            self.desalojos += 1
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": round(self.aciertos / consultas, 4) if consultas else 0.0,
+            "entradas": len(self._entradas),
+            "tamano_maximo": self.tamano_maximo,
+            "desalojos": self.desalojos,
+        }
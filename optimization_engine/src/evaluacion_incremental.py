@@ -0,0 +1,144 @@
+"""Evaluación incremental (delta) del fitness.
+
+Cada individuo de la población lleva asociados los agregados a partir de los
+cuales se calcula su fitness: horas por profesional, horas en turnos
+difíciles, conteos de cobertura por (día, turno, skill), déficit total y las
+cuentas de PDL y PTE. Cuando un hijo difiere de su padre en pocas celdas
+(mutaciones y reparaciones locales), sus agregados se obtienen actualizando
+los del padre solo en esas celdas, en O(P + D) en lugar de recorrer P x D.
+"""
+
+import numpy as np
+
+# Si un hijo cambia más que esta fracción de celdas respecto de su padre, se
+# recalcula completo (típicamente tras un cruce).
+FRACCION_MAX_DELTA = 0.10
+
+
+class AgregadosPoblacion:
+    """Agregados de fitness de una población completa, en arreglos (pop, ...).
+
+    Args:
+        problema (ProblemaGAPropio): Instancia del problema (tablas compiladas y pesos).
+        n (int): Tamaño de la población.
+    """
+
+    def __init__(self, problema, n):
+        inst = problema.instancia
+        self.problema = problema
+        self.horas = np.zeros((n, inst.num_profesionales))
+        self.horas_dificiles = np.zeros((n, inst.num_profesionales))
+        self.conteos = np.zeros((n, inst.num_dias, inst.valor_max + 1, inst.num_skills), dtype=np.int32)
+        self.deficit = np.zeros(n, dtype=np.int64)
+        self.pdl = np.zeros(n)
+        self.pte = np.zeros(n)
+        # Un individuo evaluado desde la caché no tiene agregados hasta que se recalcula.
+        self.validos = np.zeros(n, dtype=bool)
+
+    def calcular(self, pop, indices):
+        """Recalcula por completo (vectorizado) los agregados de `pop[indices]`."""
+        if len(indices) == 0:
+            return
+        problema = self.problema
+        inst = problema.instancia
+        sub = inst.acotar(pop[indices])
+        conteos = inst.contar_cobertura_lote(sub)
+        self.conteos[indices] = conteos
+        self.deficit[indices] = inst.deficit_lote(conteos)
+        self.horas[indices] = inst.horas_lote(sub)
+        self.horas_dificiles[indices] = inst.horas_lote(sub, dificiles=True)
+        self.pdl[indices] = problema._calcular_pen_pdl_lote(sub)
+        self.pte[indices] = problema._calcular_pen_pte_lote(sub)
+        self.validos[indices] = True
+
+    def copiar(self, origen, i_origen, i_destino):
+        """Copia los agregados del individuo `i_origen` de `origen` a la posición `i_destino`."""
+        self.horas[i_destino] = origen.horas[i_origen]
+        self.horas_dificiles[i_destino] = origen.horas_dificiles[i_origen]
+        self.conteos[i_destino] = origen.conteos[i_origen]
+        self.deficit[i_destino] = origen.deficit[i_origen]
+        self.pdl[i_destino] = origen.pdl[i_origen]
+        self.pte[i_destino] = origen.pte[i_origen]
+        self.validos[i_destino] = origen.validos[i_origen]
+
+    def aplicar_delta(self, i, ps, ds, viejos, nuevos):
+        """Actualiza los agregados del individuo `i` por el cambio de las celdas (ps, ds).
+
+        Args:
+            i (int): Posición del individuo.
+            ps, ds (np.ndarray): Coordenadas (profesional, día) de las celdas cambiadas.
+            viejos, nuevos (np.ndarray): Valores de gen antes y después del cambio.
+        """
+        if len(ps) == 0:
+            return
+        problema = self.problema
+        inst = problema.instancia
+        viejos = viejos.astype(np.intp)
+        nuevos = nuevos.astype(np.intp)
+
+        # Cobertura: solo cambian los grupos (día, turno, skill) tocados
+        skill = inst.skill_prof[ps]
+        quita = (viejos > 0) & (skill >= 0)
+        pone = (nuevos > 0) & (skill >= 0)
+        conteos = self.conteos[i]
+        grupos_d = np.concatenate([ds[quita], ds[pone]])
+        grupos_t = np.concatenate([viejos[quita], nuevos[pone]])
+        grupos_k = np.concatenate([skill[quita], skill[pone]])
+        if len(grupos_d):
+            plano = np.unique((grupos_d * conteos.shape[1] + grupos_t) * conteos.shape[2] + grupos_k)
+            g_d, resto = np.divmod(plano, conteos.shape[1] * conteos.shape[2])
+            g_t, g_k = np.divmod(resto, conteos.shape[2])
+            requerido = inst.requerimientos[g_d, g_t, g_k]
+            antes = np.maximum(0, requerido - conteos[g_d, g_t, g_k]).sum()
+            np.subtract.at(conteos, (ds[quita], viejos[quita], skill[quita]), 1)
+            np.add.at(conteos, (ds[pone], nuevos[pone], skill[pone]), 1)
+            despues = np.maximum(0, requerido - conteos[g_d, g_t, g_k]).sum()
+            self.deficit[i] += int(despues - antes)
+
+        # Horas (generales y difíciles)
+        dur_viejo = inst.duracion[viejos]
+        dur_nuevo = inst.duracion[nuevos]
+        np.add.at(self.horas[i], ps, dur_nuevo - dur_viejo)
+        dificil_viejo = inst.es_noche[viejos] | inst.no_habil[ds]
+        dificil_nuevo = inst.es_noche[nuevos] | inst.no_habil[ds]
+        np.add.at(self.horas_dificiles[i], ps,
+                  np.where(dificil_nuevo, dur_nuevo, 0.0) - np.where(dificil_viejo, dur_viejo, 0.0))
+
+        # Preferencias (PDL y PTE)
+        pref = inst.preferencias[ps, ds]
+        libre = pref == -1
+        self.pdl[i] += float((libre & (nuevos != 0)).sum() - (libre & (viejos != 0)).sum())
+        self.pte[i] += float(_costo_pte(pref, nuevos, problema).sum() - _costo_pte(pref, viejos, problema).sum())
+
+    def fitness(self):
+        """Fitness de toda la población a partir de los agregados (vectorizado)."""
+        problema = self.problema
+        pesos = problema.pesos_fitness
+        pen_eq = problema._calcular_score_equidad_lote(self.horas, problema.tolerancia_equidad_general)
+        pen_dif = problema._calcular_score_equidad_lote(self.horas_dificiles, problema.tolerancia_equidad_dificil)
+        return (self.deficit * float(problema.PENALIZACION_DURA) +
+                (pesos['eq'] * pen_eq) +
+                (pesos['dif'] * pen_dif) +
+                (pesos['pdl'] * self.pdl) +
+                (pesos['pte'] * self.pte))
+
+
+def _costo_pte(pref, valores, problema):
+    """Costo PTE celda a celda (misma regla que `_calcular_pen_pte`)."""
+    alpha = problema.pesos_fitness.get('alpha_pte', 0.5)
+    pide_turno = pref > 0
+    return np.where(pide_turno & (valores == 0), alpha,
+                    np.where(pide_turno & (valores != pref), 1.0, 0.0))
+
+
+def celdas_modificadas(hijo, padre):
+    """Coordenadas y valores de las celdas en que `hijo` difiere de `padre`.
+
+    Es el delta que producen mutación + reparación sobre un hijo copiado de
+    su padre; se obtiene con una única comparación vectorizada.
+
+    Returns:
+        tuple: (ps, ds, viejos, nuevos).
+    """
+    ps, ds = np.nonzero(hijo != padre)
+    return ps, ds, padre[ps, ds], hijo[ps, ds]
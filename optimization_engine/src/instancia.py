@@ -0,0 +1,233 @@
+"""Representación compilada (densa) de una instancia del NRP.
+
+Convierte la salida del loader (listas de diccionarios, claves int/str,
+conjuntos) en arreglos NumPy contiguos indexados por el valor del gen.
+La posición 0 de cada eje de turnos corresponde a "libre", de modo que un
+cromosoma puede usarse directamente como índice sobre estas tablas.
+"""
+
+import numpy as np
+
+
+class InstanciaCompilada:
+    """Tablas densas de solo lectura que consumen penalizaciones y reparación.
+
+    Atributos principales:
+        requerimientos (np.ndarray): R[día, turno, skill] con la demanda mínima.
+        duracion (np.ndarray): Horas de cada valor de gen (0 para libre).
+        es_noche (np.ndarray): Máscara booleana de turnos nocturnos.
+        no_habil (np.ndarray): Máscara booleana de días no hábiles (finde/feriado).
+        skill_prof (np.ndarray): Índice de skill por profesional (-1 si no se cubre).
+        prohibida (np.ndarray): prohibida[t_prev, t_sig] para transiciones vedadas.
+        disponible (np.ndarray): Disponibilidad (P, D).
+        preferencias (np.ndarray): Preferencias (P, D): -1 libre, >0 turno pedido.
+        t_min, t_max (np.ndarray): Límites contractuales por profesional.
+        turnos (np.ndarray): Valores de gen que representan turnos a cubrir.
+        dominio (np.ndarray): A[p, d, valor] indica si el gen `valor` es legal
+            para el profesional `p` el día `d`: libre siempre; un turno si está
+            disponible ese día y ese turno y el turno requiere su skill.
+    """
+
+    def __init__(self, num_profesionales, num_dias, valor_max, skills,
+                 requerimientos, duracion, es_noche, no_habil, skill_prof,
+                 prohibida, disponible, preferencias, t_min, t_max, turnos, dominio):
+        self.num_profesionales = num_profesionales
+        self.num_dias = num_dias
+        self.valor_max = valor_max
+        self.skills = skills
+        self.requerimientos = requerimientos
+        self.duracion = duracion
+        self.es_noche = es_noche
+        self.no_habil = no_habil
+        self.skill_prof = skill_prof
+        self.prohibida = prohibida
+        self.disponible = disponible
+        self.preferencias = preferencias
+        self.t_min = t_min
+        self.t_max = t_max
+        self.turnos = turnos
+        self.dominio = dominio
+
+        self.es_turno = np.zeros(valor_max + 1, dtype=bool)
+        self.es_turno[turnos] = True
+
+    @property
+    def num_skills(self):
+        return len(self.skills)
+
+    def acotar(self, matriz):
+        """Lleva a 0 los genes fuera del rango de las tablas (turnos desconocidos)."""
+        return np.where((matriz >= 0) & (matriz <= self.valor_max), matriz, 0)
+
+    def contar_cobertura(self, matriz):
+        """Cuenta asignaciones por (día, turno, skill) de una matriz (P, D).
+
+        Returns:
+            np.ndarray: Conteos enteros de forma (D, T+1, K).
+        """
+        return self.contar_cobertura_lote(matriz[None])[0]
+
+    def contar_cobertura_lote(self, pop):
+        """Cuenta asignaciones por (individuo, día, turno, skill) de un tensor (pop, P, D).
+
+        Returns:
+            np.ndarray: Conteos enteros de forma (pop, D, T+1, K).
+        """
+        n = pop.shape[0]
+        D, V, K = self.num_dias, self.valor_max + 1, self.num_skills
+        valores = self.acotar(pop).astype(np.intp)
+        skill = np.broadcast_to(self.skill_prof[None, :, None], valores.shape)
+        dias = np.broadcast_to(np.arange(D)[None, None, :], valores.shape)
+        indiv = np.broadcast_to(np.arange(n)[:, None, None], valores.shape)
+
+        validos = (valores > 0) & (skill >= 0)
+        plano = ((indiv * D + dias) * V + valores) * K + skill
+        conteos = np.bincount(plano[validos], minlength=n * D * V * K)
+        return conteos.reshape(n, D, V, K)
+
+    def deficit_lote(self, conteos):
+        """Déficit total de cobertura por individuo a partir de conteos (pop, D, T+1, K)."""
+        return np.maximum(0, self.requerimientos[None] - conteos).sum(axis=(1, 2, 3))
+
+    def horas_lote(self, pop, dificiles=False):
+        """Horas trabajadas por profesional, (pop, P). Con `dificiles` solo noches/no hábiles."""
+        valores = self.acotar(pop)
+        horas = self.duracion[valores]
+        if dificiles:
+            es_dificil = self.es_noche[valores] | self.no_habil[None, None, :]
+            horas = np.where(es_dificil, horas, 0.0)
+        return horas.sum(axis=2)
+
+
+def compilar_instancia(num_profesionales, num_dias, max_turno_val, info_profesionales,
+                       matriz_preferencias, matriz_disponibilidad, requerimientos_cobertura,
+                       secuencias_prohibidas, turnos_a_cubrir, skills_a_cubrir,
+                       duracion_turnos, dias_no_habiles, turnos_noche, bloqueos_turno=(), **kwargs):
+    """Construye una `InstanciaCompilada` a partir de la salida del loader.
+
+    Acepta las mismas claves que `ProblemaGAPropio` y tolera claves de turno
+    como int o str, skills en cualquier capitalización y secuencias como
+    pares o diccionarios. `bloqueos_turno` lista ternas (profesional, día,
+    turno) no disponibles para un turno puntual (el resto del día sí).
+    """
+    turnos = [int(t) for t in turnos_a_cubrir]
+
+    duracion_limpia = {}
+    if isinstance(duracion_turnos, dict):
+        for k, v in duracion_turnos.items():
+            try:
+                duracion_limpia[int(k)] = float(v)
+            except (TypeError, ValueError):
+                continue
+
+    valor_max = max([int(max_turno_val or 0), 0] + turnos + list(duracion_limpia))
+
+    # --- Skills ---
+    skills = []
+    for s in skills_a_cubrir:
+        s = str(s).strip().lower()
+        if s not in skills:
+            skills.append(s)
+    idx_skill = {s: k for k, s in enumerate(skills)}
+
+    skill_prof = np.full(num_profesionales, -1, dtype=np.intp)
+    t_min = np.zeros(num_profesionales, dtype=np.int64)
+    t_max = np.zeros(num_profesionales, dtype=np.int64)
+    for p in range(num_profesionales):
+        if isinstance(info_profesionales, dict):
+            p_data = info_profesionales.get(p, {})
+        else:
+            p_data = info_profesionales[p]
+        if not isinstance(p_data, dict):
+            p_data = {}
+        skill = str(p_data.get('skill', 'junior')).strip().lower()
+        skill_prof[p] = idx_skill.get(skill, -1)
+        t_min[p] = int(p_data.get('t_min', 0))
+        t_max[p] = int(p_data.get('t_max', 31))
+
+    # --- Requerimientos R[d, t, k] ---
+    requerimientos = np.zeros((num_dias, valor_max + 1, len(skills)), dtype=np.int64)
+    for d in range(num_dias):
+        try:
+            dia_data = requerimientos_cobertura[d]
+        except (IndexError, KeyError, TypeError):
+            continue
+        if not isinstance(dia_data, dict):
+            continue
+        for t_key, skills_dict in dia_data.items():
+            try:
+                t = int(t_key)
+            except (TypeError, ValueError):
+                continue
+            if t not in turnos or not isinstance(skills_dict, dict):
+                continue
+            for s, cantidad in skills_dict.items():
+                k = idx_skill.get(str(s).strip().lower())
+                if k is not None and cantidad:
+                    requerimientos[d, t, k] = int(cantidad)
+
+    # --- Turnos ---
+    duracion = np.zeros(valor_max + 1)
+    for t, horas in duracion_limpia.items():
+        if 0 < t <= valor_max:
+            duracion[t] = horas
+
+    es_noche = np.zeros(valor_max + 1, dtype=bool)
+    for t in turnos_noche:
+        try:
+            t = int(t)
+        except (TypeError, ValueError):
+            continue
+        if 0 < t <= valor_max:
+            es_noche[t] = True
+
+    no_habil = np.zeros(num_dias, dtype=bool)
+    for d in dias_no_habiles:
+        if 0 <= int(d) < num_dias:
+            no_habil[int(d)] = True
+
+    prohibida = np.zeros((valor_max + 1, valor_max + 1), dtype=bool)
+    for seq in secuencias_prohibidas:
+        try:
+            if isinstance(seq, dict):
+                previo, siguiente = int(seq['turno_previo']), int(seq['turno_siguiente'])
+            else:
+                previo, siguiente = int(seq[0]), int(seq[1])
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+        if 0 <= previo <= valor_max and 0 <= siguiente <= valor_max:
+            prohibida[previo, siguiente] = True
+
+    disponible = np.ascontiguousarray(np.asarray(matriz_disponibilidad, dtype=bool)
+                                      .reshape(num_profesionales, num_dias))
+    preferencias = np.ascontiguousarray(np.asarray(matriz_preferencias)
+                                        .reshape(num_profesionales, num_dias))
+
+    # --- Dominio A[p, d, valor] ---
+    skill_valido = skill_prof >= 0
+    requerido = requerimientos[:, :, np.where(skill_valido, skill_prof, 0)].transpose(2, 0, 1) > 0
+    dominio = requerido & disponible[:, :, None] & skill_valido[:, None, None]
+    dominio[:, :, 0] = True
+    for bloqueo in bloqueos_turno:
+        p, d, t = (int(v) for v in bloqueo)
+        if 0 <= p < num_profesionales and 0 <= d < num_dias and 0 < t <= valor_max:
+            dominio[p, d, t] = False
+
+    return InstanciaCompilada(
+        num_profesionales=num_profesionales,
+        num_dias=num_dias,
+        valor_max=valor_max,
+        skills=skills,
+        requerimientos=requerimientos,
+        duracion=duracion,
+        es_noche=es_noche,
+        no_habil=no_habil,
+        skill_prof=skill_prof,
+        prohibida=prohibida,
+        disponible=disponible,
+        preferencias=preferencias,
+        t_min=t_min,
+        t_max=t_max,
+        turnos=np.array(turnos, dtype=np.intp),
+        dominio=np.ascontiguousarray(dominio),
+    )
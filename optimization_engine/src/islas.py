@@ -0,0 +1,169 @@
+"""Modelo de islas del Algoritmo Genético.
+
+Ejecuta K subpoblaciones (islas) en procesos separados, cada una con su
+propia combinación de operadores. Cada `intervalo_migracion` generaciones
+las islas envían copias de sus mejores individuos a la isla siguiente en
+una topología de anillo (k -> k+1), donde reemplazan a los peores. La
+migración solo mueve unos pocos cromosomas, por lo que el costo de
+comunicación es despreciable frente a la evolución de cada isla.
+"""
+
+import time
+import random
+import multiprocessing
+
+import numpy as np
+
+from .utils import poblacion_inicial
+from .loader import procesar_datos_instancia
+from .problema import ProblemaGAPropio
+from .operadores import CROSSOVER_OPS, MUTATION_OPS
+from .motor_ga import crear_evolucion, resolver_operadores, armar_resultado, _reportar_avance, _inyectar_semillas
+from .parada import CriterioParada, PARADA_GENERACIONES
+
+
+def ejecutar_modelo_islas(config, datos_problema_raw, estrategias, job_id=None, reporte_progreso=None,
+                          soluciones_semilla=None):
+    """Ejecuta el GA con el modelo de islas y migración en anillo.
+
+    Args:
+        config (dict): Parámetros del GA. Además de los de
+            `ejecutar_algoritmo_genetico` usa num_islas, intervalo_migracion y
+            num_migrantes; pop_size es el tamaño de cada isla.
+        datos_problema_raw (dict): Datos crudos de la instancia.
+        estrategias (dict): Operadores base (sel, cross, mut). Con la clave
+            opcional 'islas' (lista de dicts) se fija la combinación de cada isla.
+        job_id (str, optional): Identificador del trabajo para el reporte de progreso.
+        reporte_progreso (dict, optional): Diccionario compartido de progreso.
+        soluciones_semilla (list, optional): Soluciones previas que se inyectan
+            en la población inicial de cada isla.
+
+    Returns:
+        dict: Mismo formato que `ejecutar_algoritmo_genetico`, más la clave
+            'islas' con el mejor fitness y los operadores de cada isla.
+    """
+    SEED = config.get('seed', 1234)
+    semilla = SEED if SEED is not None else random.SystemRandom().randrange(2**32)
+    num_islas = max(1, config.get('num_islas', 4))
+    generaciones = config.get('generaciones', 200)
+    intervalo = max(1, config.get('intervalo_migracion', 10))
+    num_migrantes = max(0, config.get('num_migrantes', 2))
+
+    datos_procesados = procesar_datos_instancia(datos_problema_raw)
+    problema = ProblemaGAPropio(**datos_procesados)
+
+    start_time = time.time()
+    parada = CriterioParada(config)
+    islas = []
+    for k in range(num_islas):
+        estrategias_k = _estrategias_isla(estrategias, k)
+        conexion, extremo_isla = multiprocessing.Pipe()
+        proceso = multiprocessing.Process(
+            target=_proceso_isla,
+            args=(extremo_isla, config, datos_procesados, estrategias_k, semilla + k, soluciones_semilla),
+            daemon=True,
+        )
+        proceso.start()
+        extremo_isla.close()
+        islas.append((proceso, conexion, estrategias_k))
+
+    mejor_f, mejor = np.inf, None
+    # Los criterios de parada se evalúan en cada migración (fin de tramo); el
+    # presupuesto de tiempo lo respeta además cada isla entre generaciones.
+    motivo = None
+    try:
+        migrantes = [None] * num_islas
+        # Última generación de cada isla: con presupuesto de tiempo una isla
+        # puede cortar su tramo antes y continúa desde ahí (no repite números
+        # de generación, que siembran sus hijos).
+        ultimas = [0] * num_islas
+        gen = 0
+        while motivo is None and gen < generaciones:
+            # Anillo: la isla k recibe los emigrantes de la isla k-1
+            restante = None if parada.limite_tiempo is None else parada.limite_tiempo - time.monotonic()
+            for k, (_, conexion, _) in enumerate(islas):
+                hasta = min(generaciones, ultimas[k] + intervalo)
+                conexion.send(('evolucionar', ultimas[k] + 1, hasta, migrantes[k - 1], num_migrantes, restante))
+            respuestas = [conexion.recv() for _, conexion, _ in islas]
+            migrantes = [emigrantes for emigrantes, _, _, _, _ in respuestas]
+            for _, isla_f, isla_mejor, _, _ in respuestas:
+                if isla_f < mejor_f:
+                    mejor_f, mejor = isla_f, isla_mejor
+            ultimas = [ultima for _, _, _, ultima, _ in respuestas]
+            # El avance global es el de la isla más atrasada
+            tramo, gen = min(ultimas) - gen, min(ultimas)
+            _reportar_avance(reporte_progreso, job_id, gen, generaciones, mejor_f,
+                             porcentaje=parada.porcentaje_tiempo(),
+                             diversidad=float(np.mean([diversidad for *_, diversidad in respuestas])))
+            motivo = parada.evaluar(mejor_f, generaciones=tramo)
+
+        finales = []
+        for _, conexion, _ in islas:
+            conexion.send(('fin',))
+            finales.append(conexion.recv())
+    finally:
+        for proceso, conexion, _ in islas:
+            conexion.close()
+            proceso.join(timeout=5)
+            if proceso.is_alive():
+                proceso.terminate()
+
+    elapsed = time.time() - start_time
+    resultado = armar_resultado(problema, datos_procesados, mejor, mejor_f, elapsed, gen, config)
+    resultado["criterio_parada"] = motivo or PARADA_GENERACIONES
+    resultado["islas"] = [
+        {"isla": k, "estrategias": estrategias_k, "mejor_fitness": float(isla_f), **reporte}
+        for k, ((_, _, estrategias_k), (isla_f, reporte)) in enumerate(zip(islas, finales))
+    ]
+    return resultado
+
+
+def _estrategias_isla(estrategias, k):
+    """Combinación de operadores de la isla `k`.
+
+    Si `estrategias['islas']` existe se usa (cíclicamente) sobre la base; si no,
+    la isla 0 usa la base y las demás rotan cruce y mutación por los registros.
+    """
+    base = {key: v for key, v in (estrategias or {}).items() if key != 'islas'}
+    por_isla = (estrategias or {}).get('islas')
+    if por_isla:
+        return {**base, **por_isla[k % len(por_isla)]}
+
+    cruces, mutaciones = list(CROSSOVER_OPS), list(MUTATION_OPS)
+    cruce = base.get('cross') if base.get('cross') in CROSSOVER_OPS else 'bloques_verticales'
+    mutacion = base.get('mut') if base.get('mut') in MUTATION_OPS else 'hibrida_adaptativa'
+    return {
+        **base,
+        'cross': cruces[(cruces.index(cruce) + k) % len(cruces)],
+        'mut': mutaciones[(mutaciones.index(mutacion) + k) % len(mutaciones)],
+    }
+
+
+def _proceso_isla(conexion, config, datos_procesados, estrategias, semilla, soluciones_semilla=None):
+    """Bucle de una isla: evoluciona por tramos y atiende los pedidos del maestro."""
+    random.seed(semilla)
+    np.random.seed(semilla)
+    problema = ProblemaGAPropio(**datos_procesados)
+    evolucion = crear_evolucion(problema, resolver_operadores(estrategias), config, semilla, estrategias)
+    pop = poblacion_inicial(config, problema, seed=semilla)
+    evolucion.iniciar(pop, _inyectar_semillas(pop, soluciones_semilla, datos_procesados))
+
+    while True:
+        mensaje = conexion.recv()
+        if mensaje[0] == 'fin':
+            conexion.send((float(evolucion.best_global_f), evolucion.reporte()))
+            break
+        _, desde, hasta, inmigrantes, num_migrantes, restante = mensaje
+        if restante is not None:
+            evolucion.limite_tiempo = time.monotonic() + restante
+        if inmigrantes is not None:
+            evolucion.incorporar(inmigrantes)
+        ultima = desde - 1
+        for gen in range(desde, hasta + 1):
+            if evolucion.limite_tiempo is not None and time.monotonic() >= evolucion.limite_tiempo:
+                break
+            evolucion.avanzar(gen)
+            ultima = gen
+        conexion.send((evolucion.mejores(num_migrantes), float(evolucion.best_global_f),
+                       evolucion.best_global.copy(), ultima, evolucion.diversidad()))
+    conexion.close()
@@ -25,7 +25,7 @@ def procesar_datos_instancia(data: dict) -> dict:
     reqs_finales = None
 
     # ESTRATEGIA 1: Cobertura Explícita (Día por día detallado)
-    if 'requerimientos_cobertura_explicita' in data:
+    if data.get('requerimientos_cobertura_explicita'):
         print("✅ ESTRATEGIA: Cobertura Explícita detectada.")
         raw_reqs = data['requerimientos_cobertura_explicita']
         reqs_finales = _procesar_cobertura_explicita(raw_reqs)
@@ -51,11 +51,129 @@ def procesar_datos_instancia(data: dict) -> dict:
 
     # 4. Matrices
     data['matriz_disponibilidad'] = _generar_matriz_disponibilidad(data)
+    data['bloqueos_turno'] = _generar_bloqueos_turno(data)
     data['matriz_preferencias'] = _generar_matriz_preferencias(data)
+
+    # 5. Codificación densa de turnos (IDs de BD -> 1..S)
+    data = _codificar_turnos_densos(data)
     
     print("="*50 + "\n")
     return data
 
+def _codificar_turnos_densos(data: dict) -> dict:
+    """Reemplaza los IDs de turno de la BD por índices densos 1..S.
+
+    El cromosoma solo puede tomar valores en {0, 1, ..., S}, de modo que la
+    población inicial y las mutaciones trabajan sobre el alfabeto válido aun
+    cuando la web envía claves primarias arbitrarias (ej. 41, 42, 43).
+    `data['ids_turnos']` guarda la tabla inversa (índice denso -> ID original,
+    con 0 = libre) para restaurar los resultados, y
+    `data['pedidos_turno_desconocido']` las ternas (profesional, día, ID) de
+    preferencias por un turno que no está en la tabla.
+    """
+    ids = []
+    for t in data['turnos_a_cubrir']:
+        if t not in ids:
+            ids.append(t)
+    denso = {t_id: idx for idx, t_id in enumerate(ids, start=1)}
+    S = len(ids)
+
+    data['ids_turnos'] = [0] + ids
+    data['turnos_a_cubrir'] = list(range(1, S + 1))
+    data['max_turno_val'] = S
+    data['turnos_noche'] = {denso[int(t)] for t in data['turnos_noche'] if int(t) in denso}
+    data['duracion_turnos'] = {denso[t]: h for t, h in data['duracion_turnos'].items() if t in denso}
+    data['secuencias_prohibidas'] = {
+        (denso[a], denso[b]) for a, b in data['secuencias_prohibidas'] if a in denso and b in denso
+    }
+    data['requerimientos_cobertura'] = [
+        {denso[int(t)]: skills for t, skills in dia.items() if int(t) in denso}
+        for dia in data['requerimientos_cobertura']
+    ]
+    data['bloqueos_turno'] = [(p, d, denso[t]) for p, d, t in data.get('bloqueos_turno', []) if t in denso]
+
+    # Preferencias de turno (> 0): se traducen al índice denso. Un pedido de un
+    # turno inexistente nunca puede cumplirse, así que se mueve fuera del alfabeto;
+    # el ID pedido se conserva aparte para el reporte.
+    prefs = data['matriz_preferencias']
+    codificadas = prefs.copy()
+    desconocidos = []
+    for p, d in np.argwhere(prefs > 0):
+        v = int(prefs[p, d])
+        if v in denso:
+            codificadas[p, d] = denso[v]
+            continue
+        desconocidos.append((int(p), int(d), v))
+        if v <= S:
+            codificadas[p, d] = S + 1
+    data['matriz_preferencias'] = codificadas
+    data['pedidos_turno_desconocido'] = desconocidos
+    return data
+
+def restaurar_ids_turnos(valores, ids_turnos):
+    """Traduce índices densos de turno (0..S) a los IDs originales de la BD.
+
+    Args:
+        valores: Escalar, lista o arreglo de índices densos.
+        ids_turnos (list): Tabla `[0, id_1, ..., id_S]` generada por el loader.
+
+    Returns:
+        np.ndarray: Arreglo con la misma forma y los IDs originales. Los valores
+        fuera de la tabla se devuelven sin cambios.
+    """
+    arr = np.asarray(valores).astype(np.int64)
+    tabla = np.asarray(ids_turnos, dtype=np.int64)
+    en_rango = (arr >= 0) & (arr < len(tabla))
+    return np.where(en_rango, tabla[np.where(en_rango, arr, 0)], arr)
+
+def codificar_solucion_semilla(semilla: dict, data: dict) -> np.ndarray:
+    """Traduce una solución previa a una matriz densa (P, D) del problema actual.
+
+    Args:
+        semilla (dict): 'matriz' (filas x días con IDs de turno de la BD, 0 =
+            libre, como `matriz_solucion` de un resultado), 'ids_profesionales'
+            opcional (id_db de cada fila; sin él las filas se toman por
+            posición) y 'desfase_dias' (día de la semilla que corresponde al
+            día 0 actual, para alinear días de la semana).
+        data (dict): Salida de `procesar_datos_instancia`.
+
+    Returns:
+        np.ndarray: Matriz (P, D) con índices densos. Profesionales, días o
+        turnos que no existen en la semilla quedan libres (0).
+    """
+    P, D = data['num_profesionales'], data['num_dias']
+    resultado = np.zeros((P, D), dtype=np.int64)
+    previa = np.asarray(semilla.get('matriz') or [], dtype=np.int64)
+    if previa.ndim != 2 or previa.size == 0:
+        return resultado
+
+    # Filas: por id_db si viene la nómina de la semilla, si no por posición
+    ids_filas = semilla.get('ids_profesionales')
+    if ids_filas:
+        fila_de = {id_db: i for i, id_db in enumerate(ids_filas[:len(previa)])}
+        filas = [fila_de.get(data['info_profesionales'][p]['id_db'], -1) for p in range(P)]
+    else:
+        filas = [p if p < len(previa) else -1 for p in range(P)]
+
+    # Días: el día d toma el día d + desfase de la semilla; pasado su final se
+    # retrocede de a semanas para conservar el día de la semana.
+    D_previa = previa.shape[1]
+    columnas = []
+    for d in range(D):
+        j = d + int(semilla.get('desfase_dias') or 0)
+        while j >= D_previa and j - 7 >= 0:
+            j -= 7
+        columnas.append(j if 0 <= j < D_previa else -1)
+
+    denso = {t_id: idx for idx, t_id in enumerate(data['ids_turnos']) if idx > 0}
+    for p, fila in enumerate(filas):
+        if fila < 0:
+            continue
+        for d, j in enumerate(columnas):
+            if j >= 0:
+                resultado[p, d] = denso.get(int(previa[fila, j]), 0)
+    return resultado
+
 def _preprocesar_datos_basicos(data: dict) -> dict:
     # Aplanado si viene anidado en datos_problema
     if 'datos_problema' in data:
@@ -179,6 +297,8 @@ def _generar_requerimientos_cobertura_legacy(data: dict) -> list:
 def _generar_matriz_disponibilidad(data: dict) -> np.ndarray:
     matriz = np.full((data['num_profesionales'], data['num_dias']), True)
     for exc in data.get('excepciones_disponibilidad', []):
+        if exc.get('turno') is not None:
+            continue  # Ausencia de un solo turno: ver _generar_bloqueos_turno
         p_idx = exc.get('prof_index')
         if p_idx is not None and p_idx < data['num_profesionales']:
             disponible = 1 if exc.get('disponible', True) else 0
@@ -187,6 +307,24 @@ def _generar_matriz_disponibilidad(data: dict) -> np.ndarray:
                 matriz[p_idx, max(0, r[0]):min(data['num_dias'], r[1])] = disponible
     return matriz
 
+def _generar_bloqueos_turno(data: dict) -> list:
+    """Ausencias de un turno puntual: ternas (profesional, día, ID de turno).
+
+    Una excepción de disponibilidad con clave 'turno' bloquea solo ese turno
+    en sus días; el profesional sigue disponible para los demás.
+    """
+    bloqueos = []
+    for exc in data.get('excepciones_disponibilidad', []):
+        p_idx, turno = exc.get('prof_index'), exc.get('turno')
+        if turno is None or p_idx is None or p_idx >= data['num_profesionales']:
+            continue
+        if exc.get('disponible', True) or 'dias_range' not in exc:
+            continue
+        r = exc['dias_range']
+        for d in range(max(0, r[0]), min(data['num_dias'], r[1])):
+            bloqueos.append((p_idx, d, int(turno)))
+    return bloqueos
+
 def _generar_matriz_preferencias(data: dict) -> np.ndarray:
     matriz = np.zeros((data['num_profesionales'], data['num_dias']), dtype=int)
     for exc in data.get('excepciones_preferencias', []):
@@ -6,16 +6,31 @@ reporte de progreso asincrónico para la API.
 """
 
 import time
+import heapq
 import random
 import numpy as np
 
 # Importaciones relativas para consistencia de paquete
-from .utils import init_population
-from .loader import procesar_datos_instancia 
+from .utils import poblacion_inicial, sembrar_hijo, sortear_en_dominio, diversity
+from .loader import procesar_datos_instancia, restaurar_ids_turnos, codificar_solucion_semilla
 from .problema import ProblemaGAPropio  # <--- AGREGADO: Faltaba esta importación
-from .operadores import SELECTION_OPS, CROSSOVER_OPS, MUTATION_OPS 
+from .operadores import (SELECTION_OPS, CROSSOVER_OPS, MUTATION_OPS, OPERADORES_LOTE,
+                          CRUCES_HIBRIDOS, MUTACIONES_HIBRIDAS, crossover_adaptativo, aplicar_mutaciones)
+from .cache_fitness import CacheFitness
+from .evaluacion_incremental import AgregadosPoblacion, celdas_modificadas, FRACCION_MAX_DELTA
+from .paralelo import GeneracionParalela
+from .parada import CriterioParada, PARADA_GENERACIONES, PARADA_ESTANCAMIENTO
+from .busqueda_local import BusquedaLocal
+from .repair import reparar_cromosoma
+from .adaptacion import SeleccionAdaptativa, ControlParametros, recompensas_relativas
 
-def ejecutar_algoritmo_genetico(config, datos_problema_raw, estrategias, job_id=None, reporte_progreso=None):
+# Re-mutaciones de un hijo repetido antes de reemplazarlo por un inmigrante
+INTENTOS_DUPLICADO = 3
+# Fracción de celdas que la mutación cataclísmica de un reinicio vuelve a sortear
+FRACCION_CATACLISMO = 0.1
+
+def ejecutar_algoritmo_genetico(config, datos_problema_raw, estrategias, job_id=None, reporte_progreso=None,
+                                soluciones_semilla=None):
     """Orquesta la ejecución completa del Algoritmo Genético.
 
     Realiza la preparación del entorno, la configuración de la instancia del 
@@ -24,15 +39,23 @@ def ejecutar_algoritmo_genetico(config, datos_problema_raw, estrategias, job_id=
 
     Args:
         config (dict): Parámetros de configuración del GA (pop_size, generaciones, 
-            pc, pm, elitismo, seed).
+            pc, pm, elitismo, seed, tamano_cache_fitness, num_workers,
+            max_generaciones_sin_mejora, fitness_objetivo, tolerancia_mejora,
+            tiempo_maximo_seg, intervalo_busqueda_local, elites_busqueda_local,
+            evaluaciones_busqueda_local, inicializacion, control_parametros,
+            rechazar_duplicados, generaciones_reinicio, diversos_reinicio,
+            modo_reinicio).
         datos_problema_raw (dict): Diccionario con los datos crudos de la 
             instancia del problema (proveniente del JSON de la API).
         estrategias (dict): Mapeo de nombres de estrategias a utilizar para 
-            los operadores (sel, cross, mut).
+            los operadores (sel, cross, mut) y el esquema de reemplazo (reemplazo).
         job_id (str, optional): Identificador único del trabajo para el 
             reporte de progreso.
         reporte_progreso (dict, optional): Diccionario compartido (multiprocessing) 
             donde se registran los avances de cada generación.
+        soluciones_semilla (list, optional): Soluciones previas (ver
+            `loader.codificar_solucion_semilla`) que reemplazan a los primeros
+            individuos de la población inicial (arranque en caliente).
 
     Returns:
         dict: Resultados finales del algoritmo, incluyendo:
@@ -41,8 +64,19 @@ def ejecutar_algoritmo_genetico(config, datos_problema_raw, estrategias, job_id=
             - solucion (list): Vector de horas trabajadas por profesional.
             - matriz_solucion (list): Representación PxD de la planificación final.
             - generaciones_completadas (int): Cantidad de iteraciones realizadas.
+            - criterio_parada (str): Regla que terminó la corrida ("generaciones",
+              "fitness_objetivo", "estancamiento" o "tiempo_maximo").
             - config_utilizada (dict): Configuración final aplicada.
             - explicabilidad (dict): Reporte detallado de penalizaciones y equidad.
+            - cache_fitness (dict): Aciertos/fallos de la caché LRU de fitness.
+            - operadores_adaptativos (dict): Solo con cruce 'adaptativo' o mutación
+              'hibrida_adaptativa': usos, mejoras y probabilidad final de cada operador.
+            - parametros_adaptativos (list): Solo con control_parametros='adaptativo':
+              pc, pm, diversidad y tasa de mejora tras cada generación.
+            - duplicados (dict): Hijos repetidos que se volvieron a mutar o se
+              reemplazaron por inmigrantes.
+            - reinicios (dict): Solo con generaciones_reinicio: cantidad de
+              reinicios por estancamiento y generaciones en que ocurrieron.
     """
     # 1. Preparación del Entorno
     # Si la seed es None, usamos una fija por defecto o el reloj del sistema si preferimos aleatoriedad pura
@@ -51,94 +85,760 @@ def ejecutar_algoritmo_genetico(config, datos_problema_raw, estrategias, job_id=
     if SEED is not None:
         random.seed(SEED)
         np.random.seed(SEED)
+    # Cada hijo se genera con una semilla derivada de (semilla, generación, índice),
+    # así el resultado no depende de cuántos procesos lo produzcan.
+    semilla_hijos = SEED if SEED is not None else random.SystemRandom().randrange(2**32)
 
     # 2. Inicialización de Componentes
     datos_procesados = procesar_datos_instancia(datos_problema_raw)
     problema = ProblemaGAPropio(**datos_procesados)
-
-    # Resolución de funciones de operadores basadas en las estrategias elegidas
-    # Usamos .get() con defaults seguros, aunque la API ya debería haber validado esto.
-    estrategias = estrategias or {}
-    seleccion_func = SELECTION_OPS.get(estrategias.get('sel'), SELECTION_OPS['torneo_deterministico'])
-    cruce_func = CROSSOVER_OPS.get(estrategias.get('cross'), CROSSOVER_OPS['bloques_verticales'])
-    mutacion_func = MUTATION_OPS.get(estrategias.get('mut'), MUTATION_OPS['hibrida_adaptativa'])
+    operadores = resolver_operadores(estrategias)
 
     # Parámetros de evolución
-    pop_size = config.get('pop_size', 100)
     generaciones = config.get('generaciones', 200)
-    pc = config.get('pc', 0.85)
-    pm = config.get('pm', 0.20)
-    elitismo = config.get('elitismo', True)
+    num_workers = config.get('num_workers', 1) or 1
 
     # 3. Creación de Población Inicial
     start_time = time.time()
-    # Pasamos la seed también a init_population para garantizar reproducibilidad en la generación inicial
-    pop = init_population(pop_size, problema.num_profesionales, problema.num_dias, problema.max_turno_val, seed=SEED)
-    fitnesses = [problema.fitness(ind) for ind in pop]
+    # El presupuesto de tiempo (tiempo_maximo_seg) corre desde aquí
+    parada = CriterioParada(config)
+    # Pasamos la seed también a poblacion_inicial para garantizar reproducibilidad en la generación inicial
+    # La población vive en un único arreglo (pop, P, D) y se alterna con un
+    # segundo buffer preasignado para la generación siguiente (doble buffer).
+    # Con inicializacion='constructiva' la población nace cubriendo casi toda la demanda.
+    pop = poblacion_inicial(config, problema, seed=SEED)
+    num_semillas = _inyectar_semillas(pop, soluciones_semilla, datos_procesados)
+    evolucion = crear_evolucion(problema, operadores, config, semilla_hijos, estrategias)
+    evolucion.limite_tiempo = parada.limite_tiempo
+    evolucion.iniciar(pop, num_semillas)
 
-    # Seguimiento del mejor individuo histórico
-    best_idx = np.argmin(fitnesses)
-    best_global = pop[best_idx].copy()
-    best_global_f = fitnesses[best_idx]
+    # Modo maestro-trabajadores (opcional): los hijos se generan en otros procesos.
+    # El esquema estacionario es secuencial por naturaleza y no lo usa.
+    if num_workers > 1 and type(evolucion) is Evolucion:
+        evolucion.paralelo = GeneracionParalela(problema, datos_procesados, operadores, _generar_hijo, pop, num_workers)
 
     # 4. Bucle Evolutivo Principal
-    for gen in range(1, generaciones + 1):
-        # Reporte de progreso asincrónico para la interfaz de usuario
-        _reportar_avance(reporte_progreso, job_id, gen, generaciones, best_global_f)
-
-        new_pop = []
-        if elitismo:
-            new_pop.append(best_global.copy())
-
-        while len(new_pop) < pop_size:
-            # Selección de padres mediante torneo (o la estrategia seleccionada)
-            # Nota: Si seleccion_ranking no usa k, el argumento extra se ignora o se maneja dentro
-            p1 = seleccion_func(pop, fitnesses, k=3)
-            p2 = seleccion_func(pop, fitnesses, k=3)
-
-            # Cruce (Crossover)
-            if random.random() < pc:
-                child = cruce_func(p1, p2, problema.num_profesionales, problema.num_dias)
-            else:
-                child = p1.copy()
+    # Corre hasta agotar las generaciones o hasta que otro criterio (objetivo,
+    # estancamiento, tiempo) indique parar.
+    motivo = parada.evaluar(evolucion.best_global_f)
+    gen = 0
+    try:
+        while motivo is None and gen < generaciones:
+            gen += 1
+            # Reporte de progreso asincrónico para la interfaz de usuario
+            _reportar_avance(reporte_progreso, job_id, gen, generaciones, evolucion.best_global_f,
+                             porcentaje=parada.porcentaje_tiempo(), diversidad=evolucion.diversidad())
+            evolucion.avanzar(gen)
+            motivo = parada.evaluar(evolucion.best_global_f)
+    finally:
+        if evolucion.paralelo is not None:
+            evolucion.paralelo.cerrar()
 
-            # Mutación
-            if random.random() < pm:
-                child = mutacion_func(child, problema)
+    # 5. Consolidación de Resultados Finales
+    elapsed = time.time() - start_time
+    resultado = armar_resultado(problema, datos_procesados, evolucion.best_global, evolucion.best_global_f,
+                                elapsed, gen, config)
+    resultado["criterio_parada"] = motivo or PARADA_GENERACIONES
+    resultado.update(evolucion.reporte())
+    return resultado
 
-            # Reparación: Se asegura la validez de la solución antes de su evaluación
-            child_matriz = child.reshape(problema.num_profesionales, problema.num_dias)
-            child_reparado = problema._reparar_cromosoma(child_matriz).reshape(-1)
-            new_pop.append(child_reparado)
+def _inyectar_semillas(pop, soluciones_semilla, datos_procesados):
+    """Escribe las soluciones semilla (codificadas) en los primeros individuos de `pop`.
 
-        # Transición generacional
-        pop = new_pop[:pop_size]
-        fitnesses = [problema.fitness(ind) for ind in pop]
+    Returns:
+        int: Cantidad de semillas inyectadas (ocupan las posiciones 0..n-1).
+    """
+    semillas = (soluciones_semilla or [])[:len(pop)]
+    for i, semilla in enumerate(semillas):
+        pop[i] = codificar_solucion_semilla(semilla, datos_procesados)
+    return len(semillas)
 
-        # Actualización del mejor global si se encontró una mejora
-        current_best_idx = np.argmin(fitnesses)
-        if fitnesses[current_best_idx] < best_global_f:
-            best_global_f = fitnesses[current_best_idx]
-            best_global = pop[current_best_idx].copy()
+def resolver_operadores(estrategias):
+    """Traduce los nombres de estrategias (sel, cross, mut) a la tupla de funciones."""
+    # Usamos .get() con defaults seguros, aunque la API ya debería haber validado esto.
+    estrategias = estrategias or {}
+    seleccion_func = SELECTION_OPS.get(estrategias.get('sel'), SELECTION_OPS['torneo_deterministico'])
+    cruce_func = CROSSOVER_OPS.get(estrategias.get('cross'), CROSSOVER_OPS['bloques_verticales'])
+    mutacion_func = MUTATION_OPS.get(estrategias.get('mut'), MUTATION_OPS['hibrida_adaptativa'])
+    return (seleccion_func, cruce_func, mutacion_func)
 
-    # 5. Consolidación de Resultados Finales
-    elapsed = time.time() - start_time
-    
+def armar_resultado(problema, datos_procesados, best_global, best_global_f, elapsed, generaciones, config):
+    """Arma el diccionario de resultados a partir del mejor individuo encontrado.
+
+    Returns:
+        dict: Fitness, tiempo, solución (IDs de BD restaurados) y explicabilidad.
+    """
     # Generación de la auditoría final y explicabilidad
-    reporte_explicabilidad = problema.evaluar_detallado(best_global)
+    reporte_explicabilidad = problema.evaluar_detallado(best_global, reparar=False)
+    ids_turnos = datos_procesados['ids_turnos']
+    _restaurar_ids_en_reporte(reporte_explicabilidad, ids_turnos,
+                              datos_procesados.get('pedidos_turno_desconocido', ()))
+    matriz_solucion = restaurar_ids_turnos(
+        best_global.reshape(problema.num_profesionales, problema.num_dias), ids_turnos
+    )
     
     return {
         "fitness": float(best_global_f),
         "tiempo_ejecucion": elapsed,
         # Asumimos que 'horas_por_profesional' está disponible en el reporte de equidad
         "solucion": reporte_explicabilidad["datos_equidad"].get("horas_por_profesional", []),
-        "matriz_solucion": best_global.reshape(problema.num_profesionales, problema.num_dias).tolist(),
+        "matriz_solucion": matriz_solucion.tolist(),
         "generaciones_completadas": generaciones,
         "config_utilizada": config,
-        "explicabilidad": reporte_explicabilidad 
+        "explicabilidad": reporte_explicabilidad,
     }
 
-def _reportar_avance(reporte_progreso, job_id, gen, total, fitness):
+class Evolucion:
+    """Estado de una población en evolución generacional.
+
+    Agrupa los buffers de población (doble buffer), los agregados de fitness,
+    la caché y el mejor individuo histórico, para que el bucle principal y el
+    modelo de islas avancen generación a generación con el mismo código.
+
+    Args:
+        problema (ProblemaGAPropio): Instancia del problema.
+        operadores (tuple): Funciones (selección, cruce, mutación).
+        config (dict): Parámetros del GA (pop_size, pc, pm, elitismo, tamano_cache_fitness,
+            control_parametros, rechazar_duplicados, inicializacion, los del
+            reinicio: generaciones_reinicio, diversos_reinicio, modo_reinicio,
+            y los del paso memético: intervalo_busqueda_local,
+            elites_busqueda_local, evaluaciones_busqueda_local).
+        semilla_hijos (int): Semilla base de la que se deriva la de cada hijo.
+    """
+
+    def __init__(self, problema, operadores, config, semilla_hijos):
+        self.problema = problema
+        self.operadores = operadores
+        self.semilla_hijos = semilla_hijos
+        self.pc = config.get('pc', 0.85)
+        self.pm = config.get('pm', 0.20)
+        self.elitismo = config.get('elitismo', True)
+        self.cache = CacheFitness(config.get('tamano_cache_fitness', 10_000))
+        self.paralelo = None
+        # Instante (time.monotonic) a partir del cual no se generan más hijos
+        self.limite_tiempo = None
+        # Paso memético opcional: búsqueda local sobre los mejores cada N generaciones
+        self.intervalo_busqueda_local = config.get('intervalo_busqueda_local')
+        self.elites_busqueda_local = config.get('elites_busqueda_local', 2)
+        self.busqueda_local = None
+        if self.intervalo_busqueda_local:
+            self.busqueda_local = BusquedaLocal(problema, config.get('evaluaciones_busqueda_local', 200))
+        # Selección adaptativa del operador de cada hijo (cruce 'adaptativo', mutación 'hibrida_adaptativa')
+        self.adaptacion_cruce = self.adaptacion_mutacion = None
+        if operadores[1] is crossover_adaptativo:
+            self.adaptacion_cruce = SeleccionAdaptativa(CRUCES_HIBRIDOS, CRUCES_HIBRIDOS.values())
+        if operadores[2] is aplicar_mutaciones:
+            self.adaptacion_mutacion = SeleccionAdaptativa(MUTACIONES_HIBRIDAS, MUTACIONES_HIBRIDAS.values())
+        # Rechazo de hijos repetidos en la generación (se re-mutan o se reemplazan por inmigrantes)
+        self.rechazar_duplicados = config.get('rechazar_duplicados', True)
+        self.config_inmigrante = {'pop_size': 1, 'inicializacion': config.get('inicializacion', 'aleatoria')}
+        self.duplicados = {"remutados": 0, "inmigrantes": 0}
+        # Reinicio tras `generaciones_reinicio` generaciones sin mejora (None = sin reinicios)
+        self.estancamiento = None
+        if config.get('generaciones_reinicio'):
+            self.estancamiento = CriterioParada({
+                'max_generaciones_sin_mejora': config['generaciones_reinicio'],
+                'tolerancia_mejora': config.get('tolerancia_mejora'),
+            })
+        self.diversos_reinicio = config.get('diversos_reinicio', 2)
+        self.modo_reinicio = config.get('modo_reinicio', 'mutacion')
+        self.reinicios = []
+        # Control adaptativo de pc/pm por generación (diversidad y tasa de mejora)
+        self.control = None
+        if config.get('control_parametros', 'fijo') == 'adaptativo':
+            self.control = ControlParametros(self.pc, self.pm)
+
+    def iniciar(self, pop, num_semillas=0):
+        """Repara (en sitio) y evalúa la población inicial (pop, P, D).
+
+        Los primeros `num_semillas` individuos son soluciones previas: reciben
+        la reparación mínima (sin podado aleatorio de excesos), que solo las
+        corrige donde la instancia cambió y conserva el resto de su estructura.
+        """
+        problema = self.problema
+        n = len(pop)
+        self.pop = pop
+        self.siguiente = np.empty_like(pop)
+        # Agregados de fitness por individuo (horas, cobertura, PDL/PTE), también en doble buffer
+        self.agregados = AgregadosPoblacion(problema, n)
+        self.agregados_sig = AgregadosPoblacion(problema, n)
+        self.padres = np.full(n, -1, dtype=np.intp)
+        # Por hijo: si se le aplicó el cruce y la mutación (solo esos se acreditan)
+        self.aplicados = np.zeros((n, 2), dtype=bool)
+        # Cada individuo se repara una única vez; la evaluación usa el camino "ya reparado".
+        for i in range(n):
+            if i < num_semillas:
+                pop[i] = reparar_cromosoma(pop[i], problema, podar_excesos=False)
+            else:
+                pop[i] = problema._reparar_cromosoma(pop[i])
+        self.fitnesses = _evaluar_poblacion(pop, problema, self.cache, self.agregados)
+
+        # Seguimiento del mejor individuo histórico (y su posición en la población vigente)
+        best_idx = int(np.argmin(self.fitnesses))
+        self.best_global = pop[best_idx].copy()
+        self.best_global_f = self.fitnesses[best_idx]
+        self.best_pos = best_idx
+        self._controlar_parametros(0)
+
+    def avanzar(self, gen):
+        """Produce y evalúa la generación `gen` a partir de la actual."""
+        problema = self.problema
+        pop, siguiente, padres, aplicados = self.pop, self.siguiente, self.padres, self.aplicados
+        aplicados[:] = False
+
+        inicio = 0
+        if self.elitismo:
+            siguiente[0] = self.best_global
+            padres[0] = self.best_pos
+            inicio = 1
+
+        seleccionados = _seleccionar_generacion(pop, self.fitnesses, self.operadores, self.semilla_hijos, gen)
+        cruce_previo = self.operadores[1] in OPERADORES_LOTE
+        if cruce_previo:
+            cruza = _cruzar_generacion(pop, siguiente, inicio, seleccionados, self.operadores[1], self.pc)
+        elegidos, ops_hijos = self._sortear_operadores(gen, len(pop), len(pop))
+
+        generados = len(pop)
+        if self.paralelo is not None:
+            padres[inicio:], aplicados[inicio:] = self.paralelo.generar(
+                gen, pop, self.fitnesses, siguiente, inicio, self.pc, self.pm, self.semilla_hijos,
+                seleccionados, cruce_previo, ops_hijos)
+        else:
+            for i in range(inicio, len(pop)):
+                if self.limite_tiempo is not None and time.monotonic() >= self.limite_tiempo:
+                    # Sin tiempo: el resto de la generación son copias de la actual
+                    siguiente[i:] = pop[i:]
+                    padres[i:] = np.arange(i, len(pop))
+                    generados = i
+                    break
+                sembrar_hijo(self.semilla_hijos, gen, i)
+                padres[i], aplicados[i, 0], aplicados[i, 1] = _generar_hijo(
+                    pop, self.fitnesses, siguiente[i], problema, self.operadores, self.pc, self.pm,
+                    None if seleccionados is None else seleccionados[i],
+                    cruce_previo, None if ops_hijos is None else ops_hijos[i])
+        if cruce_previo:
+            aplicados[inicio:, 0] = cruza
+        if self.rechazar_duplicados:
+            self._rechazar_duplicados(gen, generados)
+
+        # Transición generacional: se intercambian los buffers
+        fitnesses_padres = self.fitnesses
+        self.pop, self.siguiente = siguiente, pop
+        self.agregados, self.agregados_sig = self.agregados_sig, self.agregados
+        self.fitnesses = _evaluar_poblacion(self.pop, problema, self.cache, self.agregados,
+                                            padres=padres, pop_padres=self.siguiente,
+                                            agregados_padres=self.agregados_sig)
+        if elegidos is not None:
+            # Los inmigrantes (sin padre) no acreditan a ningún operador
+            hijos = np.arange(inicio, generados)
+            hijos = hijos[padres[hijos] >= 0]
+            self._acreditar_operadores(elegidos[hijos], aplicados[hijos], fitnesses_padres[padres[hijos]],
+                                       self.fitnesses[hijos])
+
+        # Actualización del mejor global si se encontró una mejora
+        current_best_idx = int(np.argmin(self.fitnesses))
+        if self.fitnesses[current_best_idx] < self.best_global_f:
+            self.best_global_f = self.fitnesses[current_best_idx]
+            self.best_global = self.pop[current_best_idx].copy()
+            self.best_pos = current_best_idx
+        else:
+            self.best_pos = 0 if self.elitismo else -1
+
+        self._buscar_localmente(gen)
+        self._reiniciar_si_estancada(gen)
+        self._controlar_parametros(gen)
+
+    def _rechazar_duplicados(self, gen, fin):
+        """Evita que la generación siguiente repita individuos.
+
+        Recorre `siguiente[:fin]` con un conjunto de hashes (élite incluido): un
+        hijo ya visto se vuelve a mutar y reparar hasta `INTENTOS_DUPLICADO`
+        veces y, si sigue repetido, se reemplaza por un inmigrante nuevo
+        (sin padre, se evalúa completo). Así no se gasta una evaluación ni un
+        lugar de la población en un clon.
+        """
+        problema, siguiente, padres = self.problema, self.siguiente, self.padres
+        n = len(siguiente)
+        vistos = set()
+        for i in range(fin):
+            clave = CacheFitness.clave(siguiente[i])
+            if clave in vistos:
+                # Las semillas `2n + 1 + i` no se cruzan con las de hijos, selección ni búsqueda local
+                sembrar_hijo(self.semilla_hijos, gen, 2 * n + 1 + i)
+                # El hijo final ya no es obra de la mutación que se le sorteó
+                self.aplicados[i, 1] = False
+                for _ in range(INTENTOS_DUPLICADO):
+                    mutado = self.operadores[2](siguiente[i], problema).reshape(siguiente[i].shape)
+                    siguiente[i] = problema._reparar_cromosoma(mutado)
+                    clave = CacheFitness.clave(siguiente[i])
+                    if clave not in vistos:
+                        self.duplicados["remutados"] += 1
+                        break
+                else:
+                    siguiente[i] = problema._reparar_cromosoma(
+                        poblacion_inicial(self.config_inmigrante, problema)[0])
+                    padres[i] = -1
+                    clave = CacheFitness.clave(siguiente[i])
+                    self.duplicados["inmigrantes"] += 1
+            vistos.add(clave)
+
+    def diversidad(self):
+        """Fracción de individuos distintos en la población vigente."""
+        return diversity(self.pop) / len(self.pop)
+
+    def _buscar_localmente(self, gen):
+        """Paso memético: mejora en sitio a los mejores individuos si toca en `gen`.
+
+        Returns:
+            list: Posiciones de los individuos que mejoraron.
+        """
+        if self.busqueda_local is None or gen % self.intervalo_busqueda_local:
+            return []
+        n = len(self.pop)
+        mejorados = []
+        for r, i in enumerate(np.argsort(self.fitnesses, kind='stable')[:self.elites_busqueda_local].tolist()):
+            if self.limite_tiempo is not None and time.monotonic() >= self.limite_tiempo:
+                break
+            # Las semillas `n + 1 + r` no se cruzan con las de los hijos ni con la de la selección (`n`)
+            sembrar_hijo(self.semilla_hijos, gen, n + 1 + r)
+            f, aceptados = self.busqueda_local.mejorar(self.pop, i, self.agregados, self.fitnesses[i])
+            if not aceptados:
+                continue
+            self.fitnesses[i] = f
+            mejorados.append(i)
+            if f < self.best_global_f:
+                self.best_global_f = f
+                self.best_global = self.pop[i].copy()
+                self.best_pos = i
+        return mejorados
+
+    def _sortear_operadores(self, gen, indice, n):
+        """Sortea el cruce y la mutación de `n` hijos con la selección adaptativa.
+
+        Usa un generador propio derivado de (semilla, gen, indice), sin tocar
+        el flujo aleatorio de selección e hijos.
+
+        Returns:
+            tuple: (elegidos (n, 2) con el índice de cruce y de mutación, -1 en
+                las familias no adaptativas; lista de pares (cruce, mutación)),
+                o (None, None) si no hay operadores adaptativos.
+        """
+        if self.adaptacion_cruce is None and self.adaptacion_mutacion is None:
+            return None, None
+        rng = np.random.default_rng([self.semilla_hijos, gen, indice, 1])
+        elegidos = np.full((n, 2), -1, dtype=np.intp)
+        funciones = [[self.operadores[1]] * n, [self.operadores[2]] * n]
+        for columna, adaptacion in enumerate((self.adaptacion_cruce, self.adaptacion_mutacion)):
+            if adaptacion is not None:
+                elegidos[:, columna] = adaptacion.sortear(n, rng)
+                funciones[columna] = [adaptacion.funciones[a] for a in elegidos[:, columna]]
+        return elegidos, list(zip(*funciones))
+
+    def _acreditar_operadores(self, elegidos, aplicados, f_padres, f_hijos):
+        """Acredita a cada operador elegido la mejora relativa de sus hijos.
+
+        Solo cuentan los hijos a los que el operador se aplicó (`aplicados`
+        (n, 2): cruce y mutación); los que no pasaron el sorteo de pc o pm no
+        dicen nada sobre el operador.
+        """
+        recompensas = recompensas_relativas(f_padres, f_hijos)
+        aplicados = np.asarray(aplicados, dtype=bool)
+        for columna, adaptacion in enumerate((self.adaptacion_cruce, self.adaptacion_mutacion)):
+            if adaptacion is not None:
+                mascara = aplicados[:, columna]
+                adaptacion.registrar(elegidos[mascara, columna], recompensas[mascara])
+
+    def _reiniciar_si_estancada(self, gen):
+        """Reinicia la población si el mejor lleva `generaciones_reinicio` sin mejorar.
+
+        Conserva el mejor histórico (en la posición 0) y los `diversos_reinicio`
+        individuos más alejados de lo conservado (distancia de Hamming), y
+        regenera el resto: con `modo_reinicio='mutacion'`, copias del mejor con
+        una mutación cataclísmica (se vuelve a sortear `FRACCION_CATACLISMO` de
+        las celdas, entre sus valores legales); con 'inicializacion', con el
+        inicializador configurado.
+
+        Returns:
+            bool: Si hubo reinicio.
+        """
+        if self.estancamiento is None or self.estancamiento.evaluar(self.best_global_f) != PARADA_ESTANCAMIENTO:
+            return False
+        if self.limite_tiempo is not None and time.monotonic() >= self.limite_tiempo:
+            return False
+        problema, pop = self.problema, self.pop
+        n = len(pop)
+        conservados = _elegir_diversos(pop, self.best_global, self.diversos_reinicio)
+        pop[1:1 + len(conservados)] = pop[conservados]
+        pop[0] = self.best_global
+
+        # La semilla `3n + 1` no se cruza con las de hijos, selección, búsqueda local ni duplicados
+        sembrar_hijo(self.semilla_hijos, gen, 3 * n + 1)
+        inicio = 1 + len(conservados)
+        if self.modo_reinicio == 'inicializacion':
+            pop[inicio:] = poblacion_inicial(dict(self.config_inmigrante, pop_size=n - inicio), problema)
+        else:
+            sortear = np.random.random((n - inicio,) + self.best_global.shape) < FRACCION_CATACLISMO
+            pop[inicio:] = np.where(sortear, sortear_en_dominio(problema.instancia.dominio, n - inicio),
+                                    self.best_global[None])
+        for i in range(inicio, n):
+            pop[i] = problema._reparar_cromosoma(pop[i])
+
+        self.fitnesses = _evaluar_poblacion(pop, problema, self.cache, self.agregados)
+        self.best_pos = 0
+        self.estancamiento.generaciones_sin_mejora = 0
+        self.reinicios.append(int(gen))
+        return True
+
+    def _controlar_parametros(self, gen):
+        """Con control adaptativo, fija pc y pm de la generación siguiente."""
+        if self.control is not None:
+            self.pc, self.pm = self.control.actualizar(gen, self.pop, self.best_global_f)
+
+    def estadisticas_operadores(self):
+        """Estadísticas por operador de las familias adaptativas ({} si no hay)."""
+        estadisticas = {}
+        if self.adaptacion_cruce is not None:
+            estadisticas["cruce"] = self.adaptacion_cruce.estadisticas()
+        if self.adaptacion_mutacion is not None:
+            estadisticas["mutacion"] = self.adaptacion_mutacion.estadisticas()
+        return estadisticas
+
+    def reporte(self):
+        """Métricas de la corrida para el resultado: caché y, si aplican, adaptación."""
+        reporte = {"cache_fitness": self.cache.estadisticas(), "duplicados": dict(self.duplicados)}
+        if self.estancamiento is not None:
+            reporte["reinicios"] = {"cantidad": len(self.reinicios), "generaciones": list(self.reinicios)}
+        estadisticas_operadores = self.estadisticas_operadores()
+        if estadisticas_operadores:
+            reporte["operadores_adaptativos"] = estadisticas_operadores
+        if self.control is not None:
+            reporte["parametros_adaptativos"] = self.control.historial
+        return reporte
+
+    def mejores(self, k):
+        """Copias de los `k` mejores individuos de la población actual."""
+        orden = np.argsort(self.fitnesses, kind='stable')[:k]
+        return self.pop[orden].copy()
+
+    def incorporar(self, inmigrantes):
+        """Reemplaza a los peores individuos por `inmigrantes` (k, P, D) ya reparados."""
+        if len(inmigrantes) == 0:
+            return
+        peores = np.argsort(self.fitnesses, kind='stable')[::-1][:len(inmigrantes)]
+        self.pop[peores] = inmigrantes[:len(peores)]
+        self.agregados.calcular(self.pop, peores)
+        self.fitnesses[peores] = self.agregados.fitness()[peores]
+        if self.best_pos in peores:
+            self.best_pos = -1
+
+        mejor = int(peores[np.argmin(self.fitnesses[peores])])
+        if self.fitnesses[mejor] < self.best_global_f:
+            self.best_global_f = self.fitnesses[mejor]
+            self.best_global = self.pop[mejor].copy()
+            self.best_pos = mejor
+
+class EvolucionEstacionaria(Evolucion):
+    """Variante de estado estacionario (steady-state) de `Evolucion`.
+
+    En lugar de reconstruir la población completa, cada paso produce un hijo
+    y lo escribe en sitio sobre una víctima (el peor individuo o el perdedor
+    de un torneo) si no es peor que ella. El hijo se evalúa de forma
+    incremental a partir de su padre y un heap de fitness permite ubicar al
+    peor sin recorrer la población. Una "generación" equivale a `pop_size`
+    pasos, para que progreso y criterios de parada sean comparables.
+
+    Args:
+        victima (str): 'peor' o 'torneo'.
+        tamano_torneo (int): Participantes del torneo de reemplazo.
+    """
+
+    def __init__(self, problema, operadores, config, semilla_hijos, victima='peor', tamano_torneo=3):
+        super().__init__(problema, operadores, config, semilla_hijos)
+        self.victima = victima
+        self.tamano_torneo = tamano_torneo
+
+    def iniciar(self, pop, num_semillas=0):
+        super().iniciar(pop, num_semillas)
+        self.hijo = np.empty_like(pop[:1])
+        self.agregados_hijo = AgregadosPoblacion(self.problema, 1)
+        self._reconstruir_heap()
+
+    def _reconstruir_heap(self):
+        # Max-heap de fitness (claves negadas) con invalidación perezosa
+        self.heap = [(-f, i) for i, f in enumerate(self.fitnesses)]
+        heapq.heapify(self.heap)
+
+    def _peor(self):
+        while True:
+            menos_f, i = self.heap[0]
+            if -menos_f == self.fitnesses[i]:
+                return i
+            heapq.heappop(self.heap)
+
+    def _elegir_victima(self):
+        if self.victima == 'torneo':
+            candidatos = random.sample(range(len(self.pop)), min(self.tamano_torneo, len(self.pop)))
+            return max(candidatos, key=lambda i: self.fitnesses[i])
+        return self._peor()
+
+    def avanzar(self, gen):
+        """Ejecuta `pop_size` pasos de reemplazo estacionario."""
+        problema, pop, hijo = self.problema, self.pop, self.hijo
+        padre = np.empty(1, dtype=np.intp)
+        creditos = []
+        for paso in range(len(pop)):
+            if self.limite_tiempo is not None and time.monotonic() >= self.limite_tiempo:
+                break
+            elegidos, ops_hijos = self._sortear_operadores(gen, paso, 1)
+            sembrar_hijo(self.semilla_hijos, gen, paso)
+            padre[0], cruzado, mutado = _generar_hijo(pop, self.fitnesses, hijo[0], problema, self.operadores,
+                                                self.pc, self.pm,
+                                                ops_hijo=None if ops_hijos is None else ops_hijos[0])
+            f = _evaluar_poblacion(hijo, problema, self.cache, self.agregados_hijo,
+                                   padres=padre, pop_padres=pop, agregados_padres=self.agregados)[0]
+            if elegidos is not None:
+                creditos.append((elegidos[0], (cruzado, mutado), self.fitnesses[padre[0]], f))
+
+            j = self._elegir_victima()
+            if f > self.fitnesses[j]:
+                continue
+            pop[j] = hijo[0]
+            self.agregados.copiar(self.agregados_hijo, 0, j)
+            self.fitnesses[j] = f
+            heapq.heappush(self.heap, (-f, j))
+            if f < self.best_global_f:
+                self.best_global_f = f
+                self.best_global = hijo[0].copy()
+                self.best_pos = j
+
+        if creditos:
+            elegidos, aplicados, f_padres, f_hijos = zip(*creditos)
+            self._acreditar_operadores(np.array(elegidos), aplicados, f_padres, f_hijos)
+        for i in self._buscar_localmente(gen):
+            heapq.heappush(self.heap, (-self.fitnesses[i], i))
+        if self._reiniciar_si_estancada(gen) or len(self.heap) > 4 * len(pop):
+            self._reconstruir_heap()
+        self._controlar_parametros(gen)
+
+    def incorporar(self, inmigrantes):
+        super().incorporar(inmigrantes)
+        self._reconstruir_heap()
+
+
+def crear_evolucion(problema, operadores, config, semilla_hijos, estrategias=None):
+    """Instancia el esquema de reemplazo pedido en `estrategias['reemplazo']`.
+
+    Valores: 'generacional' (por defecto), 'estacionario_peor' o 'estacionario_torneo'.
+    """
+    reemplazo = (estrategias or {}).get('reemplazo') or 'generacional'
+    if reemplazo == 'estacionario_peor':
+        return EvolucionEstacionaria(problema, operadores, config, semilla_hijos, victima='peor')
+    if reemplazo == 'estacionario_torneo':
+        return EvolucionEstacionaria(problema, operadores, config, semilla_hijos, victima='torneo')
+    return Evolucion(problema, operadores, config, semilla_hijos)
+
+def _elegir_diversos(pop, referencia, k):
+    """Índices de hasta `k` individuos de `pop` elegidos por máxima distancia mínima.
+
+    Selección voraz del punto más lejano: cada elegido maximiza su distancia
+    de Hamming al más cercano entre `referencia` y los ya elegidos.
+    """
+    planos = pop.reshape(len(pop), -1)
+    distancia = (planos != referencia.reshape(-1)).sum(axis=1)
+    elegidos = []
+    for _ in range(min(k, len(pop) - 1)):
+        j = int(np.argmax(distancia))
+        if distancia[j] == 0:
+            break
+        elegidos.append(j)
+        np.minimum(distancia, (planos != planos[j]).sum(axis=1), out=distancia)
+    return elegidos
+
+def _evaluar_poblacion(pop, problema, cache, agregados, padres=None, pop_padres=None, agregados_padres=None):
+    """Evalúa una población ya reparada de forma incremental cuando es posible.
+
+    Un hijo que difiere de su padre en pocas celdas (copia + mutación +
+    reparación) hereda los agregados del padre y los actualiza solo en esas
+    celdas. El resto (típicamente hijos de cruce) consulta la caché de fitness
+    y, si no está, se recalcula completo en un único lote vectorizado; los
+    clones dentro de la misma generación se evalúan una única vez. Los hijos
+    incrementales también consultan la caché, para que sus contadores reflejen
+    toda reutilización de cromosomas, pero conservan el delta: así mantienen
+    agregados válidos para sus propios hijos.
+
+    Args:
+        pop (np.ndarray): Población reparada (pop, P, D).
+        problema (ProblemaGAPropio): Instancia del problema.
+        cache (CacheFitness): Caché LRU del trabajo.
+        agregados (AgregadosPoblacion): Agregados a completar para `pop`.
+        padres (np.ndarray, optional): Índice en `pop_padres` del padre de
+            cada hijo (-1 si no tiene).
+        pop_padres (np.ndarray, optional): Población de la generación anterior.
+        agregados_padres (AgregadosPoblacion, optional): Agregados de `pop_padres`.
+
+    Returns:
+        np.ndarray: Vector de fitness de la población.
+    """
+    n = len(pop)
+    umbral = max(1, int(FRACCION_MAX_DELTA * problema.num_profesionales * problema.num_dias))
+    fitnesses = np.empty(n)
+    desde_cache = np.zeros(n, dtype=bool)
+    incrementales = []
+    pendientes = {}
+    for i, ind in enumerate(pop):
+        clave = CacheFitness.clave(ind)
+        origen = -1 if padres is None else int(padres[i])
+        if origen >= 0 and agregados_padres.validos[origen]:
+            cambios = celdas_modificadas(ind, pop_padres[origen])
+            if len(cambios[0]) <= umbral:
+                cache.obtener(clave)
+                agregados.copiar(agregados_padres, origen, i)
+                agregados.aplicar_delta(i, *cambios)
+                incrementales.append((i, clave))
+                continue
+
+        if clave in pendientes:
+            cache.registrar_acierto()
+            pendientes[clave].append(i)
+            continue
+        valor = cache.obtener(clave)
+        if valor is None:
+            pendientes[clave] = [i]
+        else:
+            # Sin agregados: sus hijos se evaluarán completos
+            fitnesses[i] = valor
+            desde_cache[i] = True
+            agregados.validos[i] = False
+
+    representantes = [indices[0] for indices in pendientes.values()]
+    agregados.calcular(pop, representantes)
+    for indices in pendientes.values():
+        for i in indices[1:]:
+            agregados.copiar(agregados, indices[0], i)
+
+    calculados = agregados.fitness()
+    fitnesses[~desde_cache] = calculados[~desde_cache]
+    for clave, indices in pendientes.items():
+        cache.guardar(clave, float(fitnesses[indices[0]]))
+    for i, clave in incrementales:
+        cache.guardar(clave, float(fitnesses[i]))
+    return fitnesses
+
+def _seleccionar_generacion(pop, fitnesses, operadores, semilla, gen):
+    """Con operadores por lotes, elige de una vez los padres de toda la generación.
+
+    Hace falta si la selección o el cruce trabajan por lotes; con selección por
+    hijo, los pares se eligen igual por adelantado en un bucle.
+
+    Returns:
+        np.ndarray | None: Pares de índices (pop, 2), o None si todo es por hijo.
+    """
+    seleccion_func, cruce_func, _ = operadores
+    if seleccion_func not in OPERADORES_LOTE and cruce_func not in OPERADORES_LOTE:
+        return None
+    # La posición `len(pop)` (ningún hijo la usa) siembra las decisiones de la generación
+    sembrar_hijo(semilla, gen, len(pop))
+    if seleccion_func in OPERADORES_LOTE:
+        return seleccion_func(pop, fitnesses, 2 * len(pop), k=3).reshape(len(pop), 2)
+    return np.array([[seleccion_func(pop, fitnesses, k=3), seleccion_func(pop, fitnesses, k=3)]
+                     for _ in range(len(pop))], dtype=np.intp)
+
+def _cruzar_generacion(pop, siguiente, inicio, seleccionados, cruce_func, pc):
+    """Cruce por lotes: escribe en `siguiente[inicio:]` todos los hijos de la generación.
+
+    Continúa el flujo aleatorio de `_seleccionar_generacion`: primero decide
+    qué hijos se cruzan (probabilidad pc) y luego arma la máscara del cruce.
+
+    Returns:
+        np.ndarray: Máscara de los hijos `inicio:` que se cruzaron.
+    """
+    pares = seleccionados[inicio:]
+    cruza = np.random.random(len(pares)) < pc
+    cruce_func(pop, pares[:, 0], pares[:, 1], siguiente[inicio:], cruza)
+    return cruza
+
+def _generar_hijo(pop, fitnesses, destino, problema, operadores, pc, pm, padres_sel=None, cruce_previo=False,
+                  ops_hijo=None):
+    """Produce un hijo reparado y lo escribe en sitio sobre `destino`.
+
+    Args:
+        pop (np.ndarray): Población actual (pop, P, D).
+        fitnesses (np.ndarray): Fitness de la población actual.
+        destino (np.ndarray): Vista (P, D) del buffer de la generación siguiente.
+        problema (ProblemaGAPropio): Instancia del problema.
+        operadores (tuple): Funciones (selección, cruce, mutación).
+        pc (float): Probabilidad de cruce.
+        pm (float): Probabilidad de mutación.
+        padres_sel (tuple, optional): Par de índices ya elegidos por una
+            selección por lotes; si falta, se seleccionan aquí.
+        cruce_previo (bool): Si `destino` ya trae el resultado de un cruce por
+            lotes, solo se muta y repara.
+        ops_hijo (tuple, optional): Par (cruce, mutación) sorteado para este
+            hijo por la selección adaptativa; reemplaza a los de `operadores`.
+
+    Returns:
+        tuple: (índice del primer padre, del que el hijo hereda los agregados de
+            fitness; si se aplicó el cruce; si se aplicó la mutación). Con
+            `cruce_previo` el cruce se informa como no aplicado: lo decidió el lote.
+    """
+    seleccion_func, cruce_func, mutacion_func = operadores
+    if ops_hijo is not None:
+        cruce_func, mutacion_func = ops_hijo
+
+    # Selección de padres por índice (sin copiar individuos)
+    # Nota: Si seleccion_ranking no usa k, el argumento extra se ignora o se maneja dentro
+    if padres_sel is not None:
+        i1, i2 = int(padres_sel[0]), int(padres_sel[1])
+    elif seleccion_func in OPERADORES_LOTE:
+        i1, i2 = (int(i) for i in seleccion_func(pop, fitnesses, 2, k=3))
+    else:
+        i1 = seleccion_func(pop, fitnesses, k=3)
+        i2 = seleccion_func(pop, fitnesses, k=3)
+
+    # Cruce (Crossover)
+    cruzado = mutado = False
+    if cruce_previo:
+        pass
+    elif random.random() < pc:
+        cruzado = True
+        if cruce_func in OPERADORES_LOTE:
+            cruce_func(pop, np.array([i1]), np.array([i2]), destino[None])
+        else:
+            cruce_func(pop[i1], pop[i2], problema.num_profesionales, problema.num_dias, out=destino,
+                       problema=problema)
+    else:
+        destino[...] = pop[i1]
+
+    # Mutación
+    if random.random() < pm:
+        mutado = True
+        destino[...] = mutacion_func(destino, problema).reshape(destino.shape)
+
+    # Reparación: Se asegura la validez de la solución antes de su evaluación
+    destino[...] = problema._reparar_cromosoma(destino)
+    return i1, cruzado, mutado
+
+def _restaurar_ids_en_reporte(reporte, ids_turnos, pedidos_desconocidos=()):
+    """Traduce a IDs de BD los turnos citados en las incidencias de preferencias.
+
+    Args:
+        reporte (dict): Salida de `ProblemaGAPropio.evaluar_detallado` (se modifica en sitio).
+        ids_turnos (list): Tabla índice denso -> ID original generada por el loader.
+        pedidos_desconocidos (list): Ternas (profesional, día, ID) de pedidos de
+            turnos fuera de la tabla; el loader los codifica con un centinela y
+            aquí se reporta el ID que pidió el usuario.
+    """
+    originales = {(p, d): t_id for p, d, t_id in pedidos_desconocidos}
+    incidentes = reporte.get("violaciones_blandas", {}).get("preferencia_turno_incumplida", [])
+    for incidente in incidentes:
+        for clave in ("pedido", "asignado"):
+            if clave in incidente:
+                incidente[clave] = int(restaurar_ids_turnos(incidente[clave], ids_turnos))
+        original = originales.get((incidente.get("profesional_id"), incidente.get("dia")))
+        if original is not None and "pedido" in incidente:
+            incidente["pedido"] = original
+
+def _reportar_avance(reporte_progreso, job_id, gen, total, fitness, porcentaje=None, diversidad=None):
     """Actualiza el estado de progreso en la memoria compartida.
 
     Args:
@@ -147,11 +847,20 @@ def _reportar_avance(reporte_progreso, job_id, gen, total, fitness):
         gen (int): Generación actual alcanzada.
         total (int): Cantidad total de generaciones programadas.
         fitness (float): Mejor valor de fitness alcanzado hasta el momento.
+        porcentaje (int, optional): Avance explícito (p. ej. fracción del
+            presupuesto de tiempo); por defecto, generaciones completadas.
+        diversidad (float, optional): Fracción de individuos distintos en la población.
     """
     if reporte_progreso is not None and job_id:
-        reporte_progreso[job_id] = {
+        if porcentaje is None:
+            porcentaje = int((gen / total) * 100)
+        avance = {
             "gen_actual": gen,
             "gen_total": total,
-            "porcentaje": int((gen / total) * 100),
+            "porcentaje": porcentaje,
             "mejor_fitness_actual": float(fitness)
-        }
\ No newline at end of file
+        }
+        if diversidad is not None:
+            avance["diversidad"] = float(diversidad)
+        # El proxy del Manager solo propaga asignaciones completas
+        reporte_progreso[job_id] = avance
\ No newline at end of file
@@ -6,15 +6,14 @@ import numpy as np
 # ==============================================
 
 def torneo_seleccion(population, fitnesses, k=3):
-    """Selecciona el mejor individuo de un subgrupo aleatorio de tamaño k."""
+    """Devuelve el índice del mejor individuo de un subgrupo aleatorio de tamaño k."""
     idx = random.sample(range(len(population)), k)
-    best_idx = min(idx, key=lambda i: fitnesses[i])
-    return population[best_idx].copy()
+    return min(idx, key=lambda i: fitnesses[i])
 
 def seleccion_ranking(population, fitnesses, k=None):
     """
     Asigna probabilidad de selección basada en el ranking (orden) del fitness,
-    evitando la dominancia excesiva de valores atípicos.
+    evitando la dominancia excesiva de valores atípicos. Devuelve un índice.
     """
     pop_size = len(population)
     
@@ -25,18 +24,50 @@ def seleccion_ranking(population, fitnesses, k=None):
     ranks = np.arange(pop_size, 0, -1)
     probs = ranks / np.sum(ranks)
     
-    selected_idx = np.random.choice(ranked_indices, p=probs)
-    return population[selected_idx].copy()
+    return int(np.random.choice(ranked_indices, p=probs))
+
+# ---------------------------------------------
+#   Selección por lotes (toda una generación)
+# ---------------------------------------------
+# Devuelven de una vez los `n` índices de padres que necesita una generación
+# (n = 2 * pop_size), con una única llamada a NumPy.
+
+def torneo_seleccion_lote(population, fitnesses, n, k=3):
+    """Torneos vectorizados: `n` ganadores de torneos de k participantes distintos."""
+    fitnesses = np.asarray(fitnesses)
+    pop_size = len(fitnesses)
+    k = max(1, min(k, pop_size))
+    # k participantes sin repetición por torneo: los k menores de claves aleatorias
+    participantes = np.argpartition(np.random.random((n, pop_size)), k - 1, axis=1)[:, :k]
+    ganador = np.argmin(fitnesses[participantes], axis=1)
+    return participantes[np.arange(n), ganador]
+
+def seleccion_ranking_lote(population, fitnesses, n, k=None):
+    """Ranking lineal vectorizado: la CDF de rangos se arma una vez y se muestrea `n` veces."""
+    fitnesses = np.asarray(fitnesses)
+    pop_size = len(fitnesses)
+    ranked_indices = np.argsort(fitnesses, kind='stable')
+    cdf = np.cumsum(np.arange(pop_size, 0, -1, dtype=float))
+    posiciones = np.searchsorted(cdf, np.random.random(n) * cdf[-1], side='right')
+    return ranked_indices[np.minimum(posiciones, pop_size - 1)]
 
 # =============================================
 #       OPERADORES DE CRUCE (CROSSOVER)
 # =============================================
+# Todos aceptan `out`: un buffer (P, D) de la generación siguiente donde se
+# escribe el hijo sin asignar memoria nueva. Sin `out`, devuelven un vector plano.
+# `problema` es opcional y solo lo usan los cruces que consultan la instancia.
 
-def crossover_block_aware(parent1, parent2, num_profesionales, num_dias):
+def _buffer_hijo(plantilla, out):
+    if out is None:
+        return np.zeros_like(plantilla)
+    return out.reshape(plantilla.shape)
+
+def crossover_block_aware(parent1, parent2, num_profesionales, num_dias, out=None, problema=None):
     """Cruce Vertical: Mantiene la estructura diaria intacta."""
     p1 = parent1.reshape(num_profesionales, num_dias)
     p2 = parent2.reshape(num_profesionales, num_dias)
-    child = np.zeros_like(p1)
+    child = _buffer_hijo(p1, out)
 
     for d in range(num_dias):
         # Hereda la columna completa (día) de uno de los padres
@@ -47,11 +78,11 @@ def crossover_block_aware(parent1, parent2, num_profesionales, num_dias):
     
     return child.reshape(-1)
 
-def crossover_horizontal(parent1, parent2, num_profesionales, num_dias):
+def crossover_horizontal(parent1, parent2, num_profesionales, num_dias, out=None, problema=None):
     """Cruce Horizontal: Mantiene la historia completa del profesional."""
     p1 = parent1.reshape(num_profesionales, num_dias)
     p2 = parent2.reshape(num_profesionales, num_dias)
-    child = np.zeros_like(p1)
+    child = _buffer_hijo(p1, out)
 
     for p in range(num_profesionales):
         # Hereda la fila completa (historial del médico) de uno de los padres
@@ -62,56 +93,169 @@ def crossover_horizontal(parent1, parent2, num_profesionales, num_dias):
             
     return child.reshape(-1)
 
-def crossover_two_point(parent1, parent2, num_profesionales, num_dias):
+def crossover_two_point(parent1, parent2, num_profesionales, num_dias, out=None, problema=None):
     """Cruce Estándar de 2 Puntos: Corte genérico en el vector."""
-    size = len(parent1)
+    v1 = parent1.reshape(-1)
+    v2 = parent2.reshape(-1)
+    size = len(v1)
     cx1 = random.randint(0, size - 2)
     cx2 = random.randint(cx1 + 1, size - 1)
     
-    child = parent1.copy()
-    child[cx1:cx2] = parent2[cx1:cx2]
+    child = _buffer_hijo(v1, None if out is None else out.reshape(-1))
+    child[:] = v1
+    child[cx1:cx2] = v2[cx1:cx2]
     
     return child
 
+def crossover_cobertura(parent1, parent2, num_profesionales, num_dias, out=None, problema=None):
+    """Cruce Horizontal que preserva la cobertura (día, turno, skill).
+
+    Cada profesional hereda su fila completa de uno de los padres, como en el
+    cruce horizontal. Luego, en cada (día, skill) donde la mezcla dejó turnos
+    con exceso o déficit respecto de los requerimientos, se reasignan
+    profesionales del mismo grupo de skill: primero los que tenían un turno
+    sobrante y en el otro padre cubrían el turno faltante, luego cualquier
+    sobrante y por último libres, siempre dentro del dominio de turnos legales
+    de cada profesional (`instancia.dominio`). Los excesos que
+    quedan vuelven al valor del otro padre o a libre. El hijo llega casi
+    factible y la reparación tiene mucho menos trabajo.
+
+    Sin `problema` se comporta como un cruce horizontal simple.
+    """
+    p1 = parent1.reshape(num_profesionales, num_dias)
+    p2 = parent2.reshape(num_profesionales, num_dias)
+    child = _buffer_hijo(p1, out)
+    toma_p1 = np.random.random(num_profesionales) < 0.5
+    child[...] = np.where(toma_p1[:, None], p1, p2)
+    if problema is None:
+        return child.reshape(-1)
+
+    inst = problema.instancia
+    otro = np.where(toma_p1[:, None], p2, p1)
+    desvio = inst.contar_cobertura(child) - inst.requerimientos
+    desvio[:, 0, :] = 0
+    grupos = [np.flatnonzero(inst.skill_prof == k) for k in range(inst.num_skills)]
+    # Los grupos (día, skill) son chicos: se corrigen con listas de Python
+    for d, k in np.argwhere((desvio != 0).any(axis=1)).tolist():
+        grupo = grupos[k]
+        valores = child[grupo, d].tolist()
+        _equilibrar_dia_skill(valores, otro[grupo, d].tolist(), inst.dominio[grupo, d].tolist(),
+                              desvio[d, :, k].tolist())
+        child[grupo, d] = valores
+    return child.reshape(-1)
+
+
+def _equilibrar_dia_skill(valores, otros, legal, desvio):
+    """Corrige en sitio los valores de un grupo (día, skill) según `desvio` (conteo - requerido).
+
+    `legal[i][t]` es el dominio del profesional i ese día: solo se le asignan turnos legales.
+    """
+    n = len(desvio)
+
+    def sobra(i):
+        return 0 < valores[i] < n and desvio[valores[i]] > 0
+
+    # Candidatos calculados una vez; la condición de sobrante se revisa al usarlos
+    sobrantes = [i for i in range(len(valores)) if sobra(i)]
+    libres = [i for i in range(len(valores)) if valores[i] == 0]
+
+    for t in range(1, n):
+        while desvio[t] < 0:
+            # Prioridad: sobrante que en el otro padre tenía t > sobrante legal > libre legal
+            pos = next((i for i in sobrantes if otros[i] == t and legal[i][t] and sobra(i)), None)
+            if pos is None:
+                pos = next((i for i in sobrantes if legal[i][t] and sobra(i)), None)
+            if pos is not None:
+                sobrantes.remove(pos)
+                desvio[valores[pos]] -= 1
+            else:
+                pos = next((i for i in libres if legal[i][t]), None)
+                if pos is None:
+                    break
+                libres.remove(pos)
+            valores[pos] = t
+            desvio[t] += 1
+
+    # Excesos restantes: vuelven al valor del otro padre si cubre un faltante, si no a libre
+    for i in sobrantes:
+        if sobra(i):
+            desvio[valores[i]] -= 1
+            alternativa = otros[i]
+            if 0 < alternativa < n and desvio[alternativa] < 0 and legal[i][alternativa]:
+                valores[i] = alternativa
+                desvio[alternativa] += 1
+            else:
+                valores[i] = 0
+
+def crossover_adaptativo(parent1, parent2, num_profesionales, num_dias, out=None, problema=None):
+    """Cruce Adaptativo: uno de los cruces por hijo.
+
+    Dentro del motor el cruce de cada hijo lo sortea `adaptacion.SeleccionAdaptativa`
+    según su éxito en la corrida; llamado directamente, elige uno al azar.
+    """
+    cruce = random.choice(list(CRUCES_HIBRIDOS.values()))
+    return cruce(parent1, parent2, num_profesionales, num_dias, out=out, problema=problema)
+
+# ---------------------------------------------
+#   Cruce por lotes (toda una generación)
+# ---------------------------------------------
+# Reciben los arreglos de índices de padres de la generación y escriben todos
+# los hijos directamente en `out` (vista (n, P, D) del buffer siguiente) con una
+# única máscara aleatoria. Los hijos con `cruza` en False copian al padre 1.
+
+def crossover_vertical_lote(pop, padres1, padres2, out, cruza=None):
+    """Cruce vertical por lotes: una máscara (n, D) elige el padre de cada día."""
+    mascara = np.random.random((len(padres1), pop.shape[2])) < 0.5
+    if cruza is not None:
+        mascara[~cruza] = True
+    np.copyto(out, pop[padres2])
+    np.copyto(out, pop[padres1], where=mascara[:, None, :])
+    return out
+
+def crossover_horizontal_lote(pop, padres1, padres2, out, cruza=None):
+    """Cruce horizontal por lotes: una máscara (n, P) elige el padre de cada profesional."""
+    mascara = np.random.random((len(padres1), pop.shape[1])) < 0.5
+    if cruza is not None:
+        mascara[~cruza] = True
+    np.copyto(out, pop[padres2])
+    np.copyto(out, pop[padres1], where=mascara[:, :, None])
+    return out
+
 # =====================================
 #       OPERADORES DE MUTACIÓN
 # =====================================
 
 def mutate_reassign_shift(sol, problema, max_attempts=20):
-    """Intenta mover un turno de un profesional a otro en el mismo día."""
+    """Intenta mover un turno de un profesional a otro en el mismo día.
+
+    El receptor se elige entre los del mismo skill con el turno en su dominio,
+    bajo su T_max y sin generar secuencias prohibidas.
+    """
+    inst = problema.instancia
     matriz = sol.reshape(problema.num_profesionales, problema.num_dias).copy()
     
     # Solo días con asignaciones
-    dias_activos = [d for d in range(problema.num_dias) if (matriz[:, d] > 0).any()]
-    if not dias_activos: return sol
+    dias_activos = np.flatnonzero((matriz > 0).any(axis=0))
+    if len(dias_activos) == 0: return sol
     
-    d = random.choice(dias_activos)
-    profs_en_turno = [p for p in range(problema.num_profesionales) if matriz[p, d] > 0]
-    if not profs_en_turno: return sol
-
-    p_origen = random.choice(profs_en_turno)
+    d = int(random.choice(dias_activos))
+    profs_en_turno = np.flatnonzero(matriz[:, d] > 0)
+    p_origen = int(random.choice(profs_en_turno))
     turno = int(matriz[p_origen, d])
 
-    # Buscar receptor válido
-    candidatos = []
-    for p in range(problema.num_profesionales):
-        if p == p_origen: continue
-        # Validaciones rápidas: Skill, Disponibilidad, Max Horas
-        if problema.info_profesionales[p]['skill'] != problema.info_profesionales[p_origen]['skill']: continue
-        if not bool(problema.matriz_disponibilidad[p, d]): continue
-        if int((matriz[p] > 0).sum()) >= int(problema.info_profesionales[p]['t_max']): continue
-        
-        # Validación de Secuencias
-        prev = int(matriz[p, d-1]) if d > 0 else 0
-        nxt = int(matriz[p, d+1]) if d < problema.num_dias - 1 else 0
-        if (prev, turno) in problema.secuencias_prohibidas: continue
-        if (turno, nxt) in problema.secuencias_prohibidas: continue
-        
-        candidatos.append(p)
-        if len(candidatos) >= max_attempts: break
-
-    if candidatos:
-        p_destino = random.choice(candidatos)
+    # Buscar receptor válido: Skill, Dominio (disponibilidad y turno), Max Turnos y Secuencias
+    prev = matriz[:, d-1] if d > 0 else np.zeros(problema.num_profesionales, dtype=np.intp)
+    nxt = matriz[:, d+1] if d < problema.num_dias - 1 else np.zeros(problema.num_profesionales, dtype=np.intp)
+    valido = ((inst.skill_prof == inst.skill_prof[p_origen]) &
+              inst.dominio[:, d, turno] &
+              ((matriz > 0).sum(axis=1) < inst.t_max) &
+              ~inst.prohibida[prev, turno] &
+              ~inst.prohibida[turno, nxt])
+    valido[p_origen] = False
+    candidatos = np.flatnonzero(valido)[:max_attempts]
+
+    if len(candidatos):
+        p_destino = int(random.choice(candidatos))
         matriz[p_origen, d] = 0
         matriz[p_destino, d] = turno
 
@@ -119,62 +263,63 @@ def mutate_reassign_shift(sol, problema, max_attempts=20):
 
 def mutate_swap_same_day(sol, problema):
     """Intercambia los turnos de dos profesionales en el mismo día."""
+    inst = problema.instancia
     matriz = sol.reshape(problema.num_profesionales, problema.num_dias).copy()
     d = random.randint(0, problema.num_dias - 1)
     
     p1, p2 = random.sample(range(problema.num_profesionales), 2)
     t1, t2 = int(matriz[p1, d]), int(matriz[p2, d])
 
-    if not (bool(problema.matriz_disponibilidad[p1, d]) and bool(problema.matriz_disponibilidad[p2, d])):
+    # Cada uno debe poder tomar el turno del otro (dominio: disponibilidad, turno y skill)
+    if not (inst.dominio[p1, d, t2] and inst.dominio[p2, d, t1]):
         return sol
 
     # Función auxiliar para chequear secuencias
     def check_seq(p, dia, t_new):
         prev = int(matriz[p, dia-1]) if dia > 0 else 0
         nxt = int(matriz[p, dia+1]) if dia < problema.num_dias - 1 else 0
-        return ((prev, t_new) not in problema.secuencias_prohibidas and 
-                (t_new, nxt) not in problema.secuencias_prohibidas)
+        return not (inst.prohibida[prev, t_new] or inst.prohibida[t_new, nxt])
 
-    # Validar secuencias y límites de horas
+    # Validar secuencias y límites de turnos
     if check_seq(p1, d, t2) and check_seq(p2, d, t1):
         # Chequeo simple de T_max (solo si cambia estado libre/ocupado)
         def count(p, t_old, t_new):
             c = int((matriz[p] > 0).sum())
             return c - (1 if t_old > 0 else 0) + (1 if t_new > 0 else 0)
             
-        if (count(p1, t1, t2) <= problema.info_profesionales[p1]['t_max'] and 
-            count(p2, t2, t1) <= problema.info_profesionales[p2]['t_max']):
-            
+        if count(p1, t1, t2) <= inst.t_max[p1] and count(p2, t2, t1) <= inst.t_max[p2]:
             matriz[p1, d], matriz[p2, d] = t2, t1
 
     return matriz.reshape(-1)
 
 def mutate_flip(sol, problema):
-    """Cambia el valor de una celda aleatoria por otro turno válido o libre."""
+    """Cambia el valor de una celda aleatoria por otro valor de su dominio (turno legal o libre)."""
+    inst = problema.instancia
     matriz = sol.reshape(problema.num_profesionales, problema.num_dias).copy()
     p = random.randint(0, problema.num_profesionales - 1)
     d = random.randint(0, problema.num_dias - 1)
     
-    if not bool(problema.matriz_disponibilidad[p, d]): return sol
+    if not inst.disponible[p, d]: return sol
     
-    posibles = [0] + problema.turnos_a_cubrir[:]
+    posibles = np.flatnonzero(inst.dominio[p, d]).tolist()
     random.shuffle(posibles)
 
+    prev = int(matriz[p, d-1]) if d > 0 else 0
+    nxt = int(matriz[p, d+1]) if d < problema.num_dias - 1 else 0
     for turno in posibles:
-        prev = int(matriz[p, d-1]) if d > 0 else 0
-        nxt = int(matriz[p, d+1]) if d < problema.num_dias - 1 else 0
-        
-        if (prev, turno) not in problema.secuencias_prohibidas and \
-           (turno, nxt) not in problema.secuencias_prohibidas:
+        if not (inst.prohibida[prev, turno] or inst.prohibida[turno, nxt]):
             matriz[p, d] = turno
             break
             
     return matriz.reshape(-1)
 
 def aplicar_mutaciones(sol, problema):
-    """Selecciona aleatoriamente una de las estrategias de mutación disponibles."""
-    ops = [mutate_reassign_shift, mutate_swap_same_day, mutate_flip]
-    return random.choice(ops)(sol, problema)
+    """Selecciona aleatoriamente una de las estrategias de mutación disponibles.
+
+    Dentro del motor la elección no es uniforme: `adaptacion.SeleccionAdaptativa`
+    sortea el operador de cada hijo según su éxito en la corrida.
+    """
+    return random.choice(list(MUTACIONES_HIBRIDAS.values()))(sol, problema)
 
 
 # =====================================
@@ -183,13 +328,19 @@ def aplicar_mutaciones(sol, problema):
 
 SELECTION_OPS = {
     "torneo_deterministico": torneo_seleccion,
-    "ranking_lineal": seleccion_ranking
+    "ranking_lineal": seleccion_ranking,
+    "torneo_vectorizado": torneo_seleccion_lote,
+    "ranking_vectorizado": seleccion_ranking_lote
 }
 
 CROSSOVER_OPS = {
     "bloques_verticales": crossover_block_aware,
     "bloques_horizontales": crossover_horizontal,
-    "dos_puntos": crossover_two_point
+    "dos_puntos": crossover_two_point,
+    "horizontal_cobertura": crossover_cobertura,
+    "adaptativo": crossover_adaptativo,
+    "bloques_verticales_vectorizado": crossover_vertical_lote,
+    "bloques_horizontales_vectorizado": crossover_horizontal_lote
 }
 
 MUTATION_OPS = {
@@ -197,4 +348,15 @@ MUTATION_OPS = {
     "reasignar_turno": mutate_reassign_shift,
     "intercambio_dia": mutate_swap_same_day,
     "flip_simple": mutate_flip
-}
\ No newline at end of file
+}
+
+# Operadores que trabajan sobre la generación completa; el motor los invoca
+# una vez por generación en lugar de una vez por hijo.
+OPERADORES_LOTE = {torneo_seleccion_lote, seleccion_ranking_lote,
+                   crossover_vertical_lote, crossover_horizontal_lote}
+
+# Operadores entre los que eligen el cruce adaptativo y la mutación híbrida
+CRUCES_HIBRIDOS = {nombre: CROSSOVER_OPS[nombre] for nombre in
+                   ("bloques_verticales", "bloques_horizontales", "dos_puntos", "horizontal_cobertura")}
+MUTACIONES_HIBRIDAS = {nombre: MUTATION_OPS[nombre] for nombre in
+                       ("reasignar_turno", "intercambio_dia", "flip_simple")}
@@ -0,0 +1,77 @@
+"""Criterios de parada del Algoritmo Genético.
+
+Además del presupuesto de generaciones, una corrida puede terminar antes
+por alcanzar un fitness objetivo, por estancamiento (muchas generaciones
+seguidas sin una mejora relativa significativa del mejor histórico) o por
+agotar su presupuesto de tiempo de reloj (modo "anytime").
+"""
+
+import time
+
+# Motivos de parada que se informan en el resultado (`criterio_parada`).
+PARADA_GENERACIONES = "generaciones"
+PARADA_OBJETIVO = "fitness_objetivo"
+PARADA_ESTANCAMIENTO = "estancamiento"
+PARADA_TIEMPO = "tiempo_maximo"
+
+
+class CriterioParada:
+    """Decide, generación a generación, si la corrida debe terminar.
+
+    Args:
+        config (dict): Parámetros del GA. Usa max_generaciones_sin_mejora
+            (None lo deshabilita), fitness_objetivo (None lo deshabilita) y
+            tolerancia_mejora, la mejora relativa mínima para reiniciar la
+            ventana de estancamiento (0 cuenta cualquier mejora), y
+            tiempo_maximo_seg (None lo deshabilita), medido desde la creación.
+    """
+
+    def __init__(self, config):
+        self.max_sin_mejora = config.get('max_generaciones_sin_mejora')
+        self.fitness_objetivo = config.get('fitness_objetivo')
+        self.tolerancia = config.get('tolerancia_mejora') or 0.0
+        self.tiempo_maximo = config.get('tiempo_maximo_seg')
+        self.inicio = time.monotonic()
+        self.referencia = None
+        self.generaciones_sin_mejora = 0
+
+    @property
+    def limite_tiempo(self):
+        """Instante (`time.monotonic`) en que se agota el presupuesto, o None."""
+        if self.tiempo_maximo is None:
+            return None
+        return self.inicio + self.tiempo_maximo
+
+    def tiempo_agotado(self):
+        limite = self.limite_tiempo
+        return limite is not None and time.monotonic() >= limite
+
+    def porcentaje_tiempo(self):
+        """Porcentaje del presupuesto de tiempo consumido (None si no hay presupuesto)."""
+        if not self.tiempo_maximo:
+            return None
+        return min(100, int((time.monotonic() - self.inicio) / self.tiempo_maximo * 100))
+
+    def evaluar(self, mejor_fitness, generaciones=1):
+        """Registra el mejor fitness tras `generaciones` más y devuelve el motivo de parada o None."""
+        mejor_fitness = float(mejor_fitness)
+        if self.fitness_objetivo is not None and mejor_fitness <= self.fitness_objetivo:
+            return PARADA_OBJETIVO
+        if self.tiempo_agotado():
+            return PARADA_TIEMPO
+
+        if self.referencia is None or self._mejora_significativa(mejor_fitness):
+            self.referencia = mejor_fitness
+            self.generaciones_sin_mejora = 0
+            return None
+
+        self.generaciones_sin_mejora += generaciones
+        if self.max_sin_mejora and self.generaciones_sin_mejora >= self.max_sin_mejora:
+            return PARADA_ESTANCAMIENTO
+        return None
+
+    def _mejora_significativa(self, mejor_fitness):
+        mejora = self.referencia - mejor_fitness
+        if mejora <= 0:
+            return False
+        return mejora > self.tolerancia * abs(self.referencia)
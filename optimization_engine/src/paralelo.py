@@ -0,0 +1,175 @@
+"""Generación de hijos en paralelo dentro de un único trabajo del GA.
+
+El proceso maestro conserva la selección del mejor, la caché y la
+evaluación incremental; los procesos trabajadores generan, mutan y reparan
+los hijos de la generación siguiente. La instancia compilada, ambos buffers
+de población y el vector de fitness viven en `multiprocessing.shared_memory`,
+por lo que en cada generación solo viajan índices entre procesos.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+from .instancia import InstanciaCompilada
+from .utils import sembrar_hijo
+
+# Arreglos de InstanciaCompilada que se comparten con los trabajadores.
+CAMPOS_INSTANCIA = ('requerimientos', 'duracion', 'es_noche', 'no_habil', 'skill_prof',
+                    'prohibida', 'disponible', 'preferencias', 't_min', 't_max', 'turnos', 'dominio')
+
+# Estado propio de cada proceso trabajador (se completa en `_inicializar_trabajador`).
+_TRABAJADOR = {}
+
+
+def _crear_compartido(arreglo):
+    """Copia `arreglo` a un bloque de memoria compartida nuevo.
+
+    Returns:
+        tuple: (SharedMemory, vista np.ndarray, descriptor (nombre, forma, dtype)).
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arreglo.nbytes))
+    vista = np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=shm.buf)
+    vista[...] = arreglo
+    return shm, vista, (shm.name, arreglo.shape, arreglo.dtype.str)
+
+
+def _adjuntar_compartido(descriptor, bloques, tracker_propio):
+    """Abre desde un trabajador el bloque descrito y devuelve una vista sobre él."""
+    nombre, forma, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=nombre)
+    if tracker_propio:
+        # El maestro es el dueño del bloque: el trabajador no debe liberarlo al salir.
+        # (Con 'fork' el tracker es el del maestro y el registro no se duplica.)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    bloques.append(shm)
+    return np.ndarray(forma, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _inicializar_trabajador(datos_procesados, descriptor_instancia, descriptores_buffers,
+                            descriptor_fitness, operadores, generar_hijo, tracker_propio):
+    from .problema import ProblemaGAPropio
+
+    bloques = []
+
+    def adjuntar(descriptor):
+        return _adjuntar_compartido(descriptor, bloques, tracker_propio)
+
+    escalares, arreglos = descriptor_instancia
+    tablas = {campo: adjuntar(desc) for campo, desc in arreglos.items()}
+    instancia = InstanciaCompilada(**escalares, **tablas)
+
+    _TRABAJADOR.update(
+        problema=ProblemaGAPropio(**datos_procesados, instancia=instancia),
+        buffers=[adjuntar(desc) for desc in descriptores_buffers],
+        fitnesses=adjuntar(descriptor_fitness),
+        operadores=operadores,
+        generar_hijo=generar_hijo,
+        bloques=bloques,
+    )
+
+
+def _generar_tramo(gen, indices, pc, pm, semilla, seleccionados=None, cruce_previo=False, ops_hijos=None):
+    """Genera en el segundo buffer los hijos `indices`.
+
+    Devuelve por hijo la terna (padre, cruce aplicado, mutación aplicada).
+    """
+    estado = _TRABAJADOR
+    pop, siguiente = estado['buffers']
+    hijos = []
+    for pos, i in enumerate(indices):
+        sembrar_hijo(semilla, gen, i)
+        hijos.append(estado['generar_hijo'](pop, estado['fitnesses'], siguiente[i],
+                                             estado['problema'], estado['operadores'], pc, pm,
+                                             None if seleccionados is None else seleccionados[pos],
+                                             cruce_previo, None if ops_hijos is None else ops_hijos[pos]))
+    return hijos
+
+
+class GeneracionParalela:
+    """Pool de procesos que produce los hijos de cada generación en paralelo.
+
+    Args:
+        problema (ProblemaGAPropio): Instancia del problema (se comparte su `instancia`).
+        datos_procesados (dict): Salida del loader, para reconstruir el problema en cada trabajador.
+        operadores (tuple): Funciones (selección, cruce, mutación).
+        generar_hijo (callable): Función que produce un hijo en sitio (`motor_ga._generar_hijo`).
+        pop (np.ndarray): Población (pop, P, D), para dimensionar los buffers compartidos.
+        num_workers (int): Cantidad de procesos trabajadores.
+    """
+
+    def __init__(self, problema, datos_procesados, operadores, generar_hijo, pop, num_workers):
+        self.num_workers = num_workers
+        self._bloques = []
+
+        inst = problema.instancia
+        escalares = {'num_profesionales': inst.num_profesionales, 'num_dias': inst.num_dias,
+                     'valor_max': inst.valor_max, 'skills': inst.skills}
+        arreglos = {}
+        for campo in CAMPOS_INSTANCIA:
+            arreglos[campo] = self._compartir(np.ascontiguousarray(getattr(inst, campo)))[1]
+
+        vista_a, desc_a = self._compartir(np.empty_like(pop))
+        vista_b, desc_b = self._compartir(np.empty_like(pop))
+        self.buffers = (vista_a, vista_b)
+        self.fitnesses, desc_fitness = self._compartir(np.zeros(len(pop)))
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_inicializar_trabajador,
+            initargs=(datos_procesados, (escalares, arreglos), (desc_a, desc_b),
+                      desc_fitness, operadores, generar_hijo,
+                      multiprocessing.get_start_method() != 'fork'),
+        )
+
+    def _compartir(self, arreglo):
+        shm, vista, descriptor = _crear_compartido(arreglo)
+        self._bloques.append(shm)
+        return vista, descriptor
+
+    def generar(self, gen, pop, fitnesses, siguiente, inicio, pc, pm, semilla, seleccionados=None,
+                cruce_previo=False, ops_hijos=None):
+        """Genera en `siguiente` los hijos `inicio..pop-1` repartidos entre los trabajadores.
+
+        `seleccionados` (pop, 2) trae los padres ya elegidos por una selección
+        por lotes en el maestro; cada trabajador recibe solo los de su tramo.
+        Con `cruce_previo`, `siguiente` ya trae los hijos cruzados por lotes y
+        los trabajadores solo mutan y reparan. `ops_hijos` trae el par
+        (cruce, mutación) que la selección adaptativa sorteó para cada hijo.
+
+        La población actual se copia al primer buffer compartido y los hijos se
+        leen del segundo; ambas copias son O(pop * P * D) bytes, despreciables
+        frente a la reparación.
+
+        Returns:
+            tuple: (índice del padre de cada hijo generado, en orden; arreglo
+                (n, 2) con si a cada hijo se le aplicó el cruce y la mutación).
+        """
+        origen, destino = self.buffers
+        origen[...] = pop
+        if cruce_previo:
+            destino[inicio:] = siguiente[inicio:]
+        self.fitnesses[:] = fitnesses
+        tramos = [t for t in np.array_split(np.arange(inicio, len(pop)), self.num_workers) if len(t)]
+        futuros = [self._executor.submit(_generar_tramo, gen, t.tolist(), pc, pm, semilla,
+                                         None if seleccionados is None else seleccionados[t],
+                                         cruce_previo,
+                                         None if ops_hijos is None else [ops_hijos[i] for i in t])
+                   for t in tramos]
+        hijos = []
+        for futuro in futuros:
+            hijos.extend(futuro.result())
+        siguiente[inicio:] = destino[inicio:]
+        padres = [padre for padre, _, _ in hijos]
+        return padres, np.array([aplicado for _, *aplicado in hijos], dtype=bool).reshape(-1, 2)
+
+    def cerrar(self):
+        """Detiene los trabajadores y libera la memoria compartida."""
+        self._executor.shutdown(wait=True)
+        self.buffers = self.fitnesses = None
+        for shm in self._bloques:
+            shm.close()
+            shm.unlink()
+        self._bloques = []
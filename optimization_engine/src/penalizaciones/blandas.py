@@ -32,23 +32,71 @@ class PenalizacionesBlandasMixin:
 
     
 
+    def _calcular_score_equidad_lote(self, horas_por_individuo, tolerancia):
+        """
+        Versión por lotes de `_calcular_score_equidad` para una matriz
+        de horas de forma (pop, P). Devuelve un vector de penalizaciones.
+
+        """
+        n = horas_por_individuo.shape[0]
+        if self.num_profesionales == 0:
+            return np.zeros(n)
+
+        if tolerancia <= 0:
+            return np.array([self._calcular_score_equidad(h, tolerancia)
+                             for h in horas_por_individuo])
+
+        h_avg = horas_por_individuo.mean(axis=1, keepdims=True)
+        # Interpolación triangular (h_min, 0) - (h_avg, 1) - (h_max, 0)
+        scores = np.clip(1.0 - np.abs(horas_por_individuo - h_avg) / tolerancia, 0.0, 1.0)
+        penalizacion = 1.0 - scores.mean(axis=1)
+        return np.where(h_avg[:, 0] == 0, 0.0, penalizacion)
+
+    def _calcular_pen_equidad_general_lote(self, pop):
+        """
+        Versión por lotes de `_calcular_pen_equidad_general`
+        sobre un tensor (pop, P, D).
+
+        """
+        horas = self.instancia.horas_lote(pop)
+        return self._calcular_score_equidad_lote(horas, self.tolerancia_equidad_general)
+
+    def _calcular_pen_equidad_dificiles_lote(self, pop):
+        """
+        Versión por lotes de `_calcular_pen_equidad_dificiles`
+        sobre un tensor (pop, P, D).
+
+        """
+        horas = self.instancia.horas_lote(pop, dificiles=True)
+        return self._calcular_score_equidad_lote(horas, self.tolerancia_equidad_dificil)
+
+    def _calcular_pen_pdl_lote(self, pop):
+        """
+        Versión por lotes de `_calcular_pen_pdl` sobre un tensor (pop, P, D).
+
+        """
+        prefiere_libre = (self.instancia.preferencias == -1)[None]
+        return (prefiere_libre & (pop != 0)).sum(axis=(1, 2)).astype(float)
+
+    def _calcular_pen_pte_lote(self, pop):
+        """
+        Versión por lotes de `_calcular_pen_pte` sobre un tensor (pop, P, D).
+
+        """
+        alpha = self.pesos_fitness.get('alpha_pte', 0.5)
+        pref = self.instancia.preferencias[None]
+        pide_turno = pref > 0
+        incorrecto = pide_turno & (pop != 0) & (pop != pref)
+        no_asignado = pide_turno & (pop == 0)
+        return incorrecto.sum(axis=(1, 2)) + alpha * no_asignado.sum(axis=(1, 2))
+
     def _calcular_pen_equidad_general(self, matriz):
         """
         Calcula la penalización de equidad general basada en
         el total de horas trabajadas por cada profesional.
 
         """
-        horas_por_profesional = np.zeros(self.num_profesionales)
-        
-        for p in range(self.num_profesionales):
-            total_horas_p = 0.0
-            for d in range(self.num_dias):
-                turno = int(matriz[p, d]) 
-                if turno > 0:
-                    total_horas_p += self.duracion_turnos.get(turno, 0)
-            
-            horas_por_profesional[p] = total_horas_p
-        
+        horas_por_profesional = self.instancia.horas_lote(matriz[None])[0]
         return self._calcular_score_equidad(
             horas_por_profesional, 
             self.tolerancia_equidad_general
@@ -61,22 +109,7 @@ class PenalizacionesBlandasMixin:
         (noches, fines de semana, feriados).
         
         """
-        horas_dificiles_por_prof = np.zeros(self.num_profesionales)
-        
-        for p in range(self.num_profesionales):
-            total_horas_dificiles = 0.0
-            for d in range(self.num_dias):
-                turno = int(matriz[p, d]) 
-                
-                if turno > 0:
-                    es_finde_o_feriado = (d in self.dias_no_habiles)
-                    es_turno_noche = (turno in self.turnos_noche)
-                    
-                    if es_finde_o_feriado or es_turno_noche:
-                        total_horas_dificiles += self.duracion_turnos.get(turno, 0)
-            
-            horas_dificiles_por_prof[p] = total_horas_dificiles
-
+        horas_dificiles_por_prof = self.instancia.horas_lote(matriz[None], dificiles=True)[0]
         return self._calcular_score_equidad(
             horas_dificiles_por_prof, 
             self.tolerancia_equidad_dificil
@@ -91,7 +124,7 @@ class PenalizacionesBlandasMixin:
         """
         
         # Dónde se pidió libre? (Preferencia == -1)
-        prefiere_libre = (self.matriz_preferencias == -1)
+        prefiere_libre = (self.instancia.preferencias == -1)
         # Dónde se asignó trabajo? (Asignación != 0)
         trabaja_asignado = (matriz != 0)
         violaciones_mask = prefiere_libre & trabaja_asignado
@@ -110,20 +143,20 @@ class PenalizacionesBlandasMixin:
         y no se le asignó.
        
         """
+        if not detallar:
+            return float(self._calcular_pen_pte_lote(matriz[None])[0])
+
+        alpha = self.pesos_fitness.get('alpha_pte', 0.5) 
+        pref = self.instancia.preferencias
         penalizacion = 0.0
         incidentes = []
-        alpha = self.pesos_fitness.get('alpha_pte', 0.5) 
-        
-        for p in range(self.num_profesionales):
-            for d in range(self.num_dias):
-                pref = self.matriz_preferencias[p, d]
-                asign = matriz[p, d]
-                if pref > 0:
-                    if asign != 0 and asign != pref:
-                        penalizacion += 1.0
-                        if detallar: incidentes.append({"profesional_id": p, "dia": d, "tipo": "turno_incorrecto", "pedido": int(pref), "asignado": int(asign)})
-                    elif asign == 0:
-                        penalizacion += alpha
-                        if detallar: incidentes.append({"profesional_id": p, "dia": d, "tipo": "no_asignado", "pedido": int(pref)})
+        for p, d in np.argwhere(pref > 0):
+            pedido, asign = pref[p, d], matriz[p, d]
+            if asign != 0 and asign != pedido:
+                penalizacion += 1.0
+                incidentes.append({"profesional_id": int(p), "dia": int(d), "tipo": "turno_incorrecto", "pedido": int(pedido), "asignado": int(asign)})
+            elif asign == 0:
+                penalizacion += alpha
+                incidentes.append({"profesional_id": int(p), "dia": int(d), "tipo": "no_asignado", "pedido": int(pedido)})
                         
-        return (penalizacion, incidentes) if detallar else penalizacion
\ No newline at end of file
+        return penalizacion, incidentes
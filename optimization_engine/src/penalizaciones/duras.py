@@ -46,47 +46,19 @@ class PenalizacionesDurasMixin:
         requerida para un nivel de habilidad.
 
         """
-        penalizacion = 0.0
-        incidentes = []
-        
-        # Iteramos por cada día del mes
-        for d in range(self.num_dias):
-            # Iteramos por cada turno
-            for s in self.turnos_a_cubrir:
-                # Iteramos por cada habilidad
-                for k in self.skills_a_cubrir:
-                    
-                    # Cuánto se REQUIERE
-                    requerido = self.requerimientos_cobertura[d][s][k]
-                    # Si no se requiere nadie, continuamos
-                    if requerido == 0:
-                        continue
-                        
-                    # Cuánto se ASIGNÓ
-                    asignado = 0
-                    for p in range(self.num_profesionales):
-                        
-                        # Verificamos si el profesional 'p' está en este turno 's'
-                        esta_en_turno = (matriz[p, d] == s)
-                        # Verificamos si tiene la habilidad 'k'
-                        tiene_habilidad = (self.info_profesionales[p]['skill'] == k)
-                        
-                        if esta_en_turno and tiene_habilidad:
-                            asignado += 1
-                            
-                    # Comparamos y penalizamos el déficit
-                    if asignado < requerido:
-                        faltantes = requerido - asignado
-                        # MULTIPLICADOR NUCLEAR: 100.000 puntos por cada turno descubierto
-                        penalizacion += (faltantes * 100000.0)
-                        if detallar:
-                            incidentes.append({
-                                "dia": d,
-                                "turno": s,
-                                "skill": k,
-                                "requerido": requerido,
-                                "asignado": asignado,
-                                "faltantes": faltantes
-                        })
-                        
-        return (penalizacion, incidentes) if detallar else penalizacion
+        conteos = self.instancia.contar_cobertura(matriz)
+        faltantes_total = int(np.maximum(0, self.instancia.requerimientos - conteos).sum())
+        penalizacion = faltantes_total * self.PENALIZACION_DURA
+
+        if detallar: return penalizacion, faltantes_total
+        return penalizacion
+
+
+    def _calcular_pen_cobertura_lote(self, pop):
+        """
+        Versión por lotes de `_calcular_pen_cobertura`
+        sobre un tensor (pop, P, D).
+
+        """
+        conteos = self.instancia.contar_cobertura_lote(pop)
+        return self.instancia.deficit_lote(conteos) * float(self.PENALIZACION_DURA)
@@ -4,6 +4,7 @@ import json
 from .penalizaciones.duras import PenalizacionesDurasMixin
 from .penalizaciones.blandas import PenalizacionesBlandasMixin
 from .repair import reparar_cromosoma
+from .instancia import compilar_instancia
 
 class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
     """Representa la instancia del problema de planificación de guardias (NRP)."""
@@ -28,6 +29,8 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
                  dias_no_habiles,
                  turnos_noche,
                  reglas_cobertura=None, 
+                 bloqueos_turno=(),
+                 instancia=None,
                  **kwargs 
                  ):
         
@@ -38,21 +41,6 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
         self.max_turno_val = max_turno_val
         self.info_profesionales = info_profesionales
         
-        # --- FIX SKILLS CACHE ---
-        self.cache_skills = []
-        try:
-            if isinstance(info_profesionales, dict):
-                for i in range(num_profesionales):
-                    p_data = info_profesionales.get(i, {})
-                    skill = p_data.get('skill', 'junior') if isinstance(p_data, dict) else 'junior'
-                    self.cache_skills.append(skill.strip().lower())
-            else:
-                for p in info_profesionales:
-                    skill = p.get('skill', 'junior') if isinstance(p, dict) else 'junior'
-                    self.cache_skills.append(skill.strip().lower())
-        except:
-            self.cache_skills = ['junior'] * num_profesionales
-
         self.matriz_preferencias = np.array(matriz_preferencias)
         self.matriz_disponibilidad = np.array(matriz_disponibilidad)
         self.pesos_fitness = pesos_fitness
@@ -63,15 +51,13 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
         self.dias_no_habiles = set(dias_no_habiles)
         self.turnos_noche = set(turnos_noche)
         self.reglas_cobertura = reglas_cobertura
+        self.requerimientos_cobertura = requerimientos_cobertura
 
         # 1. BLINDAJE DURACIÓN
         self.duracion_turnos = {}
         if isinstance(duracion_turnos, dict):
             for k, v in duracion_turnos.items():
-                try:
-                    val = float(v)
-                    self.duracion_turnos[int(k)] = val
-                    self.duracion_turnos[str(int(k))] = val
+                try: self.duracion_turnos[int(k)] = float(v)
                 except ValueError: continue
         
         # 2. BLINDAJE SECUENCIAS
@@ -84,72 +70,34 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
                     self.secuencias_prohibidas.add((int(seq['turno_previo']), int(seq['turno_siguiente'])))
                 except: pass
 
-        # 3. PROCESAR REQUERIMIENTOS (CON DEBUG TRAP)
-        self.requerimientos_cobertura = []
-        for d in range(num_dias):
-            try: dia_data_sucio = requerimientos_cobertura[d]
-            except (IndexError, KeyError): dia_data_sucio = {}
-
-            dia_data_limpio = {}
-            # Normalización agresiva
-            if isinstance(dia_data_sucio, dict):
-                for t_key, skills_dict in dia_data_sucio.items():
-                    try:
-                        t_id_int = int(t_key)
-                        if isinstance(skills_dict, dict):
-                            skills_limpio = {k.lower(): v for k, v in skills_dict.items()}
-                            dia_data_limpio[t_id_int] = skills_limpio
-                            dia_data_limpio[str(t_id_int)] = skills_limpio
-                    except: continue
-            
-            # RELLENAR HUECOS INMEDIATO
-            skills_template = {s.lower(): 0 for s in self.skills_a_cubrir}
-            for turno_id in self.turnos_a_cubrir:
-                turno_int = int(turno_id)
-                if turno_int not in dia_data_limpio:
-                    dia_data_limpio[turno_int] = skills_template.copy()
-                    dia_data_limpio[str(turno_int)] = skills_template.copy()
-            
-            self.requerimientos_cobertura.append(dia_data_limpio)
+        # 3. INSTANCIA COMPILADA: tablas densas que leen penalizaciones y reparación
+        # (los trabajadores paralelos la reciben ya armada sobre memoria compartida)
+        self.instancia = instancia if instancia is not None else compilar_instancia(
+            num_profesionales=num_profesionales,
+            num_dias=num_dias,
+            max_turno_val=max_turno_val,
+            info_profesionales=info_profesionales,
+            matriz_preferencias=self.matriz_preferencias,
+            matriz_disponibilidad=self.matriz_disponibilidad,
+            requerimientos_cobertura=requerimientos_cobertura,
+            secuencias_prohibidas=self.secuencias_prohibidas,
+            turnos_a_cubrir=turnos_a_cubrir,
+            skills_a_cubrir=skills_a_cubrir,
+            duracion_turnos=self.duracion_turnos,
+            dias_no_habiles=self.dias_no_habiles,
+            turnos_noche=self.turnos_noche,
+            bloqueos_turno=bloqueos_turno,
+        )
 
-    def _calcular_pen_cobertura(self, matriz, detallar=False):
-        penalizacion = 0.0
-        faltantes_total = 0
+    def fitness(self, solution_vector, reparar=True):
+        """Calcula el fitness de un individuo.
 
-        for d in range(self.num_dias):
-            demanda_dia = self.requerimientos_cobertura[d]
-            
-            for t_id in self.turnos_a_cubrir:
-                t_int = int(t_id)
-                reqs = demanda_dia.get(t_int)
-                if not reqs: reqs = demanda_dia.get(str(t_int), {'junior': 0, 'senior': 0})
-                
-                req_jun = reqs.get('junior', 0)
-                req_sen = reqs.get('senior', 0)
-
-                if req_jun == 0 and req_sen == 0: continue
-
-                cub_jun = 0
-                cub_sen = 0
-                
-                for p in range(self.num_profesionales):
-                    if int(matriz[p, d]) == t_int:
-                        skill = self.cache_skills[p]
-                        if skill == 'senior': cub_sen += 1
-                        else: cub_jun += 1
-                
-                falta = max(0, req_jun - cub_jun) + max(0, req_sen - cub_sen)
-                if falta > 0:
-                    penalizacion += falta * self.PENALIZACION_DURA
-                    faltantes_total += falta
-
-        if detallar: return penalizacion, faltantes_total
-        return penalizacion
-
-    def fitness(self, solution_vector):
+        Con `reparar=False` se asume que el individuo ya pasó por
+        `_reparar_cromosoma` y se evalúa tal cual, sin volver a repararlo.
+        """
         try:
             matriz = solution_vector.reshape(self.num_profesionales, self.num_dias)
-            matriz_reparada = self._reparar_cromosoma(matriz)
+            matriz_reparada = self._reparar_cromosoma(matriz) if reparar else matriz
             
             penalizacion = 0.0
             
@@ -181,12 +129,53 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
             traceback.print_exc()
             raise e 
 
+    def fitness_batch(self, pop_tensor, reparar=True):
+        """Evalúa una población completa con reducciones NumPy.
+
+        Equivale a `[self.fitness(ind, reparar) for ind in pop]`: cada individuo
+        se repara en el mismo orden (mismo consumo del generador aleatorio) y
+        luego todas las penalizaciones se calculan de una vez sobre el tensor.
+
+        Args:
+            pop_tensor (np.ndarray): Población de forma (pop, P, D) o (pop, P*D).
+            reparar (bool): Si es False, la población ya está reparada y se
+                evalúa directamente (camino del motor).
+
+        Returns:
+            np.ndarray: Vector de fitness de largo `pop`.
+        """
+        pop_tensor = np.asarray(pop_tensor)
+        n = pop_tensor.shape[0]
+        if n == 0:
+            return np.zeros(0)
+
+        pop = pop_tensor.reshape(n, self.num_profesionales, self.num_dias)
+        if reparar:
+            pop = np.stack([self._reparar_cromosoma(ind) for ind in pop])
+        reparados = self.instancia.acotar(pop)
+
+        # Las penalizaciones de disponibilidad, descansos y límites se garantizan
+        # por reparación y valen 0 (ver PenalizacionesDurasMixin).
+        penalizacion = self._calcular_pen_cobertura_lote(reparados)
+
+        pen_eq = self._calcular_pen_equidad_general_lote(reparados)
+        pen_dif = self._calcular_pen_equidad_dificiles_lote(reparados)
+        pen_pdl = self._calcular_pen_pdl_lote(reparados)
+        pen_pte = self._calcular_pen_pte_lote(reparados)
+
+        total = (penalizacion +
+                 (self.pesos_fitness['eq'] * pen_eq) +
+                 (self.pesos_fitness['dif'] * pen_dif) +
+                 (self.pesos_fitness['pdl'] * pen_pdl) +
+                 (self.pesos_fitness['pte'] * pen_pte))
+        return total.astype(float)
+
     def _reparar_cromosoma(self, matriz):
         return reparar_cromosoma(matriz, self)
     
-    def evaluar_detallado(self, solution_vector):
+    def evaluar_detallado(self, solution_vector, reparar=True):
         matriz = solution_vector.reshape(self.num_profesionales, self.num_dias)
-        matriz_reparada = self._reparar_cromosoma(matriz)
+        matriz_reparada = self._reparar_cromosoma(matriz) if reparar else matriz
         
         pen_cob, inc_cob = self._calcular_pen_cobertura(matriz_reparada, detallar=True)
         pen_pdl, inc_pdl = self._calcular_pen_pdl(matriz_reparada, detallar=True)
@@ -210,7 +199,7 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
         return {
             "status": "success",
             "metricas": {
-                "fitness_total": self.fitness(solution_vector),
+                "fitness_total": self.fitness(matriz_reparada, reparar=False),
                 "cobertura_cumplida": pen_cob == 0
             },
             "violaciones_duras": { "deficit_cobertura": inc_cob },
@@ -227,17 +216,4 @@ class ProblemaGAPropio(PenalizacionesDurasMixin, PenalizacionesBlandasMixin):
         }
 
     def _obtener_horas_por_profesional(self, matriz, tipo="general"):
-        horas = np.zeros(self.num_profesionales)
-        for p in range(self.num_profesionales):
-            for d in range(self.num_dias):
-                turno = int(matriz[p, d])
-                if turno > 0:
-                    duracion = self.duracion_turnos.get(turno)
-                    if duracion is None:
-                         duracion = self.duracion_turnos.get(str(turno), 0)
-                    if tipo == "dificil":
-                        es_finde_o_feriado = (d in self.dias_no_habiles)
-                        es_turno_noche = (turno in self.turnos_noche)
-                        if es_finde_o_feriado or es_turno_noche: horas[p] += duracion
-                    else: horas[p] += duracion
-        return horas
\ No newline at end of file
+        return self.instancia.horas_lote(matriz[None], dificiles=(tipo == "dificil"))[0]
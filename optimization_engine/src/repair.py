@@ -1,209 +1,214 @@
+import heapq
 import random
 import numpy as np
 
-def reparar_cromosoma(matriz, problem):
+def es_factible(matriz, problem):
+    """Indica si una matriz (P, D) cumple todas las restricciones duras.
+
+    Factible significa: solo turnos del alfabeto, asignados a profesionales
+    disponibles cuyo skill el turno requiere, sin secuencias prohibidas, con la
+    cobertura exacta pedida por (día, turno, skill) y dentro de [T_min, T_max].
+    Sobre una matriz factible `reparar_cromosoma` no hace cambios.
+    """
+    inst = problem.instancia
+    if ((matriz < 0) | (matriz > inst.valor_max)).any():
+        return False
+    valores = matriz.astype(np.intp)
+    trabaja = valores != 0
+
+    P, D = valores.shape
+    if not inst.dominio[np.arange(P)[:, None], np.arange(D)[None, :], valores].all():
+        return False
+    if inst.prohibida[valores[:, :-1], valores[:, 1:]].any():
+        return False
+    if not np.array_equal(inst.contar_cobertura(valores), inst.requerimientos):
+        return False
+    turnos_por_prof = trabaja.sum(axis=1)
+    return bool(((turnos_por_prof >= inst.t_min) & (turnos_por_prof <= inst.t_max)).all())
+
+def reparar_cromosoma(matriz, problem, podar_excesos=True):
+    """Repara una matriz (P, D) para que cumpla las restricciones duras.
+
+    Las etapas de limpieza, podado y recuento operan con máscaras NumPy sobre
+    las tablas de `problem.instancia`; las etapas constructivas (déficit y
+    T_min) son voraces pero trabajan directamente sobre los conteos
+    (día, turno, skill) en arreglos. Los barajados consumen el generador
+    `random` igual que la versión con bucles anidados; el desempate de la
+    cobertura de déficit se sortea una vez por candidato y grupo.
+
+    Con `podar_excesos=False` se omite el podado aleatorio de sobreasignación
+    (etapa 2): es la reparación mínima que se aplica a las soluciones semilla,
+    que ya vienen reparadas y solo deben corregirse donde cambió la instancia.
+    """
+    inst = problem.instancia
+    P, D = problem.num_profesionales, problem.num_dias
     matriz_reparada = matriz.copy()
+    if P == 0 or D == 0 or es_factible(matriz, problem):
+        # Idempotencia: una matriz factible se devuelve sin cambios.
+        return matriz_reparada
+
+    skill_prof = inst.skill_prof
+    dominio = inst.dominio
+    profs, dias = np.arange(P), np.arange(D)
 
     # =========================================================
     #       ETAPA 1: LIMPIEZA (Restricciones Duras Absolutas)
     # =========================================================
     # Elimina asignaciones que violan disponibilidad, skill o secuencias.
 
-    for p in range(problem.num_profesionales):
-        skill = problem.info_profesionales[p]['skill']
-        for d in range(problem.num_dias):
-            turno = int(matriz_reparada[p, d])
-            if turno == 0:
-                continue
-            # 1.1 Disponibilidad: si no está disponible, se borra.
-            if not bool(problem.matriz_disponibilidad[p, d]):
-                matriz_reparada[p, d] = 0 
-                continue
-            # 1.2 Competencias: si el turno no requiere su skill (requerido=0), se borra.
-            try:
-                requerido = problem.requerimientos_cobertura[d][turno].get(skill, 0)
-            except Exception:
-                requerido = 0
-            if requerido == 0:
-                matriz_reparada[p, d] = 0 
+    # Genes fuera del alfabeto (turnos desconocidos) se borran.
+    fuera_de_rango = (matriz_reparada < 0) | (matriz_reparada > inst.valor_max)
+    matriz_reparada[fuera_de_rango] = 0
+    valores = matriz_reparada.astype(np.intp)
+
+    # 1.1 Disponibilidad y 1.2 Competencias: el dominio A[p, d, turno] ya
+    # combina disponibilidad (del día y del turno) y skill requerido.
+    matriz_reparada[~dominio[profs[:, None], dias[None, :], valores]] = 0
 
     # 1.3 Secuencias prohibidas: borramos todos los patrones prohibidos (ej. Noche -> Mañana)
-    for p in range(problem.num_profesionales):
-        for d in range(problem.num_dias - 1):
-            sec = (int(matriz_reparada[p, d]), int(matriz_reparada[p, d+1]))
-            if sec in problem.secuencias_prohibidas:
-                matriz_reparada[p, d+1] = 0
+    # El barrido día a día solo es necesario si existe alguna violación.
+    if inst.prohibida[matriz_reparada[:, :-1], matriz_reparada[:, 1:]].any():
+        for d in range(D - 1):
+            viola = inst.prohibida[matriz_reparada[:, d], matriz_reparada[:, d+1]]
+            if viola.any():
+                matriz_reparada[viola, d+1] = 0
 
     # ==========================================
-    #   ETAPA 2: PODADO DE SOBREASIGNACIÓN 
+    #   ETAPA 2: PODADO DE SOBREASIGNACIÓN
     # ==========================================
     # Si hay exceso de personal en un turno, se elimina aleatoriamente.
-    for d in range(problem.num_dias):
-        for turno in problem.turnos_a_cubrir:
-            for skill in problem.skills_a_cubrir:
-                try:
-                    requerido = problem.requerimientos_cobertura[d][turno].get(skill, 0)
-                except:
-                    requerido = 0
-                asignados = []
-                for p in range(problem.num_profesionales):
-                    if int(matriz_reparada[p, d]) == turno and problem.info_profesionales[p]['skill'] == skill:
-                        asignados.append(p)
-                sobrantes = len(asignados) - requerido
-                if sobrantes > 0:
-                    random.shuffle(asignados)
-                    for _ in range(sobrantes):
-                        p_elim = asignados.pop()
-                        matriz_reparada[p_elim, d] = 0
+    turnos = [int(t) for t in inst.turnos]
+    if podar_excesos:
+        conteos = inst.contar_cobertura(matriz_reparada)
+        exceso = (conteos - inst.requerimientos)[:, turnos, :]
+        for d, t_pos, skill in np.argwhere(exceso > 0):
+            turno = turnos[t_pos]
+            asignados = np.flatnonzero((matriz_reparada[:, d] == turno) & (skill_prof == skill)).tolist()
+            random.shuffle(asignados)
+            for _ in range(int(exceso[d, t_pos, skill])):
+                matriz_reparada[asignados.pop(), d] = 0
 
     # =======================================================
     #    --- ACTUALIZACIÓN DE ESTADO (Cálculo Auxiliar) ---
     # =======================================================
     # Recalculamos horas y cobertura real antes de las etapas constructivas.
-    
-    assigned_counts = {}
-    prof_counts = [0] * problem.num_profesionales
-    dificiles_counts = [0] * problem.num_profesionales
-
-    for d in range(problem.num_dias):
-        assigned_counts[d] = {}
-        for turno in problem.turnos_a_cubrir:
-            assigned_counts[d][turno] = {}
-            for k in problem.skills_a_cubrir:
-                assigned = 0
-                for p in range(problem.num_profesionales):
-                    if int(matriz_reparada[p, d]) == turno and problem.info_profesionales[p]['skill'] == k:
-                        assigned += 1
-                assigned_counts[d][turno][k] = assigned
-
-    # Iniciar conteos por profesional
-    for p in range(problem.num_profesionales):
-        for d in range(problem.num_dias):
-            turno = int(matriz_reparada[p, d])
-            if turno > 0:
-                prof_counts[p] += 1
-                es_finde = d in problem.dias_no_habiles
-                es_noche = turno in problem.turnos_noche
-                if es_finde or es_noche:
-                    dificiles_counts[p] += 1
+    assigned_counts = inst.contar_cobertura(matriz_reparada)
+    trabaja = matriz_reparada != 0
+    dificil = trabaja & (inst.es_noche[matriz_reparada] | inst.no_habil[None, :])
+    prof_counts = trabaja.sum(axis=1)
+    dificiles_counts = dificil.sum(axis=1)
+    t_max = inst.t_max
+    t_min = inst.t_min
 
     # =========================================================
-    #       ETAPA 4: COBERTURA INTELIGENTE DE DÉFICIT 
+    #       ETAPA 3: PODADO POR LÍMITE MÁXIMO (T_MAX)
     # =========================================================
-    # Rellenamos huecos con el mejor candidato (Heurística: Preferencias + Equidad).
-    for p in range(problem.num_profesionales):
-        t_max = problem.info_profesionales[p]['t_max']
-        skill = problem.info_profesionales[p]['skill']
-        if prof_counts[p] <= t_max:
-            continue
-        trabajados = [d for d in range(problem.num_dias) if int(matriz_reparada[p, d]) != 0]
+    # Si alguien supera su máximo contractual, se le quitan turnos al azar.
+    for p in np.flatnonzero(prof_counts > t_max).tolist():
+        skill = int(skill_prof[p])
+        trabajados = np.flatnonzero(matriz_reparada[p] != 0).tolist()
         random.shuffle(trabajados)
-        eliminar = prof_counts[p] - t_max
-        for d_elim in trabajados:
-            if eliminar <= 0:
-                break
+        eliminar = int(prof_counts[p] - t_max[p])
+        for d_elim in trabajados[:eliminar]:
             turno_elim = int(matriz_reparada[p, d_elim])
-            es_finde = d_elim in problem.dias_no_habiles
-            es_noche = turno_elim in problem.turnos_noche
-            if es_finde or es_noche:
+            if inst.no_habil[d_elim] or inst.es_noche[turno_elim]:
                 dificiles_counts[p] -= 1
             matriz_reparada[p, d_elim] = 0
-            try:
-                assigned_counts[d_elim][turno_elim][skill] = max(0, assigned_counts[d_elim][turno_elim][skill] - 1)
-            except:
-                pass
+            if skill >= 0:
+                assigned_counts[d_elim, turno_elim, skill] = max(0, assigned_counts[d_elim, turno_elim, skill] - 1)
             prof_counts[p] -= 1
-            eliminar -= 1
 
-   # =================================================
-    #    ETAPA 5: RELLENO POR LÍMITE MÍNIMO (T_MIN)
-    # =================================================
-    # Garantiza horas mínimas contractuales.
-    for d in range(problem.num_dias):
-        for turno in problem.turnos_a_cubrir:
-            # definición de turno difícil
-            es_finde = d in problem.dias_no_habiles
-            es_noche = turno in problem.turnos_noche
-            turno_es_dificil = es_finde or es_noche
-            for skill in problem.skills_a_cubrir:
-                # cálculo de déficit
-                try:
-                    requerido = problem.requerimientos_cobertura[d][turno].get(skill, 0)
-                except:
-                    requerido = 0
-                asignado = assigned_counts[d][turno].get(skill, 0)
-                deficit = requerido - asignado
-                while deficit > 0:
-                    candidatos = []
-                    # Selección de Candidatos Válidos
-                    for p in range(problem.num_profesionales):
-                        if problem.info_profesionales[p]['skill'] != skill:
-                            continue
-                        if int(matriz_reparada[p, d]) != 0:
-                            continue
-                        if not bool(problem.matriz_disponibilidad[p, d]):
-                            continue
-                        if prof_counts[p] >= problem.info_profesionales[p]['t_max']:
-                            continue
-                        # Chequeo de secuencias
-                        prev_turno = int(matriz_reparada[p, d-1]) if d-1 >= 0 else 0
-                        next_turno = int(matriz_reparada[p, d+1]) if d+1 < problem.num_dias else 0
-                        if (prev_turno, turno) in problem.secuencias_prohibidas:
-                            continue
-                        if (turno, next_turno) in problem.secuencias_prohibidas:
-                            continue
-                        candidatos.append(p)
-                    if not candidatos:
-                        break
-                    
-                    # Puntaje: se ordena a los candidatos por Preferencias y Equidad
-                    def puntaje_candidato(p_idx):
-                        viola_pdl = 1 if problem.matriz_preferencias[p_idx, d] == -1 else 0
-                        pref = problem.matriz_preferencias[p_idx, d]
-                        viola_pte = 1 if (pref > 0 and pref != turno) else 0
-                        if turno_es_dificil:
-                            # Prioriza quien tiene menos turnos difíciles
-                            return (viola_pdl, viola_pte, dificiles_counts[p_idx], prof_counts[p_idx], random.random())
-                        else:
-                            # Prioriza quien tiene menos carga total
-                            return (viola_pdl, viola_pte, prof_counts[p_idx], dificiles_counts[p_idx], random.random())
-                    
-                    candidatos.sort(key=puntaje_candidato)
-                    elegido_p = candidatos[0]
-                    
-                    # Asignación y actualización
-                    matriz_reparada[elegido_p, d] = turno
-                    prof_counts[elegido_p] += 1
-                    if turno_es_dificil:
-                        dificiles_counts[elegido_p] += 1
-                    assigned_counts[d][turno][skill] = assigned_counts[d][turno].get(skill, 0) + 1
-                    deficit -= 1
+    # =========================================================
+    #       ETAPA 4: COBERTURA INTELIGENTE DE DÉFICIT
+    # =========================================================
+    # Rellenamos huecos con el mejor candidato (Heurística: Preferencias + Equidad).
+    # Solo el grupo (día, turno, skill) que se rellena cambia su conteo, por lo
+    # que los déficits pueden listarse de antemano. Los candidatos salen de un
+    # pool por (día, skill) con los profesionales que tienen algún turno legal
+    # ese día; quien recibe un turno deja de ser candidato para los demás
+    # turnos del día y se descarta de forma perezosa al filtrar el pool.
+    deficit_total = (inst.requerimientos - assigned_counts)[:, turnos, :]
+    legal_algun_turno = dominio[:, :, 1:].any(axis=2)
+    pools = {}
+    for d, t_pos, skill in np.argwhere(deficit_total > 0).tolist():
+        turno = turnos[t_pos]
+        deficit = int(deficit_total[d, t_pos, skill])
+        turno_es_dificil = bool(inst.no_habil[d] or inst.es_noche[turno])
+
+        pool = pools.get((d, skill))
+        if pool is None:
+            pool = pools[d, skill] = np.flatnonzero((skill_prof == skill) & legal_algun_turno[:, d])
+
+        # Selección de Candidatos Válidos (máscara sobre el pool)
+        prev_turno = matriz_reparada[pool, d-1] if d-1 >= 0 else np.zeros(len(pool), dtype=np.intp)
+        next_turno = matriz_reparada[pool, d+1] if d+1 < D else np.zeros(len(pool), dtype=np.intp)
+        libre = matriz_reparada[pool, d] == 0
+        pool = pools[d, skill] = pool[libre]
+        es_candidato = (dominio[pool, d, turno] &
+                        (prof_counts[pool] < t_max[pool]) &
+                        ~inst.prohibida[prev_turno[libre], turno] &
+                        ~inst.prohibida[turno, next_turno[libre]])
+        candidatos = pool[es_candidato]
+        if len(candidatos) == 0:
+            continue
+
+        # Cola de prioridad por Preferencias y Equidad. Dentro del grupo solo
+        # cambia la carga del elegido, que sale de la cola: las claves del
+        # resto siguen vigentes y el desempate aleatorio se sortea una vez.
+        pref = inst.preferencias[candidatos, d]
+        viola_pdl = (pref == -1).astype(int)
+        viola_pte = ((pref > 0) & (pref != turno)).astype(int)
+        if turno_es_dificil:
+            # Prioriza quien tiene menos turnos difíciles
+            criterio_1, criterio_2 = dificiles_counts[candidatos], prof_counts[candidatos]
+        else:
+            # Prioriza quien tiene menos carga total
+            criterio_1, criterio_2 = prof_counts[candidatos], dificiles_counts[candidatos]
+        desempate = [random.random() for _ in range(len(candidatos))]
+        cola = list(zip(viola_pdl.tolist(), viola_pte.tolist(), criterio_1.tolist(), criterio_2.tolist(),
+                        desempate, candidatos.tolist()))
+        heapq.heapify(cola)
+
+        while deficit > 0 and cola:
+            elegido_p = heapq.heappop(cola)[-1]
+
+            # Asignación y actualización
+            matriz_reparada[elegido_p, d] = turno
+            prof_counts[elegido_p] += 1
+            if turno_es_dificil:
+                dificiles_counts[elegido_p] += 1
+            assigned_counts[d, turno, skill] += 1
+            deficit -= 1
 
     # =================================================
-    #    ETAPA 6: RELLENO POR LÍMITE MÍNIMO (T_MIN)
+    #    ETAPA 5: RELLENO POR LÍMITE MÍNIMO (T_MIN)
     # =================================================
     # Si alguien quedó por debajo de su contrato mínimo, se le buscan huecos donde sea.
-    for p in range(problem.num_profesionales):
-        if prof_counts[p] >= problem.info_profesionales[p]['t_min']:
-            continue
-        dias_libres = [d for d in range(problem.num_dias) if matriz_reparada[p, d] == 0 and bool(problem.matriz_disponibilidad[p, d])]
+    prohibida = inst.prohibida
+    for p in np.flatnonzero(prof_counts < t_min).tolist():
+        minimo = int(t_min[p])
+        asignados_p = int(prof_counts[p])
+        fila = matriz_reparada[p]
+        legales = dominio[p][:, turnos]
+        dias_libres = np.flatnonzero((fila == 0) & legales.any(axis=1)).tolist()
         random.shuffle(dias_libres)
-        skill = problem.info_profesionales[p]['skill']
         for d_cand in dias_libres:
-            if prof_counts[p] >= problem.info_profesionales[p]['t_min']:
+            if asignados_p >= minimo:
                 break
-            posibles = problem.turnos_a_cubrir[:]
+            # Solo turnos del dominio: un turno ilegal se borraría en la próxima reparación
+            posibles = [t for t, legal in zip(turnos, legales[d_cand].tolist()) if legal]
             random.shuffle(posibles)
             for turno in posibles:
                 # Chequeo rápido de secuencias
-                prev_turno = int(matriz_reparada[p, d_cand-1]) if d_cand-1 >= 0 else 0
-                next_turno = int(matriz_reparada[p, d_cand+1]) if d_cand+1 < problem.num_dias else 0
-                if (prev_turno, turno) in problem.secuencias_prohibidas:
+                prev_turno = int(fila[d_cand-1]) if d_cand-1 >= 0 else 0
+                next_turno = int(fila[d_cand+1]) if d_cand+1 < D else 0
+                if prohibida[prev_turno, turno]:
                     continue
-                if (turno, next_turno) in problem.secuencias_prohibidas:
+                if prohibida[turno, next_turno]:
                     continue
-                matriz_reparada[p, d_cand] = turno
-                prof_counts[p] += 1
+                fila[d_cand] = turno
+                asignados_p += 1
                 break
+        prof_counts[p] = asignados_p
 
-    return matriz_reparada
\ No newline at end of file
+    return matriz_reparada
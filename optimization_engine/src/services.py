@@ -10,6 +10,7 @@ import asyncio
 from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Manager
 from .motor_ga import ejecutar_algoritmo_genetico
+from .islas import ejecutar_modelo_islas
 
 # --- GESTIÓN DE ESTADO COMPARTIDO ---
 
@@ -27,7 +28,7 @@ TRABAJOS = {}
 # Executor que gestiona el Pool de Procesos para el paralelismo real.
 executor = ProcessPoolExecutor(max_workers=2)
 
-def correr_trabajo_pesado(job_id, config, datos, estrategias, shared_dict):
+def correr_trabajo_pesado(job_id, config, datos, estrategias, shared_dict, soluciones_semilla=None):
     """Ejecuta el motor del GA en un proceso worker independiente.
 
     Esta función es bloqueante y está diseñada para ejecutarse dentro de un 
@@ -39,17 +40,20 @@ def correr_trabajo_pesado(job_id, config, datos, estrategias, shared_dict):
         datos (dict): Instancia del problema procesada.
         estrategias (dict): Operadores genéticos seleccionados.
         shared_dict (DictProxy): Referencia al diccionario de progreso compartido.
+        soluciones_semilla (list, optional): Soluciones previas para el arranque en caliente.
 
     Returns:
         tuple: Un par (estado, resultado) donde estado es "completed" o "failed".
     """
     try:
-        resultado = ejecutar_algoritmo_genetico(config, datos, estrategias, job_id, shared_dict)
+        # Con más de una isla se usa el modelo de islas; si no, el GA clásico.
+        motor = ejecutar_modelo_islas if config.get('num_islas', 1) > 1 else ejecutar_algoritmo_genetico
+        resultado = motor(config, datos, estrategias, job_id, shared_dict, soluciones_semilla=soluciones_semilla)
         return ("completed", resultado)
     except Exception as e:
         return ("failed", str(e))
 
-async def wrapper_trabajo(job_id, config, datos, estrategias):
+async def wrapper_trabajo(job_id, config, datos, estrategias, soluciones_semilla=None):
     """Orquestador asincrónico que gestiona el ciclo de vida de un trabajo.
 
     Inicia el trabajo en el pool de procesos, espera su finalización de forma 
@@ -60,6 +64,7 @@ async def wrapper_trabajo(job_id, config, datos, estrategias):
         config (dict): Configuración del algoritmo.
         datos (dict): Datos de entrada del problema.
         estrategias (dict): Estrategias de evolución seleccionadas.
+        soluciones_semilla (list, optional): Soluciones previas para el arranque en caliente.
     """
     loop = asyncio.get_running_loop()
     
@@ -70,7 +75,7 @@ async def wrapper_trabajo(job_id, config, datos, estrategias):
     estado, data = await loop.run_in_executor(
         executor, 
         correr_trabajo_pesado, 
-        job_id, config, datos, estrategias, PROGRESO_TRABAJOS
+        job_id, config, datos, estrategias, PROGRESO_TRABAJOS, soluciones_semilla
     )
     
     # Actualización del estado final en la memoria del proceso principal
@@ -1,17 +1,101 @@
 import numpy as np
 import random
 
-def init_population(pop_size, num_profesionales, num_dias, max_turno_val, seed=None):
+def dtype_poblacion(max_turno_val):
+    """Tipo entero más chico capaz de representar todos los valores de gen."""
+    return np.uint8 if max_turno_val <= np.iinfo(np.uint8).max else np.uint16
+
+
+def init_population(pop_size, num_profesionales, num_dias, max_turno_val, seed=None, dominio=None):
+    """Crea la población inicial como un único arreglo contiguo (pop, P, D).
+
+    Con `dominio` (A[p, d, valor] de `InstanciaCompilada`) cada celda se sortea
+    uniformemente entre sus valores legales; sin él, entre 0 y `max_turno_val`.
+    """
+    if seed is not None:
+        np.random.seed(seed)
+        random.seed(seed)
+    if dominio is None:
+        pop = np.random.randint(0, max_turno_val + 1, size=(pop_size, num_profesionales, num_dias))
+    else:
+        pop = sortear_en_dominio(dominio, pop_size)
+    return pop.astype(dtype_poblacion(max_turno_val))
+
+
+def sortear_en_dominio(dominio, n):
+    """Sortea `n` matrices (P, D) con un valor legal uniforme por celda según `dominio`."""
+    acumulado = np.cumsum(dominio, axis=2)
+    legales = acumulado[:, :, -1]
+    rango = (np.random.random((n,) + legales.shape) * legales).astype(acumulado.dtype)
+    return (acumulado[None] > rango[..., None]).argmax(axis=3)
+
+
+def init_population_constructiva(pop_size, problema, seed=None):
+    """Crea la población inicial cubriendo la demanda de forma voraz y aleatorizada.
+
+    Recorre los días en orden y, para cada (turno, skill) con demanda, asigna
+    en todos los individuos a la vez profesionales disponibles, libres ese día,
+    bajo su T_max y sin secuencia prohibida respecto del día anterior. Los
+    candidatos se sortean sin reemplazo con peso proporcional a su capacidad
+    restante (más lo que les falta para T_min) y a sus preferencias (claves
+    de Gumbel), de modo que la población es diversa pero casi factible.
+    """
     if seed is not None:
         np.random.seed(seed)
         random.seed(seed)
-    pop = []
-    for _ in range(pop_size):
-        indiv = np.random.randint(0, max_turno_val + 1, size=(num_profesionales * num_dias,))
-        pop.append(indiv.astype(int))
+    inst = problema.instancia
+    P, D = inst.num_profesionales, inst.num_dias
+    pop = np.zeros((pop_size, P, D), dtype=dtype_poblacion(inst.valor_max))
+    if pop_size == 0 or P == 0:
+        return pop
+
+    filas = np.arange(pop_size)
+    turnos_asignados = np.zeros((pop_size, P), dtype=np.int64)
+    for d in range(D):
+        previo = pop[:, :, d - 1] if d > 0 else np.zeros((pop_size, P), dtype=pop.dtype)
+        pref = inst.preferencias[:, d]
+        for turno in inst.turnos.tolist():
+            # Preferencias: pedir libre desalienta, pedir este turno alienta
+            factor_pref = np.where(pref == -1, 0.1, np.where(pref == turno, 3.0, np.where(pref > 0, 0.5, 1.0)))
+            for k in range(inst.num_skills):
+                requerido = min(int(inst.requerimientos[d, turno, k]), P)
+                if requerido == 0:
+                    continue
+                valido = ((inst.skill_prof == k) & inst.dominio[:, d, turno])[None, :] & \
+                         (pop[:, :, d] == 0) & (turnos_asignados < inst.t_max) & \
+                         ~inst.prohibida[previo, turno]
+                restante = (inst.t_max - turnos_asignados) + 2 * np.maximum(0, inst.t_min - turnos_asignados)
+                peso = np.maximum(restante, 1) * factor_pref
+                claves = np.where(valido, np.log(peso) + np.random.gumbel(size=peso.shape), -np.inf)
+                elegidos = np.argpartition(-claves, requerido - 1, axis=1)[:, :requerido]
+                ok = np.isfinite(np.take_along_axis(claves, elegidos, axis=1))
+                i_pop = np.broadcast_to(filas[:, None], elegidos.shape)[ok]
+                i_prof = elegidos[ok]
+                pop[i_pop, i_prof, d] = turno
+                turnos_asignados[i_pop, i_prof] += 1
     return pop
 
 
+def poblacion_inicial(config, problema, seed=None):
+    """Población inicial según `config['inicializacion']`: 'aleatoria' (por defecto) o 'constructiva'."""
+    pop_size = config.get('pop_size', 100)
+    if config.get('inicializacion') == 'constructiva':
+        return init_population_constructiva(pop_size, problema, seed=seed)
+    return init_population(pop_size, problema.num_profesionales, problema.num_dias,
+                           problema.max_turno_val, seed=seed, dominio=problema.instancia.dominio)
+
+
+def sembrar_hijo(semilla, gen, indice):
+    """Siembra `random` y `np.random` para generar el hijo `indice` de la generación `gen`.
+
+    La semilla depende solo de (semilla, gen, indice), de modo que un hijo se
+    genera igual sin importar qué proceso lo produzca ni en qué orden.
+    """
+    estado = np.random.SeedSequence([semilla, gen, indice]).generate_state(1)[0]
+    random.seed(int(estado))
+    np.random.seed(int(estado))
+
+
 def diversity(pop):
     seen = set()
     for ind in pop:
@@ -19,6 +103,22 @@ def diversity(pop):
     return len(seen)
 
 
+def diversidad_genotipica(pop):
+    """Fracción media de individuos que difieren del valor más frecuente de cada celda.
+
+    A diferencia de `diversity` (individuos distintos), mide cuánto se parecen:
+    una población de variantes cercanas de un mismo cronograma cuenta como
+    poco diversa aunque casi no tenga copias exactas.
+    """
+    pop = np.asarray(pop)
+    if len(pop) == 0:
+        return 0.0
+    moda = np.zeros(pop.shape[1:], dtype=np.intp)
+    for valor in np.unique(pop).tolist():
+        np.maximum(moda, (pop == valor).sum(axis=0), out=moda)
+    return float(1.0 - moda.mean() / len(pop))
+
+
 def population_stats(fitnesses):
     import numpy as _np
     arr = _np.array(fitnesses)
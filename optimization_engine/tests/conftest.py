@@ -0,0 +1,54 @@
+import pytest
+from src.loader import procesar_datos_instancia
+from src.problema import ProblemaGAPropio
+
+
+def construir_datos_instancia(num_dias=14, seniors=5, juniors=5):
+    """Instancia chica con demanda, feriados, preferencias y ausencias."""
+    lista = []
+    for i in range(seniors + juniors):
+        lista.append({
+            "id_db": 100 + i,
+            "nombre": f"Profesional {i}",
+            "skill": "senior" if i < seniors else "junior",
+            "t_min": 4,
+            "t_max": 9,
+        })
+    return {
+        "num_dias": num_dias,
+        "max_turno_val": 3,
+        "turnos_a_cubrir": [1, 2, 3],
+        "skills_a_cubrir": ["junior", "senior"],
+        "turnos_noche": [3],
+        "duracion_turnos": {"1": 8, "2": 8, "3": 12},
+        "pesos_fitness": {"eq": 1.0, "dif": 1.5, "pdl": 2.0, "pte": 0.5, "alpha_pte": 0.5},
+        "tolerancia_equidad_general": 8,
+        "tolerancia_equidad_dificil": 4,
+        "lista_profesionales": lista,
+        "dias_no_habiles": [5, 6, 12, 13],
+        "reglas_cobertura": {
+            "dias_pico": [0, 7],
+            "demanda_pico": {"1": {"junior": 2, "senior": 1}, "2": {"junior": 1, "senior": 1}, "3": {"junior": 1, "senior": 1}},
+            "demanda_normal": {"1": {"junior": 1, "senior": 1}, "2": {"junior": 1, "senior": 0}, "3": {"junior": 0, "senior": 1}},
+        },
+        "secuencias_prohibidas": [[3, 1], [3, 2], [2, 1]],
+        "excepciones_disponibilidad": [
+            {"prof_index": 0, "dias_range": [0, 3], "disponible": False},
+            {"prof_index": 7, "dias_range": [9, 12], "disponible": False},
+        ],
+        "excepciones_preferencias": [
+            {"prof_indices": [1, 6], "dia": 4, "valor": -1},
+            {"prof_indices": [2], "dias": [2, 3, 10], "valor": 1},
+            {"prof_indices": [8], "dia": 11, "valor": 3},
+        ],
+    }
+
+
+@pytest.fixture
+def datos_instancia():
+    return construir_datos_instancia()
+
+
+@pytest.fixture
+def problema(datos_instancia):
+    return ProblemaGAPropio(**procesar_datos_instancia(datos_instancia))
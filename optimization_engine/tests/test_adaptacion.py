@@ -0,0 +1,88 @@
+import copy
+
+import numpy as np
+
+from src.adaptacion import SeleccionAdaptativa, ControlParametros, recompensas_relativas
+from src.motor_ga import ejecutar_algoritmo_genetico
+from src.utils import diversidad_genotipica
+
+
+def test_probabilidad_se_desplaza_hacia_el_operador_que_mejora():
+    adaptacion = SeleccionAdaptativa(["a", "b", "c"], [None, None, None])
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        elegidos = adaptacion.sortear(60, rng)
+        adaptacion.registrar(elegidos, np.where(elegidos == 1, 0.05, 0.0))
+
+    assert np.isclose(adaptacion.probabilidades.sum(), 1.0)
+    assert adaptacion.probabilidades.argmax() == 1
+    # Los operadores sin mejoras conservan la probabilidad mínima de exploración
+    assert np.all(adaptacion.probabilidades >= adaptacion.p_min - 1e-12)
+    estadisticas = adaptacion.estadisticas()
+    assert estadisticas["a"]["mejoras"] == 0 and estadisticas["b"]["mejoras"] == estadisticas["b"]["usos"] > 0
+
+
+def test_recompensas_relativas_solo_premian_mejoras():
+    recompensas = recompensas_relativas([2.0, 2.0, 0.0], [1.0, 3.0, 0.0])
+    assert recompensas.tolist() == [0.5, 0.0, 0.0]
+
+
+def test_motor_reporta_estadisticas_de_operadores_adaptativos(datos_instancia):
+    config = {"pop_size": 10, "generaciones": 4, "pc": 0.8, "pm": 0.4, "elitismo": True, "seed": 3}
+    estrategias = {"sel": "torneo_deterministico", "cross": "adaptativo", "mut": "hibrida_adaptativa"}
+    resultado = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia), estrategias)
+
+    adaptativos = resultado["operadores_adaptativos"]
+    assert set(adaptativos) == {"cruce", "mutacion"}
+    for familia in adaptativos.values():
+        assert np.isclose(sum(op["probabilidad"] for op in familia.values()), 1.0)
+
+    # Solo se acreditan los operadores que se aplicaron: con pc=1 y pm=0 todos
+    # los hijos se cruzan (salvo el élite y los inmigrantes) y ninguno se muta
+    siempre_cruza = ejecutar_algoritmo_genetico(dict(config, pc=1.0, pm=0.0), copy.deepcopy(datos_instancia),
+                                                estrategias)
+    adaptativos = siempre_cruza["operadores_adaptativos"]
+    usos = sum(op["usos"] for op in adaptativos["cruce"].values())
+    assert usos == 4 * 9 - siempre_cruza["duplicados"]["inmigrantes"]
+    assert sum(op["usos"] for op in adaptativos["mutacion"].values()) == 0
+
+    nunca_cruza = ejecutar_algoritmo_genetico(dict(config, pc=0.0), copy.deepcopy(datos_instancia), estrategias)
+    assert sum(op["usos"] for op in nunca_cruza["operadores_adaptativos"]["cruce"].values()) == 0
+
+    fijo = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia),
+                                       dict(estrategias, mut="flip_simple", cross="dos_puntos"))
+    assert "operadores_adaptativos" not in fijo
+
+
+def test_control_sube_pm_si_la_poblacion_converge_y_baja_pc_si_se_estanca():
+    rng = np.random.default_rng(0)
+    diversa = rng.integers(0, 4, size=(10, 5, 7)).astype(np.uint8)
+    convergida = np.repeat(diversa[:1], 10, axis=0)
+    convergida[1:, 0, 0] = (convergida[0, 0, 0] + 1) % 4
+    assert diversidad_genotipica(convergida) < 0.1 * diversidad_genotipica(diversa)
+
+    control = ControlParametros(0.85, 0.2)
+    control.actualizar(0, diversa, 10.0)
+    for gen in range(1, 30):
+        pc, pm = control.actualizar(gen, convergida, 10.0)
+    assert (pc, pm) == (control.rango_pc[0], control.rango_pm[1])
+    assert len(control.historial) == 29 and control.historial[-1]["tasa_mejora"] == 0.0
+
+    # Mientras el mejor mejora sobre una población diversa, pc sube y pm baja
+    control = ControlParametros(0.6, 0.3)
+    control.actualizar(0, diversa, 10.0)
+    pc, pm = control.actualizar(1, diversa, 9.0)
+    assert pc > 0.6 and pm < 0.3
+
+
+def test_motor_registra_el_cronograma_de_parametros(datos_instancia):
+    config = {"pop_size": 10, "generaciones": 5, "pc": 0.85, "pm": 0.2, "seed": 3,
+              "control_parametros": "adaptativo"}
+    estrategias = {"sel": "torneo_deterministico", "cross": "bloques_horizontales", "mut": "flip_simple"}
+    resultado = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia), estrategias)
+
+    cronograma = resultado["parametros_adaptativos"]
+    assert [h["generacion"] for h in cronograma] == [1, 2, 3, 4, 5]
+    assert all(0.5 <= h["pc"] <= 0.95 and 0.05 <= h["pm"] <= 0.6 for h in cronograma)
+    assert "parametros_adaptativos" not in ejecutar_algoritmo_genetico(
+        dict(config, control_parametros="fijo"), copy.deepcopy(datos_instancia), estrategias)
@@ -23,4 +23,19 @@ def test_evaluar_solucion_mock():
     # El fitness ahora está dentro de 'metricas' según tu problema.py
     assert "metricas" in data
     assert "fitness_total" in data["metricas"]
-    assert "violaciones_duras" in data
\ No newline at end of file
+    assert "violaciones_duras" in data
+
+
+def test_estado_expone_la_diversidad_en_vivo():
+    from src import services
+    job_id = "trabajo-diversidad"
+    services.TRABAJOS[job_id] = {"status": "processing"}
+    services.PROGRESO_TRABAJOS[job_id] = {"gen_actual": 3, "gen_total": 10, "porcentaje": 30,
+                                          "mejor_fitness_actual": 1.5, "diversidad": 0.8}
+    try:
+        progreso = client.get(f"/status/{job_id}").json()["progreso"]
+    finally:
+        del services.TRABAJOS[job_id], services.PROGRESO_TRABAJOS[job_id]
+
+    assert progreso["diversidad"] == 0.8
+    assert progreso["generacion"] == "3/10"
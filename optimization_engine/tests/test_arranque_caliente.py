@@ -0,0 +1,18 @@
+import copy
+
+from src.motor_ga import ejecutar_algoritmo_genetico
+
+
+def test_solucion_previa_como_semilla_arranca_desde_su_calidad(datos_instancia):
+    config = {"pop_size": 10, "generaciones": 15, "pc": 0.8, "pm": 0.3, "elitismo": True, "seed": 3}
+    estrategias = {"sel": "torneo_deterministico", "cross": "bloques_horizontales", "mut": "hibrida_adaptativa"}
+    previo = ejecutar_algoritmo_genetico(dict(config), copy.deepcopy(datos_instancia), estrategias)
+
+    semilla = {"matriz": previo["matriz_solucion"],
+               "ids_profesionales": [p["id_db"] for p in datos_instancia["lista_profesionales"]]}
+    frio = ejecutar_algoritmo_genetico(dict(config, generaciones=1, seed=11), copy.deepcopy(datos_instancia), estrategias)
+    caliente = ejecutar_algoritmo_genetico(dict(config, generaciones=1, seed=11), copy.deepcopy(datos_instancia),
+                                          estrategias, soluciones_semilla=[semilla])
+
+    assert caliente["fitness"] <= previo["fitness"] + 1e-9
+    assert caliente["fitness"] < frio["fitness"]
@@ -0,0 +1,56 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.busqueda_local import BusquedaLocal
+from src.evaluacion_incremental import AgregadosPoblacion
+from src.motor_ga import crear_evolucion, resolver_operadores
+from src.utils import init_population
+
+
+def _violaciones(matriz, problema):
+    """Restricciones duras que los movimientos deben conservar."""
+    inst = problema.instancia
+    trabaja = matriz != 0
+    return (int((trabaja & ~inst.disponible).sum()),
+            int(inst.prohibida[matriz[:, :-1], matriz[:, 1:]].sum()),
+            int((trabaja.sum(axis=1) > inst.t_max).sum()))
+
+
+def test_busqueda_local_solo_acepta_mejoras_y_mantiene_agregados(problema):
+    pop = init_population(4, problema.num_profesionales, problema.num_dias, problema.max_turno_val, seed=2)
+    for i in range(len(pop)):
+        pop[i] = problema._reparar_cromosoma(pop[i])
+    agregados = AgregadosPoblacion(problema, len(pop))
+    agregados.calcular(pop, np.arange(len(pop)))
+    fitnesses = agregados.fitness()
+    cobertura = [problema.instancia.contar_cobertura(m) for m in pop]
+    violaciones = [_violaciones(m, problema) for m in pop]
+
+    random.seed(0)
+    busqueda = BusquedaLocal(problema, max_evaluaciones=300)
+    total = 0
+    for i in range(len(pop)):
+        f, aceptados = busqueda.mejorar(pop, i, agregados, fitnesses[i])
+        total += aceptados
+        assert f <= fitnesses[i]
+        assert f == pytest.approx(problema.fitness(pop[i].reshape(-1), reparar=False), rel=1e-9)
+        assert agregados.fitness()[i] == pytest.approx(f, rel=1e-9)
+        assert _violaciones(pop[i], problema) <= violaciones[i]
+        if problema.instancia.deficit_lote(cobertura[i][None])[0] == 0:
+            assert np.array_equal(problema.instancia.contar_cobertura(pop[i]), cobertura[i])
+    assert total > 0
+
+
+def test_evolucion_aplica_busqueda_local_cada_intervalo(problema):
+    config = {"pc": 0.8, "pm": 0.2, "intervalo_busqueda_local": 2, "elites_busqueda_local": 3}
+    evolucion = crear_evolucion(problema, resolver_operadores({}), config, 4)
+    pop = init_population(8, problema.num_profesionales, problema.num_dias, problema.max_turno_val, seed=4)
+    evolucion.iniciar(pop)
+    for gen in range(1, 5):
+        evolucion.avanzar(gen)
+
+    assert evolucion.fitnesses == pytest.approx(problema.fitness_batch(evolucion.pop, reparar=False), rel=1e-9)
+    assert evolucion.best_global_f == pytest.approx(evolucion.fitnesses.min())
+    assert crear_evolucion(problema, resolver_operadores({}), {}, 4).busqueda_local is None
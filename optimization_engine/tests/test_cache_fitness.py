@@ -0,0 +1,28 @@
+import numpy as np
+from src.cache_fitness import CacheFitness
+
+
+def test_cache_fitness_desaloja_el_menos_usado():
+    cache = CacheFitness(tamano_maximo=2)
+    a, b, c = (CacheFitness.clave(np.full((2, 3), v, dtype=np.uint8)) for v in (1, 2, 3))
+
+    cache.guardar(a, 1.0)
+    cache.guardar(b, 2.0)
+    assert cache.obtener(a) == 1.0   # 'a' pasa a ser el más reciente
+    cache.guardar(c, 3.0)            # desaloja 'b'
+
+    assert cache.obtener(b) is None
+    assert cache.obtener(c) == 3.0
+    assert cache.estadisticas() == {
+        "aciertos": 2, "fallos": 1, "tasa_aciertos": 0.6667,
+        "entradas": 2, "tamano_maximo": 2, "desalojos": 1,
+    }
+
+
+def test_cache_fitness_deshabilitada_no_guarda():
+    cache = CacheFitness(tamano_maximo=0)
+    clave = CacheFitness.clave(np.zeros(4, dtype=np.uint8))
+    cache.guardar(clave, 5.0)
+
+    assert cache.obtener(clave) is None
+    assert len(cache) == 0
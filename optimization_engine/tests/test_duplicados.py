@@ -0,0 +1,38 @@
+import copy
+
+import numpy as np
+import pytest
+
+from src.motor_ga import crear_evolucion, resolver_operadores, ejecutar_algoritmo_genetico
+from src.utils import init_population, diversity
+
+
+def _clones(problema, n):
+    base = init_population(1, problema.num_profesionales, problema.num_dias, problema.max_turno_val, seed=1)[0]
+    return np.repeat(problema._reparar_cromosoma(base)[None], n, axis=0)
+
+
+def test_generacion_sin_hijos_repetidos(problema):
+    # Sin cruce ni mutación todos los hijos serían copias del mismo individuo
+    config = {"pc": 0.0, "pm": 0.0}
+    evolucion = crear_evolucion(problema, resolver_operadores({}), config, 3)
+    evolucion.iniciar(_clones(problema, 8))
+    evolucion.avanzar(1)
+
+    assert diversity(evolucion.pop) == 8
+    assert sum(evolucion.duplicados.values()) == 7
+    assert evolucion.fitnesses == pytest.approx(problema.fitness_batch(evolucion.pop, reparar=False), rel=1e-9)
+
+    sin_rechazo = crear_evolucion(problema, resolver_operadores({}), dict(config, rechazar_duplicados=False), 3)
+    sin_rechazo.iniciar(_clones(problema, 8))
+    sin_rechazo.avanzar(1)
+    assert diversity(sin_rechazo.pop) < 8
+
+
+def test_progreso_reporta_diversidad(datos_instancia):
+    progreso = {}
+    config = {"pop_size": 8, "generaciones": 3, "seed": 2}
+    resultado = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia), {}, "job", progreso)
+
+    assert 0 < progreso["job"]["diversidad"] <= 1
+    assert set(resultado["duplicados"]) == {"remutados", "inmigrantes"}
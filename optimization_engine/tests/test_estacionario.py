@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from src.motor_ga import crear_evolucion, resolver_operadores, EvolucionEstacionaria
+from src.utils import init_population
+
+
+@pytest.mark.parametrize("reemplazo", ["estacionario_peor", "estacionario_torneo"])
+def test_evolucion_estacionaria_reemplaza_en_sitio_sin_empeorar(problema, reemplazo):
+    estrategias = {"reemplazo": reemplazo}
+    config = {"pc": 0.7, "pm": 0.5}
+    evolucion = crear_evolucion(problema, resolver_operadores(estrategias), config, 8, estrategias)
+    assert isinstance(evolucion, EvolucionEstacionaria)
+
+    pop = init_population(10, problema.num_profesionales, problema.num_dias, problema.max_turno_val, seed=8)
+    evolucion.iniciar(pop)
+    peor_inicial = evolucion.fitnesses.max()
+    for gen in range(1, 4):
+        evolucion.avanzar(gen)
+
+    assert evolucion.pop is pop                      # sin buffers nuevos
+    assert evolucion.fitnesses.max() <= peor_inicial
+    assert evolucion.best_global_f == evolucion.fitnesses.min()
+    assert evolucion.fitnesses == pytest.approx(problema.fitness_batch(pop, reparar=False), rel=1e-9)
+    assert evolucion._peor() == int(np.argmax(evolucion.fitnesses))
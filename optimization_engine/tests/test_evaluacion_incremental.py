@@ -0,0 +1,77 @@
+import random
+import numpy as np
+import pytest
+
+from src.evaluacion_incremental import AgregadosPoblacion, celdas_modificadas
+from src.operadores import MUTATION_OPS
+
+
+def _poblacion_reparada(problema, n, seed):
+    rng = np.random.default_rng(seed)
+    pop = rng.integers(0, problema.max_turno_val + 1,
+                       size=(n, problema.num_profesionales, problema.num_dias)).astype(np.uint8)
+    random.seed(seed)
+    for i in range(n):
+        pop[i] = problema._reparar_cromosoma(pop[i])
+    return pop
+
+
+def test_agregados_completos_coinciden_con_fitness_batch(problema):
+    pop = _poblacion_reparada(problema, 6, seed=2)
+    agregados = AgregadosPoblacion(problema, 6)
+    agregados.calcular(pop, list(range(6)))
+
+    assert agregados.validos.all()
+    assert agregados.fitness() == pytest.approx(problema.fitness_batch(pop, reparar=False), rel=1e-9)
+
+
+@pytest.mark.parametrize("mutacion", ["hibrida_adaptativa", "reasignar_turno", "flip_simple"])
+def test_delta_tras_mutacion_y_reparacion_equivale_a_recalcular(problema, mutacion):
+    padres = _poblacion_reparada(problema, 4, seed=7)
+    agregados_padres = AgregadosPoblacion(problema, 4)
+    agregados_padres.calcular(padres, list(range(4)))
+
+    random.seed(11)
+    np.random.seed(11)
+    hijos = np.empty_like(padres)
+    for i in range(4):
+        mutado = MUTATION_OPS[mutacion](padres[i], problema).reshape(padres[i].shape)
+        hijos[i] = problema._reparar_cromosoma(mutado)
+
+    incremental = AgregadosPoblacion(problema, 4)
+    for i in range(4):
+        incremental.copiar(agregados_padres, i, i)
+        incremental.aplicar_delta(i, *celdas_modificadas(hijos[i], padres[i]))
+    completo = AgregadosPoblacion(problema, 4)
+    completo.calcular(hijos, list(range(4)))
+
+    assert np.array_equal(incremental.conteos, completo.conteos)
+    assert np.array_equal(incremental.deficit, completo.deficit)
+    assert incremental.horas == pytest.approx(completo.horas)
+    assert incremental.horas_dificiles == pytest.approx(completo.horas_dificiles)
+    assert incremental.pdl == pytest.approx(completo.pdl)
+    assert incremental.pte == pytest.approx(completo.pte)
+    assert incremental.fitness() == pytest.approx(problema.fitness_batch(hijos, reparar=False), rel=1e-9)
+
+
+def test_hijos_por_delta_cuentan_en_la_cache(problema):
+    from src.cache_fitness import CacheFitness
+    from src.motor_ga import _evaluar_poblacion
+
+    padres = _poblacion_reparada(problema, 4, seed=5)
+    cache = CacheFitness()
+    agregados_padres = AgregadosPoblacion(problema, 4)
+    f_padres = _evaluar_poblacion(padres, problema, cache, agregados_padres)
+    assert cache.estadisticas()["fallos"] == 4
+
+    # Clones de sus padres (delta vacío) y un hijo con una celda distinta
+    hijos = padres.copy()
+    hijos[3, 0, 0] = (int(hijos[3, 0, 0]) + 1) % (problema.max_turno_val + 1)
+    agregados = AgregadosPoblacion(problema, 4)
+    f_hijos = _evaluar_poblacion(hijos, problema, cache, agregados, padres=np.arange(4),
+                                 pop_padres=padres, agregados_padres=agregados_padres)
+
+    assert agregados.validos.all()
+    assert f_hijos[:3] == pytest.approx(f_padres[:3], rel=1e-9)
+    estadisticas = cache.estadisticas()
+    assert (estadisticas["aciertos"], estadisticas["fallos"]) == (3, 5)
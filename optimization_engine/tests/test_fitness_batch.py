@@ -0,0 +1,32 @@
+import random
+import numpy as np
+import pytest
+
+
+def _poblacion_aleatoria(problema, n, seed):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, problema.max_turno_val + 1,
+                        size=(n, problema.num_profesionales, problema.num_dias))
+
+
+def test_fitness_batch_coincide_con_fitness_individual(problema):
+    pop = _poblacion_aleatoria(problema, 12, seed=3)
+
+    random.seed(99)
+    esperado = [problema.fitness(ind.reshape(-1)) for ind in pop]
+    random.seed(99)
+    obtenido = problema.fitness_batch(pop)
+
+    assert obtenido.shape == (12,)
+    assert obtenido == pytest.approx(esperado, rel=1e-9)
+
+
+def test_fitness_batch_acepta_vectores_planos(problema):
+    pop = _poblacion_aleatoria(problema, 4, seed=5)
+
+    random.seed(1)
+    tensor = problema.fitness_batch(pop)
+    random.seed(1)
+    planos = problema.fitness_batch(pop.reshape(4, -1))
+
+    assert np.array_equal(tensor, planos)
@@ -0,0 +1,31 @@
+import numpy as np
+
+from src.utils import init_population_constructiva, poblacion_inicial
+
+
+def test_inicializacion_constructiva_respeta_restricciones_y_es_diversa(problema):
+    inst = problema.instancia
+    pop = init_population_constructiva(20, problema, seed=3)
+    assert pop.shape == (20, problema.num_profesionales, problema.num_dias)
+
+    for matriz in pop:
+        valores = matriz.astype(np.intp)
+        trabaja = valores != 0
+        assert not (trabaja & ~inst.disponible).any()
+        assert not inst.prohibida[valores[:, :-1], valores[:, 1:]].any()
+        assert (trabaja.sum(axis=1) <= inst.t_max).all()
+        # Nunca asigna más de lo requerido ni fuera del skill del turno
+        assert (inst.contar_cobertura(valores) <= inst.requerimientos).all()
+        assert inst.contar_cobertura(valores)[:, 1:].sum() == trabaja.sum()
+
+    assert len({m.tobytes() for m in pop}) == len(pop)
+    assert np.array_equal(pop, init_population_constructiva(20, problema, seed=3))
+
+
+def test_poblacion_inicial_elige_segun_config(problema):
+    aleatoria = poblacion_inicial({'pop_size': 5}, problema, seed=1)
+    constructiva = poblacion_inicial({'pop_size': 5, 'inicializacion': 'constructiva'}, problema, seed=1)
+    assert aleatoria.shape == constructiva.shape == (5, problema.num_profesionales, problema.num_dias)
+    deficit = problema.instancia.deficit_lote
+    assert (deficit(problema.instancia.contar_cobertura_lote(constructiva)).mean() <
+            deficit(problema.instancia.contar_cobertura_lote(aleatoria)).mean())
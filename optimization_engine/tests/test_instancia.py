@@ -0,0 +1,74 @@
+import numpy as np
+from src.instancia import compilar_instancia
+
+
+def test_compilar_instancia_tablas_densas(problema):
+    inst = problema.instancia
+
+    assert inst.requerimientos.shape == (problema.num_dias, 4, 2)
+    assert inst.skills == ["junior", "senior"]
+    # Día pico 0: turno 1 pide 2 junior y 1 senior
+    assert inst.requerimientos[0, 1].tolist() == [2, 1]
+    # Día normal 1: turno 3 solo pide senior
+    assert inst.requerimientos[1, 3].tolist() == [0, 1]
+    assert inst.requerimientos[:, 0].sum() == 0
+
+    assert inst.duracion.tolist() == [0.0, 8.0, 8.0, 12.0]
+    assert inst.es_noche.tolist() == [False, False, False, True]
+    assert inst.no_habil[[5, 6, 12, 13]].all() and inst.no_habil.sum() == 4
+    assert inst.skill_prof.tolist() == [1] * 5 + [0] * 5
+    assert inst.prohibida[3, 1] and inst.prohibida[2, 1] and not inst.prohibida[1, 3]
+    assert not inst.disponible[0, :3].any() and inst.disponible[0, 3]
+
+
+def test_compilar_instancia_tolera_claves_str_y_skills_desconocidos():
+    inst = compilar_instancia(
+        num_profesionales=2,
+        num_dias=2,
+        max_turno_val=2,
+        info_profesionales={0: {"skill": "Senior"}, 1: {"skill": "residente"}},
+        matriz_preferencias=np.zeros((2, 2)),
+        matriz_disponibilidad=np.ones((2, 2), dtype=bool),
+        requerimientos_cobertura=[{"1": {"SENIOR": 1}}, {2: {"senior": 2}}],
+        secuencias_prohibidas=[{"turno_previo": 2, "turno_siguiente": 1}],
+        turnos_a_cubrir=[1, 2],
+        skills_a_cubrir=["senior"],
+        duracion_turnos={"1": "8", 2: 12},
+        dias_no_habiles=set(),
+        turnos_noche={2},
+    )
+
+    assert inst.requerimientos[:, :, 0].tolist() == [[0, 1, 0], [0, 0, 2]]
+    assert inst.skill_prof.tolist() == [0, -1]
+    assert inst.prohibida[2, 1]
+    conteos = inst.contar_cobertura(np.array([[1, 2], [1, 2]]))
+    assert conteos[:, :, 0].tolist() == [[0, 1, 0], [0, 0, 1]]
+
+
+def test_dominio_combina_disponibilidad_skill_y_bloqueos_de_turno():
+    kwargs = dict(
+        num_profesionales=2,
+        num_dias=2,
+        max_turno_val=2,
+        info_profesionales={0: {"skill": "senior"}, 1: {"skill": "junior"}},
+        matriz_preferencias=np.zeros((2, 2)),
+        matriz_disponibilidad=np.array([[True, False], [True, True]]),
+        requerimientos_cobertura=[{1: {"senior": 1}, 2: {"junior": 1}}, {1: {"senior": 1, "junior": 1}}],
+        secuencias_prohibidas=[],
+        turnos_a_cubrir=[1, 2],
+        skills_a_cubrir=["junior", "senior"],
+        duracion_turnos={1: 8, 2: 8},
+        dias_no_habiles=set(),
+        turnos_noche=set(),
+    )
+    inst = compilar_instancia(**kwargs)
+
+    assert inst.dominio.shape == (2, 2, 3)
+    assert inst.dominio[:, :, 0].all()
+    # Senior: el turno 2 no pide su skill y el día 1 no está disponible
+    assert inst.dominio[0].tolist() == [[True, True, False], [True, False, False]]
+    assert inst.dominio[1].tolist() == [[True, False, True], [True, True, False]]
+
+    bloqueado = compilar_instancia(bloqueos_turno=[(1, 1, 1)], **kwargs)
+    assert not bloqueado.dominio[1, 1, 1]
+    assert bloqueado.disponible[1, 1]
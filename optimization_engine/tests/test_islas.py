@@ -0,0 +1,71 @@
+import copy
+from src.islas import ejecutar_modelo_islas, _estrategias_isla
+from src.operadores import CROSSOVER_OPS, MUTATION_OPS
+
+
+def test_estrategias_isla_rota_operadores_o_respeta_las_pedidas():
+    base = {"sel": "torneo_deterministico", "cross": "bloques_verticales", "mut": "hibrida_adaptativa"}
+
+    assert _estrategias_isla(base, 0) == base
+    otra = _estrategias_isla(base, 1)
+    assert otra["cross"] in CROSSOVER_OPS and otra["cross"] != base["cross"]
+    assert otra["mut"] in MUTATION_OPS and otra["mut"] != base["mut"]
+
+    pedidas = dict(base, islas=[{"mut": "flip_simple"}, {"cross": "dos_puntos"}])
+    assert _estrategias_isla(pedidas, 2) == dict(base, mut="flip_simple")
+
+
+def test_modelo_islas_es_reproducible_y_reporta_cada_isla(datos_instancia):
+    config = {"pop_size": 8, "generaciones": 5, "pc": 0.7, "pm": 0.3, "seed": 3,
+              "num_islas": 3, "intervalo_migracion": 2, "num_migrantes": 1}
+
+    a = ejecutar_modelo_islas(dict(config), copy.deepcopy(datos_instancia), {})
+    b = ejecutar_modelo_islas(dict(config), copy.deepcopy(datos_instancia), {})
+
+    assert a["fitness"] == b["fitness"]
+    assert a["matriz_solucion"] == b["matriz_solucion"]
+    assert len(a["islas"]) == 3
+    assert a["fitness"] == min(isla["mejor_fitness"] for isla in a["islas"])
+
+
+def test_isla_cortada_por_tiempo_continua_desde_su_ultima_generacion(datos_instancia, monkeypatch):
+    import os
+    import threading
+    from multiprocessing.connection import Connection
+    import numpy as np
+    from src import islas
+
+    pedidos = {}
+
+    def isla_falsa(conexion, config, datos_procesados, estrategias, semilla, soluciones_semilla=None):
+        k = semilla - config["seed"]
+        forma = (datos_procesados["num_profesionales"], datos_procesados["num_dias"])
+        while True:
+            mensaje = conexion.recv()
+            if mensaje[0] == 'fin':
+                conexion.send((1.0, {}))
+                break
+            _, desde, hasta, *_ = mensaje
+            pedidos.setdefault(k, []).append((desde, hasta))
+            # La isla 1 agota su tiempo tras una sola generación del primer tramo
+            ultima = desde if (k == 1 and desde == 1) else hasta
+            conexion.send(([], 1.0, np.zeros(forma, dtype=np.uint8), ultima, 1.0))
+
+    class ProcesoEnHilo(threading.Thread):
+        """Corre la isla en un hilo con su propio extremo del Pipe (el maestro cierra el suyo)."""
+
+        def __init__(self, target, args, daemon):
+            conexion = Connection(os.dup(args[0].fileno()))
+            super().__init__(target=target, args=(conexion, *args[1:]), daemon=daemon)
+
+        def terminate(self):
+            pass
+
+    monkeypatch.setattr(islas, "_proceso_isla", isla_falsa)
+    monkeypatch.setattr(islas.multiprocessing, "Process", ProcesoEnHilo)
+    config = {"generaciones": 6, "seed": 3, "num_islas": 2, "intervalo_migracion": 3}
+    resultado = islas.ejecutar_modelo_islas(config, copy.deepcopy(datos_instancia), {})
+
+    assert pedidos[0] == [(1, 3), (4, 6), (7, 6)]
+    assert pedidos[1] == [(1, 3), (2, 4), (5, 6)]
+    assert resultado["generaciones_completadas"] == 6
@@ -23,4 +23,115 @@ def test_procesar_datos_instancia_integridad():
     }
     procesados = procesar_datos_instancia(datos_crudos)
     assert "requerimientos_cobertura" in procesados
-    assert isinstance(procesados['requerimientos_cobertura'][0][1], dict)
\ No newline at end of file
+    assert isinstance(procesados['requerimientos_cobertura'][0][1], dict)
+
+def test_procesar_datos_instancia_remapea_ids_de_turno():
+    from src.loader import restaurar_ids_turnos
+    datos_crudos = {
+        "num_dias": 3,
+        "max_turno_val": 43,
+        "turnos_a_cubrir": [41, 42, 43],
+        "turnos_noche": [43],
+        "skills_a_cubrir": ["junior", "senior"],
+        "duracion_turnos": {"41": 8, "42": 8, "43": 12},
+        "secuencias_prohibidas": [[43, 41], [43, 42]],
+        "lista_profesionales": [
+            {"id_db": 1, "nombre": "A", "skill": "senior", "t_min": 0, "t_max": 3},
+            {"id_db": 2, "nombre": "B", "skill": "junior", "t_min": 0, "t_max": 3},
+        ],
+        "requerimientos_cobertura_explicita": [
+            {"41": {"junior": 1, "senior": 0}, "43": {"junior": 0, "senior": 1}}
+        ] * 3,
+        "excepciones_preferencias": [{"prof_indices": [0], "dia": 1, "valor": 42}],
+    }
+    procesados = procesar_datos_instancia(datos_crudos)
+
+    assert procesados["turnos_a_cubrir"] == [1, 2, 3]
+    assert procesados["max_turno_val"] == 3
+    assert procesados["ids_turnos"] == [0, 41, 42, 43]
+    assert procesados["turnos_noche"] == {3}
+    assert procesados["duracion_turnos"] == {1: 8.0, 2: 8.0, 3: 12.0}
+    assert procesados["secuencias_prohibidas"] == {(3, 1), (3, 2)}
+    assert set(procesados["requerimientos_cobertura"][0]) == {1, 3}
+    assert procesados["matriz_preferencias"][0, 1] == 2
+    assert restaurar_ids_turnos([[0, 1], [3, 2]], procesados["ids_turnos"]).tolist() == [[0, 41], [43, 42]]
+
+def test_codificar_solucion_semilla_alinea_profesionales_dias_y_turnos():
+    from src.loader import codificar_solucion_semilla
+    procesados = {
+        "num_profesionales": 3, "num_dias": 10, "ids_turnos": [0, 41, 42, 43],
+        "info_profesionales": {0: {"id_db": 7}, 1: {"id_db": 5}, 2: {"id_db": 9}},
+    }
+    # Semilla de 9 días con dos filas (id_db 5 y 7) y un turno que ya no existe (44)
+    semilla = {
+        "matriz": [[41, 0, 0, 0, 0, 0, 0, 0, 42],
+                   [43, 44, 0, 0, 0, 0, 0, 0, 41]],
+        "ids_profesionales": [5, 7],
+        "desfase_dias": 1,
+    }
+    matriz = codificar_solucion_semilla(semilla, procesados)
+
+    assert matriz.shape == (3, 10)
+    assert (matriz[2] == 0).all()                       # id_db 9 no estaba en la semilla
+    assert matriz[0, 0] == 0                            # turno 44 desconocido -> libre
+    assert matriz[1].tolist() == [0, 0, 0, 0, 0, 0, 0, 2, 0, 0]
+    # Pasado el final de la semilla se retrocede una semana: día 8 -> día 2 de la semilla
+    assert matriz[0, 7] == 1 and matriz[0, 8] == 0
+
+def test_excepcion_de_un_turno_bloquea_solo_ese_turno():
+    datos_crudos = {
+        "num_dias": 3,
+        "max_turno_val": 43,
+        "turnos_a_cubrir": [41, 42, 43],
+        "skills_a_cubrir": ["junior", "senior"],
+        "duracion_turnos": {"41": 8, "42": 8, "43": 12},
+        "lista_profesionales": [
+            {"id_db": 1, "nombre": "A", "skill": "senior", "t_min": 0, "t_max": 3},
+            {"id_db": 2, "nombre": "B", "skill": "junior", "t_min": 0, "t_max": 3},
+        ],
+        "requerimientos_cobertura_explicita": [{"42": {"junior": 1, "senior": 1}}] * 3,
+        "excepciones_disponibilidad": [
+            {"prof_index": 0, "dias_range": [1, 3], "disponible": False, "turno": 42},
+            {"prof_index": 1, "dias_range": [0, 1], "disponible": False},
+        ],
+    }
+    procesados = procesar_datos_instancia(datos_crudos)
+
+    # El día sigue disponible; el bloqueo usa el índice denso del turno 42
+    assert procesados["matriz_disponibilidad"][0].all()
+    assert not procesados["matriz_disponibilidad"][1, 0]
+    assert sorted(procesados["bloqueos_turno"]) == [(0, 1, 2), (0, 2, 2)]
+
+def test_pedido_de_turno_inexistente_se_reporta_con_su_id_original():
+    import numpy as np
+    from src.motor_ga import _restaurar_ids_en_reporte
+    from src.problema import ProblemaGAPropio
+    datos_crudos = {
+        "num_dias": 2,
+        "max_turno_val": 43,
+        "turnos_a_cubrir": [41, 42, 43],
+        "skills_a_cubrir": ["junior", "senior"],
+        "duracion_turnos": {"41": 8, "42": 8, "43": 12},
+        "lista_profesionales": [
+            {"id_db": 1, "nombre": "A", "skill": "senior", "t_min": 0, "t_max": 2},
+            {"id_db": 2, "nombre": "B", "skill": "junior", "t_min": 0, "t_max": 2},
+        ],
+        "requerimientos_cobertura_explicita": [{"41": {"junior": 1, "senior": 1}}] * 2,
+        "pesos_fitness": {"eq": 1, "dif": 1, "pdl": 1, "pte": 1, "alpha_pte": 0.5},
+        "tolerancia_equidad_general": 8,
+        "tolerancia_equidad_dificil": 4,
+        # El turno 2 no existe: dentro del rango denso, pero no es un ID de la tabla
+        "excepciones_preferencias": [{"prof_indices": [1], "dia": 0, "valor": 2},
+                                     {"prof_indices": [0], "dia": 1, "valor": 43}],
+    }
+    procesados = procesar_datos_instancia(datos_crudos)
+    assert procesados["matriz_preferencias"][1, 0] == 4
+    assert procesados["pedidos_turno_desconocido"] == [(1, 0, 2)]
+
+    problema = ProblemaGAPropio(**procesados)
+    reporte = problema.evaluar_detallado(np.array([[1, 1], [1, 1]]), reparar=False)
+    _restaurar_ids_en_reporte(reporte, procesados["ids_turnos"], procesados["pedidos_turno_desconocido"])
+
+    pedidos = {(i["profesional_id"], i["dia"]): (i["pedido"], i["asignado"])
+               for i in reporte["violaciones_blandas"]["preferencia_turno_incumplida"]}
+    assert pedidos == {(1, 0): (2, 41), (0, 1): (43, 41)}
@@ -0,0 +1,76 @@
+import numpy as np
+
+from src.operadores import torneo_seleccion_lote, seleccion_ranking_lote, SELECTION_OPS, OPERADORES_LOTE
+
+
+def test_torneo_lote_elige_el_mejor_de_participantes_distintos():
+    fitnesses = np.array([5.0, 1.0, 3.0, 4.0, 2.0])
+    np.random.seed(0)
+    elegidos = torneo_seleccion_lote(None, fitnesses, 1000, k=5)
+    assert (elegidos == 1).all()              # con k = pop gana siempre el mejor
+
+    elegidos = torneo_seleccion_lote(None, fitnesses, 2000, k=3)
+    assert elegidos.shape == (2000,)
+    assert 0 not in elegidos and 3 not in elegidos   # los dos peores nunca ganan un torneo de 3
+
+
+def test_ranking_lote_respeta_probabilidades_lineales():
+    fitnesses = np.array([3.0, 1.0, 2.0])
+    np.random.seed(1)
+    elegidos = seleccion_ranking_lote(None, fitnesses, 60_000)
+    frecuencias = np.bincount(elegidos, minlength=3) / len(elegidos)
+    # rangos: mejor (idx 1) peso 3, idx 2 peso 2, peor (idx 0) peso 1
+    assert np.allclose(frecuencias, [1 / 6, 3 / 6, 2 / 6], atol=0.01)
+
+
+def test_operadores_de_lote_registrados_junto_a_los_originales():
+    assert SELECTION_OPS["torneo_vectorizado"] in OPERADORES_LOTE
+    assert SELECTION_OPS["ranking_vectorizado"] in OPERADORES_LOTE
+    assert SELECTION_OPS["torneo_deterministico"] not in OPERADORES_LOTE
+
+
+def test_cruces_lote_escriben_en_sitio_mezclando_columnas_o_filas():
+    from src.operadores import crossover_vertical_lote, crossover_horizontal_lote
+
+    pop = np.stack([np.full((4, 6), v, dtype=np.uint8) for v in (1, 2, 3)])
+    padres1, padres2 = np.array([0, 0, 2]), np.array([1, 1, 1])
+    cruza = np.array([True, False, True])
+
+    np.random.seed(3)
+    out = np.zeros((3, 4, 6), dtype=np.uint8)
+    assert crossover_vertical_lote(pop, padres1, padres2, out, cruza) is out
+    assert (out[1] == 1).all()                                   # sin cruce: copia del padre 1
+    for hijo, p1 in zip(out[[0, 2]], (1, 3)):
+        assert (hijo == hijo[:1]).all()                          # cada día (columna) viene de un padre
+        assert set(np.unique(hijo)) <= {p1, 2}
+
+    out = np.zeros((3, 4, 6), dtype=np.uint8)
+    crossover_horizontal_lote(pop, padres1, padres2, out, cruza)
+    assert (out[1] == 1).all()
+    assert (out[0] == out[0][:, :1]).all()                       # cada profesional (fila) de un padre
+
+
+def test_cruce_cobertura_acerca_la_cobertura_a_los_requerimientos(problema):
+    from src.operadores import crossover_cobertura, crossover_horizontal
+    from src.repair import reparar_cromosoma
+
+    inst = problema.instancia
+    P, D = problema.num_profesionales, problema.num_dias
+    np.random.seed(5)
+    padres = [reparar_cromosoma(np.random.randint(0, 4, size=(P, D)).astype(np.uint8), problema)
+              for _ in range(2)]
+
+    def desvio(hijo):
+        diferencia = inst.contar_cobertura(hijo.reshape(P, D)) - inst.requerimientos
+        return int(np.abs(diferencia[:, 1:, :]).sum())
+
+    for semilla in range(10):
+        np.random.seed(semilla)
+        simple = crossover_horizontal(padres[0], padres[1], P, D)
+        np.random.seed(semilla)
+        hijo = crossover_cobertura(padres[0], padres[1], P, D, problema=problema)
+        assert desvio(hijo) <= desvio(simple)
+
+    # Sin `problema` es un cruce horizontal: cada fila viene de un padre
+    hijo = crossover_cobertura(padres[0], padres[1], P, D).reshape(P, D)
+    assert all((fila == padres[0][p]).all() or (fila == padres[1][p]).all() for p, fila in enumerate(hijo))
@@ -0,0 +1,44 @@
+import copy
+from src.parada import CriterioParada
+from src.motor_ga import ejecutar_algoritmo_genetico
+
+
+def test_criterio_parada_por_estancamiento_con_tolerancia():
+    parada = CriterioParada({"max_generaciones_sin_mejora": 3, "tolerancia_mejora": 0.01})
+
+    assert parada.evaluar(100.0) is None
+    assert parada.evaluar(99.5) is None      # mejora < 1%: no reinicia la ventana
+    assert parada.evaluar(90.0) is None      # mejora significativa
+    assert parada.evaluar(90.0) is None
+    assert parada.evaluar(89.99) is None
+    assert parada.evaluar(89.99) == "estancamiento"
+
+
+def test_criterio_parada_por_objetivo_y_deshabilitado():
+    assert CriterioParada({"fitness_objetivo": 5.0}).evaluar(4.0) == "fitness_objetivo"
+    parada = CriterioParada({})
+    assert all(parada.evaluar(1.0) is None for _ in range(50))
+
+
+def test_motor_informa_criterio_y_generaciones_reales(datos_instancia):
+    config = {"pop_size": 8, "generaciones": 50, "seed": 2, "fitness_objetivo": 1e12}
+    resultado = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia), {})
+    assert resultado["criterio_parada"] == "fitness_objetivo"
+    assert resultado["generaciones_completadas"] == 0
+
+    config = {"pop_size": 8, "generaciones": 3, "seed": 2}
+    resultado = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia), {})
+    assert resultado["criterio_parada"] == "generaciones"
+    assert resultado["generaciones_completadas"] == 3
+
+
+def test_motor_respeta_presupuesto_de_tiempo(datos_instancia):
+    config = {"pop_size": 10, "generaciones": 100_000, "seed": 4, "tiempo_maximo_seg": 0.5}
+    progreso = {}
+    resultado = ejecutar_algoritmo_genetico(config, copy.deepcopy(datos_instancia), {},
+                                            job_id="t", reporte_progreso=progreso)
+
+    assert resultado["criterio_parada"] == "tiempo_maximo"
+    assert 0 < resultado["generaciones_completadas"] < 100_000
+    assert resultado["tiempo_ejecucion"] < 2.0
+    assert progreso["t"]["porcentaje"] <= 100
@@ -0,0 +1,20 @@
+import copy
+import pytest
+from src.motor_ga import ejecutar_algoritmo_genetico
+
+
+@pytest.mark.parametrize("sel, cross", [
+    ("torneo_deterministico", "bloques_horizontales"),
+    ("torneo_vectorizado", "bloques_verticales_vectorizado"),
+    ("torneo_deterministico", "adaptativo"),
+])
+def test_modo_paralelo_reproduce_el_modo_serial(datos_instancia, sel, cross):
+    config = {"pop_size": 12, "generaciones": 4, "pc": 0.6, "pm": 0.4, "elitismo": True, "seed": 5}
+    estrategias = {"sel": sel, "cross": cross, "mut": "hibrida_adaptativa"}
+
+    # El loader modifica los datos crudos en sitio: cada corrida recibe su copia.
+    serial = ejecutar_algoritmo_genetico(dict(config), copy.deepcopy(datos_instancia), estrategias)
+    paralelo = ejecutar_algoritmo_genetico(dict(config, num_workers=2), copy.deepcopy(datos_instancia), estrategias)
+
+    assert paralelo["fitness"] == serial["fitness"]
+    assert paralelo["matriz_solucion"] == serial["matriz_solucion"]
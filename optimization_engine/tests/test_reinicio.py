@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from src.motor_ga import crear_evolucion, resolver_operadores, _elegir_diversos
+from src.utils import init_population
+
+
+def test_elegir_diversos_prefiere_los_mas_alejados():
+    pop = np.zeros((4, 2, 3), dtype=np.uint8)
+    pop[1, 0, 0] = 1      # a 1 celda de la referencia
+    pop[2] = 2            # a 6 celdas
+    pop[3, :, :2] = 3     # a 4 celdas, y a 4 del anterior
+    assert _elegir_diversos(pop, pop[0], 2) == [2, 3]
+    # Sin individuos distintos de la referencia no se elige ninguno
+    assert _elegir_diversos(np.repeat(pop[:1], 3, axis=0), pop[0], 2) == []
+
+
+@pytest.mark.parametrize("modo", ["mutacion", "inicializacion"])
+def test_reinicio_tras_estancamiento_conserva_al_mejor(problema, modo):
+    # Sin cruce ni mutación la población casi no mejora: se estanca enseguida
+    config = {"pc": 0.0, "pm": 0.0, "generaciones_reinicio": 2, "diversos_reinicio": 2, "modo_reinicio": modo}
+    evolucion = crear_evolucion(problema, resolver_operadores({}), config, 6)
+    evolucion.iniciar(init_population(8, problema.num_profesionales, problema.num_dias,
+                                      problema.max_turno_val, seed=6))
+    mejor_f = evolucion.best_global_f
+    for gen in range(1, 16):
+        evolucion.avanzar(gen)
+        if evolucion.reinicios and evolucion.reinicios[-1] == gen:
+            # El mejor histórico sobrevive en la posición 0
+            assert evolucion.fitnesses[0] == pytest.approx(evolucion.best_global_f)
+        assert evolucion.best_global_f <= mejor_f
+        mejor_f = evolucion.best_global_f
+
+    assert evolucion.reinicios
+    assert np.all(np.diff([0] + evolucion.reinicios) >= 2)
+    assert evolucion.reporte()["reinicios"] == {"cantidad": len(evolucion.reinicios),
+                                                "generaciones": evolucion.reinicios}
+    assert evolucion.fitnesses == pytest.approx(problema.fitness_batch(evolucion.pop, reparar=False), rel=1e-9)
+    assert "reinicios" not in crear_evolucion(problema, resolver_operadores({}), {}, 6).reporte()
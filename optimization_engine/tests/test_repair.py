@@ -0,0 +1,356 @@
+import random
+import numpy as np
+import pytest
+
+from src.loader import procesar_datos_instancia
+from src.problema import ProblemaGAPropio
+from src.repair import reparar_cromosoma
+
+
+def _reparar_referencia(matriz, problem):
+    """Implementación con bucles anidados previa a la vectorización (oráculo)."""
+    inst = problem.instancia
+    matriz_reparada = matriz.copy()
+
+    # =========================================================
+    #       ETAPA 1: LIMPIEZA (Restricciones Duras Absolutas)
+    # =========================================================
+    # Elimina asignaciones que violan disponibilidad, skill o secuencias.
+
+    for p in range(problem.num_profesionales):
+        skill = inst.skill_prof[p]
+        for d in range(problem.num_dias):
+            turno = int(matriz_reparada[p, d])
+            if turno == 0:
+                continue
+            # 1.1 Disponibilidad: si no está disponible, se borra.
+            if not inst.disponible[p, d]:
+                matriz_reparada[p, d] = 0 
+                continue
+            # 1.2 Competencias: si el turno no requiere su skill (requerido=0), se borra.
+            if skill < 0 or not (0 < turno <= inst.valor_max):
+                requerido = 0
+            else:
+                requerido = inst.requerimientos[d, turno, skill]
+            if requerido == 0:
+                matriz_reparada[p, d] = 0 
+
+    # 1.3 Secuencias prohibidas: borramos todos los patrones prohibidos (ej. Noche -> Mañana)
+    for p in range(problem.num_profesionales):
+        for d in range(problem.num_dias - 1):
+            if inst.prohibida[matriz_reparada[p, d], matriz_reparada[p, d+1]]:
+                matriz_reparada[p, d+1] = 0
+
+    # ==========================================
+    #   ETAPA 2: PODADO DE SOBREASIGNACIÓN 
+    # ==========================================
+    # Si hay exceso de personal en un turno, se elimina aleatoriamente.
+    for d in range(problem.num_dias):
+        for turno in inst.turnos:
+            for skill in range(inst.num_skills):
+                requerido = inst.requerimientos[d, turno, skill]
+                asignados = []
+                for p in range(problem.num_profesionales):
+                    if int(matriz_reparada[p, d]) == turno and inst.skill_prof[p] == skill:
+                        asignados.append(p)
+                sobrantes = len(asignados) - requerido
+                if sobrantes > 0:
+                    random.shuffle(asignados)
+                    for _ in range(sobrantes):
+                        p_elim = asignados.pop()
+                        matriz_reparada[p_elim, d] = 0
+
+    # =======================================================
+    #    --- ACTUALIZACIÓN DE ESTADO (Cálculo Auxiliar) ---
+    # =======================================================
+    # Recalculamos horas y cobertura real antes de las etapas constructivas.
+    
+    assigned_counts = np.zeros_like(inst.requerimientos)
+    prof_counts = [0] * problem.num_profesionales
+    dificiles_counts = [0] * problem.num_profesionales
+
+    for d in range(problem.num_dias):
+        for turno in inst.turnos:
+            for k in range(inst.num_skills):
+                assigned = 0
+                for p in range(problem.num_profesionales):
+                    if int(matriz_reparada[p, d]) == turno and inst.skill_prof[p] == k:
+                        assigned += 1
+                assigned_counts[d, turno, k] = assigned
+
+    # Iniciar conteos por profesional
+    for p in range(problem.num_profesionales):
+        for d in range(problem.num_dias):
+            turno = int(matriz_reparada[p, d])
+            if turno > 0:
+                prof_counts[p] += 1
+                if inst.no_habil[d] or inst.es_noche[turno]:
+                    dificiles_counts[p] += 1
+
+    # =========================================================
+    #       ETAPA 4: COBERTURA INTELIGENTE DE DÉFICIT 
+    # =========================================================
+    # Rellenamos huecos con el mejor candidato (Heurística: Preferencias + Equidad).
+    for p in range(problem.num_profesionales):
+        t_max = inst.t_max[p]
+        skill = inst.skill_prof[p]
+        if prof_counts[p] <= t_max:
+            continue
+        trabajados = [d for d in range(problem.num_dias) if int(matriz_reparada[p, d]) != 0]
+        random.shuffle(trabajados)
+        eliminar = prof_counts[p] - t_max
+        for d_elim in trabajados:
+            if eliminar <= 0:
+                break
+            turno_elim = int(matriz_reparada[p, d_elim])
+            if inst.no_habil[d_elim] or inst.es_noche[turno_elim]:
+                dificiles_counts[p] -= 1
+            matriz_reparada[p, d_elim] = 0
+            if skill >= 0:
+                assigned_counts[d_elim, turno_elim, skill] = max(0, assigned_counts[d_elim, turno_elim, skill] - 1)
+            prof_counts[p] -= 1
+            eliminar -= 1
+
+   # =================================================
+    #    ETAPA 5: RELLENO POR LÍMITE MÍNIMO (T_MIN)
+    # =================================================
+    # Garantiza horas mínimas contractuales.
+    for d in range(problem.num_dias):
+        for turno in inst.turnos:
+            # definición de turno difícil
+            turno_es_dificil = inst.no_habil[d] or inst.es_noche[turno]
+            for skill in range(inst.num_skills):
+                # cálculo de déficit
+                requerido = inst.requerimientos[d, turno, skill]
+                asignado = assigned_counts[d, turno, skill]
+                deficit = requerido - asignado
+                while deficit > 0:
+                    candidatos = []
+                    # Selección de Candidatos Válidos
+                    for p in range(problem.num_profesionales):
+                        if inst.skill_prof[p] != skill:
+                            continue
+                        if int(matriz_reparada[p, d]) != 0:
+                            continue
+                        if not inst.disponible[p, d]:
+                            continue
+                        if prof_counts[p] >= inst.t_max[p]:
+                            continue
+                        # Chequeo de secuencias
+                        prev_turno = int(matriz_reparada[p, d-1]) if d-1 >= 0 else 0
+                        next_turno = int(matriz_reparada[p, d+1]) if d+1 < problem.num_dias else 0
+                        if inst.prohibida[prev_turno, turno]:
+                            continue
+                        if inst.prohibida[turno, next_turno]:
+                            continue
+                        candidatos.append(p)
+                    if not candidatos:
+                        break
+                    
+                    # Puntaje: se ordena a los candidatos por Preferencias y Equidad
+                    def puntaje_candidato(p_idx):
+                        viola_pdl = 1 if inst.preferencias[p_idx, d] == -1 else 0
+                        pref = inst.preferencias[p_idx, d]
+                        viola_pte = 1 if (pref > 0 and pref != turno) else 0
+                        if turno_es_dificil:
+                            # Prioriza quien tiene menos turnos difíciles
+                            return (viola_pdl, viola_pte, dificiles_counts[p_idx], prof_counts[p_idx], random.random())
+                        else:
+                            # Prioriza quien tiene menos carga total
+                            return (viola_pdl, viola_pte, prof_counts[p_idx], dificiles_counts[p_idx], random.random())
+                    
+                    candidatos.sort(key=puntaje_candidato)
+                    elegido_p = candidatos[0]
+                    
+                    # Asignación y actualización
+                    matriz_reparada[elegido_p, d] = turno
+                    prof_counts[elegido_p] += 1
+                    if turno_es_dificil:
+                        dificiles_counts[elegido_p] += 1
+                    assigned_counts[d, turno, skill] += 1
+                    deficit -= 1
+
+    # =================================================
+    #    ETAPA 6: RELLENO POR LÍMITE MÍNIMO (T_MIN)
+    # =================================================
+    # Si alguien quedó por debajo de su contrato mínimo, se le buscan huecos donde sea.
+    for p in range(problem.num_profesionales):
+        if prof_counts[p] >= inst.t_min[p]:
+            continue
+        dias_libres = [d for d in range(problem.num_dias) if matriz_reparada[p, d] == 0 and inst.disponible[p, d]]
+        random.shuffle(dias_libres)
+        for d_cand in dias_libres:
+            if prof_counts[p] >= inst.t_min[p]:
+                break
+            posibles = [int(t) for t in inst.turnos]
+            random.shuffle(posibles)
+            for turno in posibles:
+                # Chequeo rápido de secuencias
+                prev_turno = int(matriz_reparada[p, d_cand-1]) if d_cand-1 >= 0 else 0
+                next_turno = int(matriz_reparada[p, d_cand+1]) if d_cand+1 < problem.num_dias else 0
+                if inst.prohibida[prev_turno, turno]:
+                    continue
+                if inst.prohibida[turno, next_turno]:
+                    continue
+                matriz_reparada[p, d_cand] = turno
+                prof_counts[p] += 1
+                break
+
+    return matriz_reparada
+
+def _matrices_aleatorias(problema, n, seed):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, problema.max_turno_val + 1,
+                        size=(n, problema.num_profesionales, problema.num_dias))
+
+
+@pytest.fixture
+def problema_con_demanda_completa(datos_instancia):
+    """Instancia donde cada turno pide todos los skills todos los días.
+
+    Sin turnos vedados por skill ni ausencias de un turno puntual, el dominio
+    coincide con la disponibilidad y el oráculo (anterior al dominio) aplica.
+    """
+    reglas = datos_instancia["reglas_cobertura"]
+    reglas["demanda_normal"] = {t: {"junior": 1, "senior": 1} for t in ("1", "2", "3")}
+    problema = ProblemaGAPropio(**procesar_datos_instancia(datos_instancia))
+    inst = problema.instancia
+    assert np.array_equal(inst.dominio[:, :, 1:], np.repeat(inst.disponible[:, :, None], 3, axis=2))
+    return problema
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_reparacion_vectorizada_equivale_a_referencia(problema_con_demanda_completa, seed, monkeypatch):
+    problema = problema_con_demanda_completa
+    # El oráculo sortea el desempate por candidato en cada unidad de déficit y
+    # la cola de prioridad una vez por grupo. Con un desempate fijo ambos eligen
+    # el de menor índice y no consumen el generador, que solo usan los shuffle.
+    monkeypatch.setattr(random, "random", lambda: 0.5)
+    for matriz in _matrices_aleatorias(problema, 10, seed):
+        random.seed(seed)
+        esperado = _reparar_referencia(matriz, problema)
+        estado_esperado = random.getstate()
+
+        random.seed(seed)
+        obtenido = reparar_cromosoma(matriz, problema)
+
+        assert np.array_equal(obtenido, esperado)
+        # Mismo consumo del generador: las siguientes reparaciones tampoco divergen
+        assert random.getstate() == estado_esperado
+
+
+def test_reparacion_vectorizada_conserva_dtype_y_no_modifica_entrada(problema):
+    matriz = _matrices_aleatorias(problema, 1, seed=7)[0].astype(np.uint8)
+    original = matriz.copy()
+
+    reparada = reparar_cromosoma(matriz, problema)
+
+    assert reparada.dtype == np.uint8
+    assert np.array_equal(matriz, original)
+
+
+def test_reparacion_es_idempotente_sobre_matrices_factibles(problema):
+    from src.repair import es_factible
+
+    # Instancia sin mínimos contractuales para que la reparación alcance la factibilidad
+    problema.instancia.t_min[:] = 0
+    random.seed(11)
+    reparada = reparar_cromosoma(_matrices_aleatorias(problema, 1, seed=11)[0], problema)
+    assert es_factible(reparada, problema)
+
+    estado = random.getstate()
+    assert np.array_equal(reparar_cromosoma(reparada, problema), reparada)
+    assert random.getstate() == estado
+
+
+def test_reparacion_minima_conserva_excesos_y_corrige_el_resto(problema):
+    inst = problema.instancia
+    random.seed(6)
+    reparada = reparar_cromosoma(_matrices_aleatorias(problema, 1, seed=6)[0], problema)
+    # Sobre una solución ya reparada (con los excesos que deja T_min) no cambia nada
+    assert np.array_equal(reparar_cromosoma(reparada, problema, podar_excesos=False), reparada)
+
+    # Si la instancia cambia (un profesional deja de estar disponible) solo se corrige eso
+    p = int(np.flatnonzero((reparada != 0).any(axis=1))[0])
+    dias = np.flatnonzero(reparada[p])[:2]
+    inst.disponible[p, dias] = False
+    inst.dominio[p, dias, 1:] = False
+    corregida = reparar_cromosoma(reparada, problema, podar_excesos=False)
+    assert (corregida[p, dias] == 0).all()
+    conservadas = np.ones_like(reparada, dtype=bool)
+    conservadas[:, dias] = False
+    assert (corregida[conservadas] == reparada[conservadas]).mean() > 0.95
+
+
+def test_fitness_sin_reparar_evalua_la_matriz_tal_cual(problema):
+    random.seed(4)
+    reparada = reparar_cromosoma(_matrices_aleatorias(problema, 1, seed=4)[0], problema)
+
+    assert problema.fitness(reparada, reparar=False) == pytest.approx(
+        problema.fitness_batch(reparada[None], reparar=False)[0])
+    reporte = problema.evaluar_detallado(reparada, reparar=False)
+    assert reporte["metricas"]["fitness_total"] == problema.fitness(reparada, reparar=False)
+
+
+def test_relleno_por_t_min_solo_asigna_turnos_del_dominio(problema):
+    inst = problema.instancia
+    # Sin demanda, todo lo que quede asignado lo puso el relleno por T_min
+    inst.requerimientos[:] = 0
+    inst.t_min[:] = 8
+    # Ausencia de un turno puntual: el profesional 0 no puede hacer el turno 1
+    inst.dominio[0, :, 1] = False
+    P, D = problema.num_profesionales, problema.num_dias
+
+    for seed in range(5):
+        random.seed(seed)
+        reparada = reparar_cromosoma(np.zeros((P, D), dtype=np.uint8), problema).astype(np.intp)
+
+        assert (reparada != 0).sum(axis=1).min() > 0
+        assert inst.dominio[np.arange(P)[:, None], np.arange(D)[None, :], reparada].all()
+        assert not (reparada[0] == 1).any()
+        assert not inst.prohibida[reparada[:, :-1], reparada[:, 1:]].any()
+
+
+def test_cobertura_de_deficit_alcanza_la_demanda_con_candidatos_legales(problema):
+    from src.repair import es_factible
+
+    inst = problema.instancia
+    inst.t_min[:] = 0
+    P, D = problema.num_profesionales, problema.num_dias
+    for seed in range(5):
+        random.seed(seed)
+        reparada = reparar_cromosoma(np.zeros((P, D), dtype=np.uint8), problema)
+
+        assert np.array_equal(inst.contar_cobertura(reparada), inst.requerimientos)
+        assert es_factible(reparada, problema)
+
+
+def test_cobertura_de_deficit_prioriza_preferencias_y_equidad(problema):
+    inst = problema.instancia
+    inst.t_min[:] = 0
+    inst.requerimientos[:] = 0
+    P, D = problema.num_profesionales, problema.num_dias
+    junior = inst.skills.index("junior")
+    # Juniors 5..9: el 5 pidió libre el día 1, el 6 pidió otro turno, 7 y 8 ya trabajan
+    inst.preferencias[5, 1] = -1
+    inst.preferencias[6, 1] = 2
+    matriz = np.zeros((P, D), dtype=np.uint8)
+    matriz[[7, 8], 3] = 1
+    matriz[8, 4] = 1
+    inst.requerimientos[3, 1, junior] = 2
+    inst.requerimientos[4, 1, junior] = 1
+
+    esperados = {1: {9}, 2: {9, 7}, 3: {9, 7, 8}, 4: {9, 7, 8, 6}}
+    for deficit, elegidos in esperados.items():
+        inst.requerimientos[1, 1, junior] = deficit
+        reparada = reparar_cromosoma(matriz, problema)
+        assert set(np.flatnonzero(reparada[:, 1] == 1).tolist()) == elegidos
+
+    # A igualdad de prioridad, el desempate es aleatorio
+    inst.requerimientos[1, 1, junior] = 0
+    inst.requerimientos[2, 1, inst.skills.index("senior")] = 1
+    elegidos = set()
+    for seed in range(20):
+        random.seed(seed)
+        elegidos.update(np.flatnonzero(reparar_cromosoma(matriz, problema)[:, 2] == 1).tolist())
+    assert len(elegidos) > 1 and 0 not in elegidos  # el 0 no está disponible ese día
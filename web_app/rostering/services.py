@@ -480,7 +480,11 @@ def generar_payload_ag(fecha_inicio, fecha_fin, especialidad, plantilla_id=None)
         end = min(num_dias, (nd.fecha_fin - fecha_inicio).days + 1)
         prof_idx = mapa_id_a_indice.get(nd.empleado.id)
         if start < end and prof_idx is not None:
-            excepciones_disponibilidad.append({"prof_index": prof_idx, "dias_range": [start, end], "disponible": False})
+            excepcion = {"prof_index": prof_idx, "dias_range": [start, end], "disponible": False}
+            if nd.tipo_turno_id:
+                # Ausencia de un solo turno: el resto del día sigue disponible
+                excepcion["turno"] = nd.tipo_turno_id
+            excepciones_disponibilidad.append(excepcion)
 
     # =========================================================================
     # 7. PROCESAMIENTO DE PREFERENCIAS (Con Límite MVP #34)
@@ -536,6 +540,9 @@ def generar_payload_ag(fecha_inicio, fecha_fin, especialidad, plantilla_id=None)
     for s in SecuenciaProhibida.objects.filter(especialidad=especialidad):
         secuencias.append([s.turno_previo.id, s.turno_siguiente.id])
 
+    # 8. Arranque en caliente: la solución del cronograma más reciente de la especialidad
+    semilla = obtener_solucion_semilla(especialidad, fecha_inicio, [p["id_db"] for p in lista_profesionales])
+
     return {
         "config": payload_config,
         "datos_problema": {
@@ -568,7 +575,50 @@ def generar_payload_ag(fecha_inicio, fecha_fin, especialidad, plantilla_id=None)
             "sel": config.estrategia_seleccion,
             "cross": config.estrategia_cruce,
             "mut": config.estrategia_mutacion
-        }
+        },
+        "soluciones_semilla": [semilla] if semilla else []
+    }
+
+def obtener_solucion_semilla(especialidad, fecha_inicio, ids_empleados):
+    """
+    Arma la solución semilla del Cronograma más reciente de la especialidad.
+
+    Filas = empleados del nuevo payload (en el mismo orden), columnas = días del
+    cronograma previo con el ID de TipoTurno asignado (0 = libre). Si el
+    cronograma previo contiene a fecha_inicio (re-planificación) se alinea por
+    fecha; si no, por día de la semana. Retorna None si no hay cronograma previo.
+    """
+    previo = (
+        Cronograma.objects.filter(especialidad=especialidad, asignaciones__isnull=False)
+        .exclude(estado=Cronograma.Estado.FALLIDO)
+        .distinct()
+        .order_by('-fecha_creacion', '-id')
+        .first()
+    )
+    if previo is None:
+        return None
+
+    num_dias_previo = (previo.fecha_fin - previo.fecha_inicio).days + 1
+    fila_de = {emp_id: i for i, emp_id in enumerate(ids_empleados)}
+    matriz = [[0] * num_dias_previo for _ in ids_empleados]
+
+    asignaciones = Asignacion.objects.filter(
+        cronograma=previo, empleado_id__in=ids_empleados
+    ).values_list('empleado_id', 'fecha', 'tipo_turno_id')
+    for emp_id, fecha, turno_id in asignaciones:
+        dia = (fecha - previo.fecha_inicio).days
+        if 0 <= dia < num_dias_previo:
+            matriz[fila_de[emp_id]][dia] = turno_id
+
+    if previo.fecha_inicio <= fecha_inicio <= previo.fecha_fin:
+        desfase = (fecha_inicio - previo.fecha_inicio).days
+    else:
+        desfase = (fecha_inicio.weekday() - previo.fecha_inicio.weekday()) % 7
+
+    return {
+        "matriz": matriz,
+        "ids_profesionales": list(ids_empleados),
+        "desfase_dias": desfase
     }
 
 import json
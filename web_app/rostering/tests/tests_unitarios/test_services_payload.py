@@ -2,7 +2,7 @@ from django.test import TestCase
 from datetime import date, time, timedelta
 from rostering.models import (
     PlantillaDemanda, Empleado, ConfiguracionTurnos, TipoTurno, 
-    Preferencia, ConfiguracionAlgoritmo
+    Preferencia, ConfiguracionAlgoritmo, Cronograma, Asignacion
 )
 from rostering.services import generar_payload_ag
 
@@ -147,4 +147,29 @@ class TestServicesPayload(TestCase):
         
         # 7. Verificar Domingo (Igual)
         domingo = reqs[2]
-        self.assertEqual(domingo[str(self.turno.id)]['senior'], 0)
\ No newline at end of file
+        self.assertEqual(domingo[str(self.turno.id)]['senior'], 0)
+
+    def test_payload_sin_cronograma_previo_no_envia_semillas(self):
+        payload = generar_payload_ag(date(2026, 2, 1), date(2026, 2, 5), Empleado.TipoEspecialidad.MEDICO, self.plantilla.id)
+        self.assertEqual(payload['soluciones_semilla'], [])
+
+    def test_payload_adjunta_cronograma_previo_como_semilla(self):
+        """El último cronograma de la especialidad viaja como solución semilla alineada por día de la semana."""
+        # Enero 2026 empieza jueves (3); febrero 2026 empieza domingo (6)
+        previo = Cronograma.objects.create(
+            especialidad=Empleado.TipoEspecialidad.MEDICO,
+            fecha_inicio=date(2026, 1, 1), fecha_fin=date(2026, 1, 31),
+            estado=Cronograma.Estado.PUBLICADO
+        )
+        Asignacion.objects.create(cronograma=previo, empleado=self.empleado, fecha=date(2026, 1, 4), tipo_turno=self.turno)
+
+        payload = generar_payload_ag(date(2026, 2, 1), date(2026, 2, 28), Empleado.TipoEspecialidad.MEDICO, self.plantilla.id)
+
+        semillas = payload['soluciones_semilla']
+        self.assertEqual(len(semillas), 1)
+        self.assertEqual(semillas[0]['ids_profesionales'], [self.empleado.id])
+        self.assertEqual(semillas[0]['desfase_dias'], 3)  # el día 0 (domingo) toma el domingo 4/1
+        fila = semillas[0]['matriz'][0]
+        self.assertEqual(len(fila), 31)
+        self.assertEqual(fila[3], self.turno.id)
+        self.assertEqual(sum(1 for t in fila if t), 1)